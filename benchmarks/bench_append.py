@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: 2025-present Luiz Eduardo Amaral <luizamaral306@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+Append benchmark.
+
+Compares appending items one at a time to a Series, which extends it in place, with rebuilding the
+Series on every append. Rows are appended one at a time to a DataFrame through `DataFrameBuilder` and
+through `DataFrame.append`, which copies the whole DataFrame every time. The rebuilding baselines are
+quadratic, so they are timed on a smaller sample.
+
+Usage:
+    python benchmarks/bench_append.py [size]
+"""
+
+import sys
+import timeit
+
+import lontras as lt
+
+
+def series_append(size: int):
+    s = lt.Series([])
+    for i in range(size):
+        s[f"k{i}"] = i
+
+
+def series_rebuild(size: int):
+    s = lt.Series([])
+    for i in range(size):
+        s = lt.Series(s.to_dict() | {f"k{i}": i})
+
+
+def frame_builder(size: int):
+    builder = lt.DataFrameBuilder(["a", "b", "c"])
+    for i in range(size):
+        builder.append([i, i * 2, i * 3])
+    builder.build()
+
+
+def frame_append(size: int):
+    df = lt.DataFrame({"a": [0], "b": [0], "c": [0]})
+    for i in range(1, size):
+        df = df.append(lt.DataFrame({"a": {i: i}, "b": {i: i * 2}, "c": {i: i * 3}}))
+
+
+def main(size: int = 10_000, repeat: int = 3, sample: int = 2_000):
+    for name, func, n in [
+        ("series append", series_append, size),
+        ("series rebuild", series_rebuild, sample),
+        ("frame builder", frame_builder, size),
+        ("frame append", frame_append, sample),
+    ]:
+        best = min(timeit.repeat(lambda func=func, n=n: func(n), number=1, repeat=repeat))
+        print(f"{name:>16}: {best * 1000:10.2f}ms ({n} items)")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: 2025-present Luiz Eduardo Amaral <luizamaral306@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+Parallel apply and map benchmark.
+
+Compares running a CPU heavy function with `Series.map` and `DataFrame.apply(axis=1)` in this
+process with splitting the values between a process pool with `workers`.
+
+Usage:
+    python benchmarks/bench_apply.py [size]
+"""
+
+import random
+import sys
+import timeit
+
+import lontras as lt
+
+
+def score(value: int) -> int:
+    # Stands for parsing or scoring: a few microseconds of pure Python per value
+    return sum(int(digit) for digit in str(value * 7919) * 8)
+
+
+def score_row(row: lt.Series) -> int:
+    return sum(score(value) for value in row.values)
+
+
+def main(size: int = 100_000, repeat: int = 3, workers: int = 4):
+    s = lt.Series(random.sample(range(size), size))
+    df = lt.DataFrame({f"c{i}": random.sample(range(size), size // 4) for i in range(4)})
+
+    cases = {
+        "map": lambda: s.map(score),
+        f"map {workers} workers": lambda: s.map(score, workers=workers),
+        "apply": lambda: df.apply(score_row, axis=1),
+        f"apply {workers} workers": lambda: df.apply(score_row, axis=1, workers=workers),
+    }
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"{name:>16}: {best * 1000:10.2f}ms")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
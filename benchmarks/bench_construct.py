@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: 2025-present Luiz Eduardo Amaral <luizamaral306@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+DataFrame construction benchmark.
+
+Compares building a DataFrame from plain columns, records and rows, which goes straight to the
+column storage, with building it from Series, which wraps every column (or row) in its own Series
+with its own Index first.
+
+Usage:
+    python benchmarks/bench_construct.py [size]
+"""
+
+import sys
+import timeit
+
+import lontras as lt
+
+
+def main(size: int = 1_000_000, repeat: int = 3, columns: int = 10):
+    rows = size // columns
+    data = {f"c{i}": list(range(rows)) for i in range(columns)}
+    records = [{f"c{i}": j for i in range(columns)} for j in range(rows)]
+    values = [[j] * columns for j in range(rows)]
+    arrays = {k: lt.Array(v) for k, v in data.items()}
+
+    cases = {
+        "columns": lambda: lt.DataFrame(data),
+        "from_columns": lambda: lt.DataFrame.from_columns(arrays),
+        "column series": lambda: lt.DataFrame({k: lt.Series(v) for k, v in data.items()}),
+        "records": lambda: lt.DataFrame(records),
+        "from_records": lambda: lt.DataFrame.from_records(records),
+        "rows": lambda: lt.DataFrame.from_rows(values),
+        "row series": lambda: lt.DataFrame([lt.Series(row) for row in values]),
+    }
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"{name:>16}: {best * 1000:10.2f}ms")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: 2025-present Luiz Eduardo Amaral <luizamaral306@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+DataFrame statistics benchmark.
+
+Compares the single pass reductions behind `DataFrame.mean`, `DataFrame.std`, `DataFrame.var` and
+`DataFrame.describe` with applying the `statistics` module to every column.
+
+Usage:
+    python benchmarks/bench_dataframe_stats.py [size]
+"""
+
+import random
+import statistics
+import sys
+import timeit
+
+import lontras as lt
+
+
+def quantiles(values):
+    return statistics.quantiles(values, method="inclusive")
+
+
+def main(size: int = 1_000_000, repeat: int = 3, columns: int = 20):
+    df = lt.DataFrame({f"c{i}": [v / 7 for v in random.sample(range(size), size // columns)] for i in range(columns)})
+
+    cases = {
+        "mean": (df.mean, lambda: df.agg(statistics.mean)),
+        "std": (df.std, lambda: df.agg(statistics.stdev)),
+        "var": (df.var, lambda: df.agg(statistics.variance)),
+        "describe": (
+            df.describe,
+            lambda: [df.agg(f) for f in (len, statistics.mean, statistics.stdev, min, max, quantiles)],
+        ),
+    }
+    for name, (engine, baseline) in cases.items():
+        for label, func in (("single pass", engine), ("statistics", baseline)):
+            best = min(timeit.repeat(func, number=1, repeat=repeat))
+            print(f"{label + ' ' + name:>22}: {best * 1000:10.2f}ms")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: 2025-present Luiz Eduardo Amaral <luizamaral306@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+DataFrame matrix multiplication benchmark.
+
+Compares `DataFrame.dot`, which builds the rows once and multiplies them with the stored columns,
+with taking the dot product of every row Array with every column Array. Also times splitting the
+rows between a process pool with `workers`. The matrices are `size` x `size`.
+
+Usage:
+    python benchmarks/bench_dot.py [size]
+"""
+
+import random
+import sys
+import timeit
+
+import lontras as lt
+
+
+def main(size: int = 300, repeat: int = 3, workers: int = 4):
+    a = lt.DataFrame({f"c{i}": [v / size for v in random.sample(range(size), size)] for i in range(size)})
+    b = lt.DataFrame(
+        {f"c{i}": [v / size for v in random.sample(range(size), size)] for i in range(size)}, index=a.columns
+    )
+
+    def row_by_row():
+        columns = b.T.values
+        return [[row.dot(col) for col in columns] for row in a.values]
+
+    cases = {
+        "row by row": row_by_row,
+        "dot": lambda: a.dot(b),
+        f"dot {workers} workers": lambda: a.dot(b, workers=workers),
+    }
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"{name:>16}: {best * 1000:10.2f}ms")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: 2025-present Luiz Eduardo Amaral <luizamaral306@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+Boolean mask filtering benchmark.
+
+Compares filtering with the Masks built by comparisons, which are known to hold booleans, with
+filtering by plain lists of booleans, which are checked value by value.
+
+Usage:
+    python benchmarks/bench_filter.py [size]
+"""
+
+import random
+import sys
+import timeit
+
+import lontras as lt
+
+
+def main(size: int = 1_000_000, repeat: int = 3):
+    df = lt.DataFrame({"a": random.sample(range(size), size), "b": list(range(size)), "c": list(range(size))})
+    mask = df["a"] > size // 2
+    cases = {
+        "compare": lambda: df["a"] > size // 2,
+        "mask": lambda: df[mask],
+        "list": lambda: df[mask.values.to_list()],
+        "combined masks": lambda: df[(df["a"] > size // 2) & (df["b"] < size // 4)],
+    }
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"{name:>16}: {best * 1000:10.2f}ms")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: 2025-present Luiz Eduardo Amaral <luizamaral306@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+Lazy DataFrame benchmark.
+
+Compares chaining DataFrame operators, which builds an intermediate DataFrame per operator, with
+recording the same chain on `DataFrame.lazy` and fusing it into a single loop per column on
+`LazyFrame.collect`.
+
+Usage:
+    python benchmarks/bench_lazy.py [size]
+"""
+
+import random
+import sys
+import timeit
+
+import lontras as lt
+
+
+def main(size: int = 1_000_000, repeat: int = 3, columns: int = 10):
+    rows = size // columns
+    df = lt.DataFrame({f"c{i}": random.sample(range(rows), rows) for i in range(columns)})
+    df2 = lt.DataFrame({f"c{i}": random.sample(range(rows), rows) for i in range(columns)})
+
+    cases = {
+        "eager": lambda: ((df + 1) * 2 - df2).abs(),
+        "lazy": lambda: ((df.lazy() + 1) * 2 - df2).abs().collect(),
+        "eager compare": lambda: (df * 2 > df2) & (df2 > rows // 2),
+        "lazy compare": lambda: ((df.lazy() * 2 > df2) & (df2.lazy() > rows // 2)).collect(),
+    }
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"{name:>16}: {best * 1000:10.2f}ms")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: 2025-present Luiz Eduardo Amaral <luizamaral306@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+DataFrame merge benchmark.
+
+Compares the hash join behind `lontras.merge` with a naive nested loop join. The nested loop
+is quadratic, so it is timed on a sample of left rows and extrapolated to the full size.
+
+Usage:
+    python benchmarks/bench_merge.py [size]
+"""
+
+import random
+import sys
+import timeit
+
+import lontras as lt
+
+
+def nested_loop_join(left_keys: list, right_keys: list):
+    return [(i, j) for i, lk in enumerate(left_keys) for j, rk in enumerate(right_keys) if lk == rk]
+
+
+def main(size: int = 100_000, repeat: int = 3, sample: int = 100):
+    left = lt.DataFrame({"key": random.sample(range(size), size), "x": list(range(size))})
+    right = lt.DataFrame({"key": random.sample(range(size), size), "y": list(range(size))})
+
+    for how in ("inner", "left", "outer"):
+        best = min(timeit.repeat(lambda how=how: lt.merge(left, right, how, on="key"), number=1, repeat=repeat))
+        print(f"{'hash ' + how:>16}: {best * 1000:10.2f}ms")
+
+    left_keys = left["key"].values[:sample]
+    right_keys = right["key"].values.to_list()
+    best = min(timeit.repeat(lambda: nested_loop_join(left_keys, right_keys), number=1, repeat=repeat))
+    print(f"{'nested loop':>16}: {best * size / sample * 1000:10.2f}ms (extrapolated from {sample} rows)")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
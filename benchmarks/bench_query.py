@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: 2025-present Luiz Eduardo Amaral <luizamaral306@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+DataFrame query benchmark.
+
+Compares `DataFrame.query` and `DataFrame.eval`, which compile the expression into a single loop
+over the rows, with chaining Series operators, which builds an intermediate Series per operator.
+
+Usage:
+    python benchmarks/bench_query.py [size]
+"""
+
+import random
+import sys
+import timeit
+
+import lontras as lt
+
+
+def main(size: int = 1_000_000, repeat: int = 3):
+    df = lt.DataFrame({"a": random.sample(range(size), size), "b": [("x", "y", "z")[i % 3] for i in range(size)]})
+    half = size // 2
+
+    cases = {
+        "query": (
+            lambda: df.query("a > @half and b == 'x'", {"half": half}),
+            lambda: df[(df["a"] > half) & (df["b"] == "x")],
+        ),
+        "eval": (lambda: df.eval("a * a + 2 * a + 1"), lambda: df["a"] * df["a"] + 2 * df["a"] + 1),
+    }
+    for name, (engine, baseline) in cases.items():
+        for label, func in (("compiled", engine), ("chained", baseline)):
+            best = min(timeit.repeat(func, number=1, repeat=repeat))
+            print(f"{label + ' ' + name:>16}: {best * 1000:10.2f}ms")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
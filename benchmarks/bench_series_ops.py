@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: 2025-present Luiz Eduardo Amaral <luizamaral306@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+Series binary operators benchmark.
+
+Compares operands sharing the same Index, operands with equal but distinct labels and operands
+whose labels must be aligned by hash lookup.
+
+Usage:
+    python benchmarks/bench_series_ops.py [size]
+"""
+
+import random
+import sys
+import timeit
+
+import lontras as lt
+
+
+def main(size: int = 100_000, repeat: int = 5):
+    labels = [f"k{i}" for i in range(size)]
+    shuffled = random.sample(labels, size)
+    values = list(range(size))
+
+    sa = lt.Series(values, index=labels)
+    cases = {
+        "same index": lt.Series(values, index=sa.index),
+        "equal labels": lt.Series(values, index=labels),
+        "shuffled labels": lt.Series(values, index=shuffled),
+        "scalar": 1,
+        "list": values,
+    }
+    for name, other in cases.items():
+        best = min(timeit.repeat(lambda other=other: sa + other, number=1, repeat=repeat))
+        print(f"{name:>16}: {best * 1000:10.2f}ms")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,38 @@
+# SPDX-FileCopyrightText: 2025-present Luiz Eduardo Amaral <luizamaral306@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+DataFrame transpose benchmark.
+
+Compares `DataFrame.T`, which zips the columns into the new columns and reuses both Index objects,
+with rebuilding the DataFrame from a dict of the rows of `DataFrame.iterrows`.
+
+Usage:
+    python benchmarks/bench_transpose.py [size]
+"""
+
+import random
+import sys
+import timeit
+
+import lontras as lt
+
+
+def main(size: int = 1_000_000, repeat: int = 3, columns: int = 10):
+    rows = size // columns
+    tall = lt.DataFrame({f"c{i}": random.sample(range(rows), rows) for i in range(columns)})
+    wide = tall.T
+
+    cases = {
+        "iterrows tall": lambda: lt.DataFrame(dict(tall.iterrows()), index=tall.columns[:]),
+        "T tall": lambda: tall.T,
+        "iterrows wide": lambda: lt.DataFrame(dict(wide.iterrows()), index=wide.columns[:]),
+        "T wide": lambda: wide.T,
+    }
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"{name:>16}: {best * 1000:10.2f}ms")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
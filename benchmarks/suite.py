@@ -0,0 +1,166 @@
+# SPDX-FileCopyrightText: 2025-present Luiz Eduardo Amaral <luizamaral306@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+"""
+Benchmark suite for the hot paths of Array, Index, Series and DataFrame.
+
+Times every case at several sizes and emits the results as JSON, so that runs on different commits
+can be compared. DataFrames have `size` cells spread over 10 columns.
+
+Usage:
+    python benchmarks/suite.py [--sizes 1000 10000 ...] [--repeat N] [-k filter] [--output results.json]
+    python benchmarks/suite.py --compare baseline.json [--threshold 1.2]
+
+With `--compare`, the run is compared with a previous one and the cases slower than `threshold` times
+the baseline are reported. The exit status is 1 if there are any.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import timeit
+from typing import TYPE_CHECKING
+
+import lontras as lt
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+COLUMNS = 10
+
+
+def floats(size: int) -> list[float]:
+    return [v / size for v in random.sample(range(size), size)]
+
+
+def array_cases(size: int) -> dict[str, Callable]:
+    a = lt.Array(floats(size))
+    b = lt.Array(floats(size))
+    return {
+        "array add": lambda: a + b,
+        "array mul scalar": lambda: a * 2,
+        "array compare": lambda: a < b,
+    }
+
+
+def index_cases(size: int) -> dict[str, Callable]:
+    labels = [f"label{i}" for i in range(size)]
+    keys = random.sample(labels, max(size // 100, 1))
+    index = lt.Index(labels)
+    index.get_ilocs(keys[0])  # Builds the label -> positions map
+    return {
+        "index init": lambda: lt.Index(labels),
+        "index get_ilocs": lambda: index.get_ilocs(keys),
+        "index first lookup": lambda: lt.Index(labels).get_ilocs(keys[0]),
+    }
+
+
+def series_cases(size: int) -> dict[str, Callable]:
+    s = lt.Series(floats(size))
+    t = lt.Series(floats(size))
+    shuffled = t.loc[random.sample(range(size), size)]
+    return {
+        "series add": lambda: s + t,
+        "series add aligned": lambda: s + shuffled,
+        "series compare": lambda: s > t,
+        "series mean": s.mean,
+        "series std": s.std,
+        "series describe": s.describe,
+    }
+
+
+def dataframe_cases(size: int) -> dict[str, Callable]:
+    rows = max(size // COLUMNS, 1)
+    data = {f"c{i}": floats(rows) for i in range(COLUMNS)}
+    records = [dict(zip(data, row)) for row in zip(*data.values())]
+    df = lt.DataFrame(data)
+    square = lt.DataFrame({f"c{i}": floats(COLUMNS) for i in range(COLUMNS)}, index=df.columns)
+    return {
+        "dataframe init": lambda: lt.DataFrame(data),
+        "dataframe init records": lambda: lt.DataFrame(records),
+        "dataframe add": lambda: df + df,
+        "dataframe T": lambda: df.T,
+        "dataframe iterrows": lambda: list(df.iterrows()),
+        "dataframe apply": lambda: df.apply(sum),
+        "dataframe agg": lambda: df.agg(max),
+        "dataframe mean": df.mean,
+        "dataframe dot": lambda: df.dot(square),
+        "dataframe to_dict": df.to_dict,
+        "dataframe to_dict records": lambda: df.to_dict("records"),
+    }
+
+
+SUITES = (array_cases, index_cases, series_cases, dataframe_cases)
+
+
+def run(sizes: list[int], repeat: int, name_filter: str = "") -> list[dict]:
+    results = []
+    for size in sizes:
+        for suite in SUITES:
+            for name, func in suite(size).items():
+                if name_filter not in name:
+                    continue
+                times = timeit.repeat(func, number=1, repeat=repeat)
+                results.append({"name": name, "size": size, "best": min(times), "times": times})
+                print(f"{name:>28} {size:>9}: {min(times) * 1000:10.2f}ms", file=sys.stderr)
+    return results
+
+
+def commit() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True)  # noqa: S607
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def compare(results: list[dict], baseline: dict, threshold: float) -> list[str]:
+    previous = {(r["name"], r["size"]): r["best"] for r in baseline["results"]}
+    regressions = []
+    for r in results:
+        before = previous.get((r["name"], r["size"]))
+        if before is not None and r["best"] > before * threshold:
+            regressions.append(f"{r['name']} {r['size']}: {before * 1000:.2f}ms -> {r['best'] * 1000:.2f}ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("-k", dest="name_filter", default="", help="only run the cases whose name contains this")
+    parser.add_argument("--output", help="write the JSON results to this file instead of stdout")
+    parser.add_argument("--compare", help="JSON results of a previous run to compare with")
+    parser.add_argument("--threshold", type=float, default=1.2)
+    args = parser.parse_args()
+
+    random.seed(0)
+    report = {
+        "lontras": lt.__version__,
+        "commit": commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": run(args.sizes, args.repeat, args.name_filter),
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report["results"], json.load(f), args.threshold)
+        for regression in regressions:
+            print(f"regression: {regression}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
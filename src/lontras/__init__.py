@@ -3,6 +3,33 @@
 # SPDX-License-Identifier: MIT
 
 from lontras.__about__ import __version__
-from lontras.lontras import Array, DataFrame, Index, Series
+from lontras.lontras import (
+    Array,
+    DataFrame,
+    DataFrameBuilder,
+    DataFrameGroupBy,
+    Index,
+    LazyFrame,
+    Mask,
+    RangeIndex,
+    Series,
+    SeriesGroupBy,
+    merge,
+    read_csv,
+)
 
-__all__ = ["__version__", "Array", "DataFrame", "Series", "Index"]
+__all__ = [
+    "__version__",
+    "Array",
+    "DataFrame",
+    "DataFrameBuilder",
+    "DataFrameGroupBy",
+    "Series",
+    "SeriesGroupBy",
+    "Index",
+    "LazyFrame",
+    "Mask",
+    "RangeIndex",
+    "merge",
+    "read_csv",
+]
@@ -3,13 +3,82 @@
 # SPDX-License-Identifier: MIT
 from __future__ import annotations
 
-import copy
+import array
+import bisect
 import functools
-import statistics
+import heapq
+import io
+import itertools
+import math
+import operator
+import os
+import re
+import sys
 from collections import UserList, defaultdict
-from collections.abc import Callable, Collection, Generator, Iterator, Mapping, Sequence, Sized
+from collections.abc import Callable, Collection, Generator, Iterable, Iterator, Mapping, Sequence, Sized
 from functools import reduce
-from typing import Any, Generic, Literal, Self, TypeAlias, TypeGuard, TypeVar, Union, assert_never, cast, overload
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Generic,
+    Literal,
+    NamedTuple,
+    Self,
+    TypeAlias,
+    TypeGuard,
+    TypeVar,
+    Union,
+    assert_never,
+    cast,
+    overload,
+)
+
+if TYPE_CHECKING:
+    import ast
+    import copy
+    import csv
+    import pickle
+    import statistics
+    import tokenize
+    from concurrent import futures
+
+
+###########################################################################
+# Lazy imports
+###########################################################################
+class _LazyModule:
+    """
+    Stands in for a standard library module that only a few features need, importing it on first
+    attribute access. This keeps them out of `import lontras`, which matters for short-lived
+    processes.
+    """
+
+    _module: Any
+    _name: str
+    __slots__ = ("_module", "_name")
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr: str) -> Any:
+        if self._module is None:
+            __import__(self._name)
+            self._module = sys.modules[self._name]
+        return getattr(self._module, attr)
+
+    def __repr__(self) -> str:
+        return f"<lazy module '{self._name}'>"
+
+
+if not TYPE_CHECKING:
+    ast = _LazyModule("ast")  # query, eval and lazy
+    copy = _LazyModule("copy")  # Array.copy
+    csv = _LazyModule("csv")  # read_csv
+    pickle = _LazyModule("pickle")  # workers in map and apply
+    futures = _LazyModule("concurrent.futures")  # workers in dot, map and apply
+    statistics = _LazyModule("statistics")  # median, mode, quantiles and statistics errors
+    tokenize = _LazyModule("tokenize")  # query and eval
 
 ###########################################################################
 # Typing
@@ -28,6 +97,7 @@ IlocIndexes: TypeAlias = Union[int, list[int], slice, "Array", "Series"]
 LocDataFrameReturn: TypeAlias = Union["Array", "Series", "DataFrame", Scalar]
 LocSeriesReturn: TypeAlias = Union["Series", Scalar]
 DfMergeHow: TypeAlias = Literal["inner", "left", "right", "outer"]
+NaPosition: TypeAlias = Literal["first", "last"]
 
 
 def _is_array_like(value: Any) -> TypeGuard[ArrayLike]:
@@ -39,33 +109,99 @@ def _is_scalar(value: Any) -> TypeGuard[Scalar]:
 
 
 def _is_boolean_mask(s: Any) -> TypeGuard[BooleanMask]:
-    return isinstance(s, Sequence) and all(isinstance(b, bool) for b in s)
+    # Masks were checked when they were built
+    if isinstance(s, Mask):
+        return True
+    return isinstance(s, Sequence) and len(s) > 0 and all(isinstance(b, bool) for b in s)
+
+
+def _mask_values(key: Series | Array | list) -> Array | list:
+    return key._data if isinstance(key, Series) else key  # noqa: SLF001
+
+
+def _validate_mask_length(mask: BooleanMask, size: int):
+    if len(mask) != size:
+        msg = f"Boolean index has wrong length: {len(mask)} instead of {size}"
+        raise IndexError(msg)
+
+
+def _is_label_slice(key: slice) -> bool:
+    # Slices bounded by ints (or open) are positional, any other bound makes them label-based
+    return any(b is not None and not isinstance(b, int) for b in (key.start, key.stop))
 
 
 ###########################################################################
 # Array
 ###########################################################################
 class Array(UserList):
+    data: list[Any] | array.array[Any]  # type: ignore
+
     ###########################################################################
     # Initializer and general methods
     ###########################################################################
+    def __init__(self, initlist: ArrayLike | Iterator | None = None, dtype: str | None = None):
+        """
+        Initializes an Array object.
+
+        Args:
+            initlist (ArrayLike | Iterator, optional): Initial values. Defaults to None.
+            dtype (str, optional): A typecode from the stdlib `array` module (eg: "d", "q"). Typed
+                Arrays store homogeneous numeric data in an `array.array` buffer instead of a list of
+                objects. Defaults to the dtype of `initlist` if it is an Array, otherwise untyped.
+
+        Raises:
+            TypeError | OverflowError: If a value cannot be stored with the given dtype.
+        """
+        if dtype is None and isinstance(initlist, Array):
+            dtype = initlist.dtype
+        if dtype is None:
+            super().__init__(initlist)
+        else:
+            self.data = array.array(dtype, [] if initlist is None else initlist)
+
     @classmethod
-    def full(cls, size: int, fill_value: Scalar) -> Array:
-        return cls([fill_value] * size)
+    def full(cls, size: int, fill_value: Scalar, dtype: str | None = None) -> Array:
+        return cls([fill_value] * size, dtype=dtype)
 
     @classmethod
-    def zeros(cls, size: int) -> Array:
-        return cls.full(size, 0)
+    def zeros(cls, size: int, dtype: str | None = None) -> Array:
+        return cls.full(size, 0, dtype=dtype)
 
     @classmethod
-    def ones(cls, size: int) -> Array:
-        return cls.full(size, 1)
+    def ones(cls, size: int, dtype: str | None = None) -> Array:
+        return cls.full(size, 1, dtype=dtype)
 
     ###########################################################################
     # General methods
     ###########################################################################
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}({self.data!s})"
+        if self.dtype is None:
+            return f"{self.__class__.__name__}({self.data!s})"
+        return f'{self.__class__.__name__}({self.to_list()!s}, dtype="{self.dtype}")'
+
+    @property
+    def dtype(self) -> str | None:
+        """
+        Returns the typecode of the underlying `array.array` buffer.
+
+        Returns:
+            str | None: The typecode, or None if the Array stores Python objects in a list.
+        """
+        return self.data.typecode if isinstance(self.data, array.array) else None
+
+    def _new(self, values: list[Any], other: Array | None = None) -> Array:
+        # Results keep the dtype of the operands when they still fit in it (eg: int / int does not)
+        dtype = self.dtype or (other.dtype if other is not None else None)
+        if dtype is not None:
+            try:
+                return Array(values, dtype=dtype)
+            except (TypeError, OverflowError):
+                pass
+        return Array(values)
+
+    def __iter__(self) -> Iterator:
+        # UserList falls back to Sequence.__iter__, which calls __getitem__ for every element
+        return iter(self.data)
 
     def copy(self, *, deep: bool = True):
         """
@@ -79,6 +215,25 @@ class Array(UserList):
         """
         return copy.deepcopy(self) if deep else copy.copy(self)
 
+    def memory_usage(self, *, deep: bool = False) -> int:
+        """
+        Returns the memory used by the Array in bytes.
+
+        Counts the Array object and its buffer: the list of pointers for untyped Arrays or the
+        `array.array` for typed ones, which stores the values themselves.
+
+        Args:
+            deep (bool, optional): If True, also counts the objects an untyped Array points to, each
+                distinct object once. Defaults to False.
+
+        Returns:
+            int: The memory usage in bytes.
+        """
+        size = sys.getsizeof(self) + sys.getsizeof(self.data)
+        if deep and self.dtype is None:
+            size += _sizeof_objects(self.data)
+        return size
+
     ###########################################################################
     # Accessors
     ###########################################################################
@@ -91,11 +246,12 @@ class Array(UserList):
             case int():
                 return self.data[key]
             case slice():
-                return Array(self.data[key])
+                return Array(self.data[key], dtype=self.dtype)
             case Array() | list():
                 if _is_boolean_mask(key):
-                    return Array([self.data[i] for i, v in enumerate(key) if v])
-                return Array([self.data[i] for i in key])
+                    _validate_mask_length(key, len(self))
+                    return Array(itertools.compress(self.data, key), dtype=self.dtype)
+                return Array([self.data[i] for i in key], dtype=self.dtype)
             case _:
                 msg = f"Cannot index with: {key=}"
                 raise KeyError(msg)
@@ -108,7 +264,7 @@ class Array(UserList):
             case slice():
                 indices = list(range(*key.indices(len(self.data))))
             case Array() | list():
-                indices = list(key) if not _is_boolean_mask(key) else [i for i, v in enumerate(key) if v]
+                indices = list(key) if not _is_boolean_mask(key) else list(itertools.compress(range(len(key)), key))
             case _:
                 msg = f"Cannot index with: {key=}"
                 raise KeyError(msg)
@@ -127,6 +283,15 @@ class Array(UserList):
                 msg = f"Cannot set with: {value=}"
                 raise TypeError(msg)
 
+    def sort(self, *args, **kwargs):
+        if self.dtype is None:
+            self.data.sort(*args, **kwargs)
+        else:
+            self.data = array.array(self.dtype, sorted(self.data, *args, **kwargs))
+
+    def clear(self):
+        del self.data[:]
+
     ###########################################################################
     # Concatenation
     ###########################################################################
@@ -146,17 +311,28 @@ class Array(UserList):
     ###########################################################################
     # Map/Reduce
     ###########################################################################
-    def map(self, func: Callable[[Scalar], Scalar]) -> Array:
+    def map(
+        self, func: Callable[[Scalar], Scalar], *, workers: int | None = None, chunksize: int | None = None
+    ) -> Array:
         """
         Applies a function to each value in the Array.
 
         Args:
             func (Callable[Scalar, Any]): The function to apply.
+            workers (int, optional): Number of worker processes (threads on free-threaded builds) to
+                split the values between. With processes, `func` and the values must be picklable.
+                Arrays shorter than 1000 values are mapped serially. Defaults to None, which maps in
+                this process.
+            chunksize (int, optional): Number of values sent to a worker at a time. Defaults to about
+                four chunks per worker.
 
         Returns:
             Array: A new Array with the results of the function applied.
+
+        Raises:
+            TypeError: If `func` can't be pickled for worker processes.
         """
-        return Array([func(v) for v in self])
+        return Array(_parallel_map(func, self.data, workers, chunksize))
 
     def reduce(self, func: Callable[[Any, Scalar], Any], initial: Any) -> Any:
         """
@@ -327,7 +503,7 @@ class Array(UserList):
             Array: A Array of boolean values indicating the result of the comparison.
         """
         other = cast(Array, other)
-        return Array([s < o for s, o in zip(self, other)])
+        return _mask_or_array(list(map(operator.lt, self.data, other.data)))
 
     @_standardize_input
     def __le__(self, other: Array | ArrayLike | Scalar) -> Array:
@@ -343,7 +519,7 @@ class Array(UserList):
             Array: A Array of boolean values indicating the result of the comparison.
         """
         other = cast(Array, other)
-        return Array([s <= o for s, o in zip(self, other)])
+        return _mask_or_array(list(map(operator.le, self.data, other.data)))
 
     @_standardize_input
     def __eq__(self, other: Array | ArrayLike | Scalar) -> Array:  # type: ignore
@@ -359,7 +535,7 @@ class Array(UserList):
             Array: A Array of boolean values indicating the result of the comparison.
         """
         other = cast(Array, other)
-        return Array([s == o for s, o in zip(self, other)])
+        return _mask_or_array(list(map(operator.eq, self.data, other.data)))
 
     @_standardize_input
     def __ne__(self, other: Array | ArrayLike | Scalar) -> Array:  # type: ignore
@@ -375,7 +551,7 @@ class Array(UserList):
             Array: A Array of boolean values indicating the result of the comparison.
         """
         other = cast(Array, other)
-        return Array([s != o for s, o in zip(self, other)])
+        return _mask_or_array(list(map(operator.ne, self.data, other.data)))
 
     @_standardize_input
     def __gt__(self, other: Array | ArrayLike | Scalar) -> Array:
@@ -391,7 +567,7 @@ class Array(UserList):
             Array: A Array of boolean values indicating the result of the comparison.
         """
         other = cast(Array, other)
-        return Array([s > o for s, o in zip(self, other)])
+        return _mask_or_array(list(map(operator.gt, self.data, other.data)))
 
     @_standardize_input
     def __ge__(self, other: Array | ArrayLike | Scalar) -> Array:
@@ -407,7 +583,7 @@ class Array(UserList):
             Array: A Array of boolean values indicating the result of the comparison.
         """
         other = cast(Array, other)
-        return Array([s >= o for s, o in zip(self, other)])
+        return _mask_or_array(list(map(operator.ge, self.data, other.data)))
 
     ###########################################################################
     # Operators
@@ -424,7 +600,7 @@ class Array(UserList):
             Array: A Array with the results of the operation.
         """
         other = cast(Array, other)
-        return Array([s + o for s, o in zip(self, other)])
+        return self._new([s + o for s, o in zip(self, other)], other)
 
     @_standardize_input
     def __sub__(self, other: Array | ArrayLike | Scalar) -> Array:
@@ -438,7 +614,7 @@ class Array(UserList):
             Array: A Array with the results of the operation.
         """
         other = cast(Array, other)
-        return Array([s - o for s, o in zip(self, other)])
+        return self._new([s - o for s, o in zip(self, other)], other)
 
     @_standardize_input
     def __mul__(self, other: Array | ArrayLike | Scalar) -> Array:
@@ -452,7 +628,7 @@ class Array(UserList):
             Array: A Array with the results of the operation.
         """
         other = cast(Array, other)
-        return Array([s * o for s, o in zip(self, other)])
+        return self._new([s * o for s, o in zip(self, other)], other)
 
     def __matmul__(self, other: Array | ArrayLike) -> Scalar:
         """
@@ -481,7 +657,7 @@ class Array(UserList):
             Array: A Array with the results of the operation.
         """
         other = cast(Array, other)
-        return Array([s / o for s, o in zip(self, other)])
+        return self._new([s / o for s, o in zip(self, other)], other)
 
     @_standardize_input
     def __floordiv__(self, other: Array | ArrayLike | Scalar) -> Array:
@@ -495,7 +671,7 @@ class Array(UserList):
             Array: A Array with the results of the operation.
         """
         other = cast(Array, other)
-        return Array([s // o for s, o in zip(self, other)])
+        return self._new([s // o for s, o in zip(self, other)], other)
 
     @_standardize_input
     def __mod__(self, other: Array | ArrayLike | Scalar) -> Array:
@@ -509,7 +685,7 @@ class Array(UserList):
             Array: A Array with the results of the operation.
         """
         other = cast(Array, other)
-        return Array([s % o for s, o in zip(self, other)])
+        return self._new([s % o for s, o in zip(self, other)], other)
 
     @_standardize_input
     def __divmod__(self, other: Array | ArrayLike | Scalar) -> Array:
@@ -537,7 +713,7 @@ class Array(UserList):
             Array: A Array with the results of the operation.
         """
         other = cast(Array, other)
-        return Array([pow(s, o) for s, o in zip(self, other)])
+        return self._new([pow(s, o) for s, o in zip(self, other)], other)
 
     @_standardize_input
     def __lshift__(self, other: Array | ArrayLike | Scalar) -> Array:
@@ -551,7 +727,7 @@ class Array(UserList):
             Array: A Array with the results of the operation.
         """
         other = cast(Array, other)
-        return Array([s << o for s, o in zip(self, other)])
+        return self._new([s << o for s, o in zip(self, other)], other)
 
     @_standardize_input
     def __rshift__(self, other: Array | ArrayLike | Scalar) -> Array:
@@ -565,7 +741,7 @@ class Array(UserList):
             Array: A Array with the results of the operation.
         """
         other = cast(Array, other)
-        return Array([s >> o for s, o in zip(self, other)])
+        return self._new([s >> o for s, o in zip(self, other)], other)
 
     @_standardize_input
     def __and__(self, other: Array | ArrayLike | Scalar) -> Array:
@@ -579,7 +755,7 @@ class Array(UserList):
             Array: A Array with the results of the operation.
         """
         other = cast(Array, other)
-        return Array([s & o for s, o in zip(self, other)])
+        return self._new([s & o for s, o in zip(self, other)], other)
 
     @_standardize_input
     def __xor__(self, other: Array | ArrayLike | Scalar) -> Array:
@@ -593,7 +769,7 @@ class Array(UserList):
             Array: A Array with the results of the operation.
         """
         other = cast(Array, other)
-        return Array([s ^ o for s, o in zip(self, other)])
+        return self._new([s ^ o for s, o in zip(self, other)], other)
 
     @_standardize_input
     def __or__(self, other: Array | ArrayLike | Scalar) -> Array:
@@ -607,7 +783,7 @@ class Array(UserList):
             Array: A Array with the results of the operation.
         """
         other = cast(Array, other)
-        return Array([s | o for s, o in zip(self, other)])
+        return self._new([s | o for s, o in zip(self, other)], other)
 
     ###########################################################################
     # Right-hand Side Operators
@@ -764,57 +940,808 @@ class Array(UserList):
     # Unary Operators
     ###########################################################################
     def __neg__(self) -> Array:
-        return Array([-v for v in self])
+        return self._new([-v for v in self])
 
     def __pos__(self) -> Array:
-        return Array([+v for v in self])
+        return self._new([+v for v in self])
 
     def __abs__(self) -> Array:
         return self.abs()
 
     def __invert__(self) -> Array:
-        return Array([~v for v in self])
+        # Like in pandas, booleans are negated instead of bitwise inverted
+        values = [_invert(v) for v in self]
+        mask = _mask_or_array(values)
+        return mask if isinstance(mask, Mask) else self._new(values)
+
+
+class Mask(Array):
+    """
+    Array of booleans, as built by comparisons. Its values are checked once when it is built, so
+    indexing with a Mask skips checking them again, and the number of True values is counted once
+    and cached. Combining Masks with `&`, `|`, `^` and `~` builds new Masks without checking their values.
+
+    Masks can be modified like any Array. Only the new values are checked: a Mask that is given a
+    non-boolean value (eg: `mask += 1`) becomes a plain Array.
+    """
+
+    _popcount: int | None
+
+    def __init__(self, initlist: ArrayLike | Iterator | None = None):
+        """
+        Initializes a Mask object.
+
+        Args:
+            initlist (ArrayLike | Iterator, optional): Initial values. Defaults to None.
+
+        Raises:
+            TypeError: If a value is not a boolean.
+        """
+        super().__init__(initlist.data if isinstance(initlist, Array) else initlist)
+        if not set(map(type, self.data)) <= {bool}:
+            msg = "Mask values must be booleans"
+            raise TypeError(msg)
+        self._popcount = None
+
+    @classmethod
+    def _from_bools(cls, values: list[bool]) -> Mask:
+        # Builds a Mask from values that are known to be booleans, without checking them
+        mask = cls.__new__(cls)
+        mask.data = values
+        mask._popcount = None  # noqa: SLF001
+        return mask
+
+    def _mutated(self, values: Iterable[Any] = ()):
+        # Drops the cached count. Masks given non-boolean values become plain Arrays.
+        self._popcount = None
+        if not set(map(type, values)) <= {bool}:
+            self.__class__ = Array  # type: ignore
+
+    def __setitem__(self, key: Scalar | slice | ArrayLike, value: Scalar | ArrayLike):  # type: ignore
+        if isinstance(value, Iterator):
+            value = list(value)
+        super().__setitem__(key, value)
+        self._mutated([value] if _is_scalar(value) else value)  # type: ignore
+
+    def __delitem__(self, key: int | slice):  # type: ignore
+        super().__delitem__(key)
+        self._mutated()
+
+    def append(self, value: Scalar) -> Array:  # type: ignore
+        super().append(value)
+        self._mutated([value])
+        return self
+
+    def extend(self, other: Iterable[Any]):
+        other = list(other)
+        super().extend(other)
+        self._mutated(other)
+
+    def insert(self, i: int, item: Any):
+        super().insert(i, item)
+        self._mutated([item])
+
+    def pop(self, i: int = -1) -> Any:
+        value = super().pop(i)
+        self._mutated()
+        return value
+
+    def remove(self, item: Any):
+        super().remove(item)
+        self._mutated()
+
+    def reverse(self):
+        super().reverse()
+        self._mutated()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._mutated()
+
+    def clear(self):
+        super().clear()
+        self._mutated()
+
+    @property
+    def popcount(self) -> int:
+        """
+        Returns the number of True values. It is computed once and cached.
+
+        Returns:
+            int: The number of True values.
+        """
+        if self._popcount is None:
+            self._popcount = self.data.count(True)
+        return self._popcount
+
+    def sum(self) -> int:
+        return self.popcount
+
+    def all(self) -> bool:
+        return self.popcount == len(self)
+
+    def any(self) -> bool:
+        return self.popcount > 0
+
+    def _combine(self, op: Callable[[Any, Any], Any], other: Any, fallback: Callable[[Any], Array]) -> Array:
+        if isinstance(other, Mask):
+            self._validate_length(other)
+            return Mask._from_bools(list(map(op, self.data, other.data)))
+        return fallback(other)
+
+    def __and__(self, other: Array | ArrayLike | Scalar) -> Array:
+        return self._combine(operator.and_, other, super().__and__)
+
+    def __or__(self, other: Array | ArrayLike | Scalar) -> Array:
+        return self._combine(operator.or_, other, super().__or__)
+
+    def __xor__(self, other: Array | ArrayLike | Scalar) -> Array:
+        return self._combine(operator.xor, other, super().__xor__)
+
+    # Like the other combinations, in-place logical operators build new Masks
+    __iand__ = __and__  # type: ignore
+    __ior__ = __or__  # type: ignore
+    __ixor__ = __xor__  # type: ignore
+
+    def __invert__(self) -> Mask:
+        return Mask._from_bools(list(map(operator.not_, self.data)))
+
+
+def _writable_copy(values: Array) -> Array:
+    return Array(values.data) if isinstance(values, Mask) else values.copy(deep=False)
+
+
+def _mask_or_array(values: list[Any]) -> Array:
+    # Comparisons of builtin types give booleans, but other types may return anything
+    return Mask._from_bools(values) if set(map(type, values)) <= {bool} else Array(values)  # noqa: SLF001
 
 
 ###########################################################################
 # Functions
 ###########################################################################
-# def merge(
-#         left: DataFrame,
-#         right: DataFrame,
-#         how:DfMergeHow="inner",
-#         on: Scalar | IndexLike | None = None,
-#         *,
-#         left_on: Scalar | IndexLike | None = None,
-#         right_on: Scalar | IndexLike | None = None,
-#         left_index: bool = False,
-#         right_index: bool = False,
-#         suffixes: tuple[str, str]=("_x", "_y")
-#     ) -> DataFrame:
-#     if how not in ('inner', 'left', 'right', 'outer'):
-#         raise ValueError(f"how must be 'inner', 'left', 'right' or 'outer', got {how}")
-#     left_on, right_on = _validate_merge_keys(on, left_on, right_on)
-#     return DataFrame()
-
-# def _validate_merge_keys(on: Scalar | IndexLike | None = None,
-#         left_on: Scalar | IndexLike | None = None,
-#         right_on: Scalar | IndexLike | None = None,
-#         left_index: bool = False,
-#         right_index: bool = False,
-#         ) -> tuple[IndexLike, IndexLike]:
-#     match on, left_on, right_on, left_index, right_index:
-#         case s, None, None, False, False if _is_scalar(s):
-#             left_on, right_on = [on], [on]
-#         case s, None, None, False, False if _is_array_like(s):
-#             left_on, right_on = on, on
-#         case None, sl, sr, False, False if _is_scalar(sl) and _is_scalar(sr):
-#             left_on, right_on = [left_on], [right_on]
-#         case None, sl, sr, False, False if _is_array_like(sl) and _is_array_like(sr):
-#             pass
-#         case _:
-#             msg = "Merge requires either an 'on' argument or 'left_on' and 'right_on'. Not both nor neither."
-#             ValueError(msg)
-#     return left_on, right_on
+def merge(
+    left: DataFrame,
+    right: DataFrame,
+    how: DfMergeHow = "inner",
+    on: Scalar | IndexLike | None = None,
+    *,
+    left_on: Scalar | IndexLike | None = None,
+    right_on: Scalar | IndexLike | None = None,
+    left_index: bool = False,
+    right_index: bool = False,
+    suffixes: tuple[str, str] = ("_x", "_y"),
+) -> DataFrame:
+    """
+    Merges two DataFrames with a database-style join on columns or indexes.
+
+    The join is a hash join: the smaller side is hashed into a map of key -> row positions
+    and the larger side is streamed against it. Result columns are gathered by position,
+    so no Series is built per row.
+
+    Row order follows pandas: inner and left joins keep the order of the left keys, right
+    joins the order of the right keys and outer joins sort the keys.
+
+    Args:
+        left (DataFrame): Left DataFrame.
+        right (DataFrame): Right DataFrame.
+        how (DfMergeHow, optional): Type of join: "inner", "left", "right" or "outer". Defaults to "inner".
+        on (Scalar | IndexLike, optional): Column label(s) present in both DataFrames to join on.
+            Defaults to the columns the DataFrames have in common.
+        left_on (Scalar | IndexLike, optional): Column label(s) of the left DataFrame to join on.
+        right_on (Scalar | IndexLike, optional): Column label(s) of the right DataFrame to join on.
+        left_index (bool, optional): Use the left index as the join key. Defaults to False.
+        right_index (bool, optional): Use the right index as the join key. Defaults to False.
+        suffixes (tuple[str, str], optional): Suffixes appended to overlapping column labels.
+            Defaults to ("_x", "_y").
+
+    Returns:
+        DataFrame: The merged DataFrame.
+
+    Raises:
+        ValueError: If `how` or the key arguments are invalid.
+        KeyError: If a key column is missing.
+    """
+    if how not in ("inner", "left", "right", "outer"):
+        msg = f"how must be 'inner', 'left', 'right' or 'outer', got {how}"
+        raise ValueError(msg)
+    lon, ron = _validate_merge_keys(left, right, on, left_on, right_on, left_index, right_index)
+    left_keys = _merge_keys(left, lon)
+    right_keys = _merge_keys(right, ron)
+    if how == "right":
+        right_pos, left_pos = _hash_join(right_keys, left_keys, "left")
+    else:
+        left_pos, right_pos = _hash_join(left_keys, right_keys, how)
+    if how == "outer":
+        keys = [left_keys[lp] if lp != -1 else right_keys[rp] for lp, rp in zip(left_pos, right_pos)]
+        try:
+            # NA keys go last, like in pandas
+            order: Iterable[int] = sorted(
+                range(len(keys)), key=lambda r: (True,) if _is_na_key(keys[r]) else (False, keys[r])
+            )
+        except TypeError:
+            # Keys of different types don't compare, so the rows keep the order of the join
+            order = range(len(keys))
+        left_pos = [left_pos[r] for r in order]
+        right_pos = [right_pos[r] for r in order]
+
+    shared = {lk for lk, rk in zip(lon, ron) if lk == rk} if lon is not None and ron is not None else set()
+    right_lookup = dict(zip(right.columns, right._data))  # noqa: SLF001
+    right_columns = [col for col in right.columns if col not in shared]
+    overlap = set(left.columns) & set(right_columns)
+    columns, data = [], []
+    for col, values in zip(left.columns, left._data):  # noqa: SLF001
+        if col in shared:
+            columns.append(col)
+            data.append(_coalesce(values, left_pos, right_lookup[col], right_pos))
+        else:
+            columns.append(f"{col}{suffixes[0]}" if col in overlap else col)
+            data.append(_take(values, left_pos))
+    for col in right_columns:
+        columns.append(f"{col}{suffixes[1]}" if col in overlap else col)
+        data.append(_take(right_lookup[col], right_pos))
+
+    if lon is None and ron is None:
+        index = Index(_coalesce(left.index, left_pos, right.index, right_pos))
+    elif lon is None:
+        index = Index(_take(right.index, right_pos))
+    elif ron is None:
+        index = Index(_take(left.index, left_pos))
+    else:
+        index = Index(range(len(left_pos)))
+    return DataFrame._from_aligned(Array(data), index, Index(columns))  # noqa: SLF001
+
+
+def _validate_merge_keys(
+    left: DataFrame,
+    right: DataFrame,
+    on: Scalar | IndexLike | None,
+    left_on: Scalar | IndexLike | None,
+    right_on: Scalar | IndexLike | None,
+    left_index: bool,  # noqa: FBT001
+    right_index: bool,  # noqa: FBT001
+) -> tuple[list[Scalar] | None, list[Scalar] | None]:
+    # Returns the key columns of each side, None meaning the side joins on its index
+    def as_list(keys: Any) -> list[Scalar]:
+        return [keys] if _is_scalar(keys) else list(keys)
+
+    lon: list[Scalar] | None
+    ron: list[Scalar] | None
+    match on, left_on, right_on, left_index, right_index:
+        case None, None, None, False, False:
+            lon = ron = [col for col in left.columns if col in right.columns]
+            if len(lon) == 0:
+                msg = "No common columns to perform merge on"
+                raise ValueError(msg)
+        case keys, None, None, False, False:
+            lon = ron = as_list(keys)
+        case None, lkeys, rkeys, False, False if lkeys is not None and rkeys is not None:
+            lon, ron = as_list(lkeys), as_list(rkeys)
+        case None, None, None, True, True:
+            lon, ron = None, None
+        case None, lkeys, None, False, True if lkeys is not None:
+            lon, ron = as_list(lkeys), None
+        case None, None, rkeys, True, False if rkeys is not None:
+            lon, ron = None, as_list(rkeys)
+        case _:
+            msg = "Merge requires either 'on', 'left_on' and 'right_on', or the index flags. Not a mix of them."
+            raise ValueError(msg)
+    if len(lon if lon is not None else [None]) != len(ron if ron is not None else [None]):
+        msg = "len(right_on) must equal len(left_on)"
+        raise ValueError(msg)
+    for frame, keys in ((left, lon), (right, ron)):
+        if keys is not None and (missing := [key for key in keys if key not in frame.columns]):
+            msg = f"Columns not found: {missing}"
+            raise KeyError(msg)
+    return lon, ron
+
+
+def _merge_keys(frame: DataFrame, on: list[Scalar] | None) -> list[Any]:
+    if on is None:
+        return frame.index.values
+    lookup = dict(zip(frame.columns, frame._data))  # noqa: SLF001
+    if len(on) == 1:
+        return list(lookup[on[0]])
+    return list(zip(*(lookup[key] for key in on)))
+
+
+def _hash_join(
+    left_keys: list[Any], right_keys: list[Any], how: Literal["inner", "left", "outer"]
+) -> tuple[list[int], list[int]]:
+    # Pairs the positions of equal keys, -1 marking a row without a match.
+    # The smaller side is hashed and the larger one is streamed against it.
+    left_pos: list[int] = []
+    right_pos: list[int] = []
+    unmatched: list[int] = []
+    if len(right_keys) <= len(left_keys):
+        # Streaming the left side emits the pairs in left order already
+        table = Index(right_keys)._rev_index  # noqa: SLF001
+        matched = bytearray(len(right_keys))
+        for i, key in enumerate(left_keys):
+            if (js := table.get(key)) is not None:
+                left_pos.extend([i] * len(js))
+                right_pos.extend(js)
+                for j in js:
+                    matched[j] = 1
+            elif how != "inner":
+                left_pos.append(i)
+                right_pos.append(-1)
+        unmatched = [j for j, m in enumerate(matched) if not m]
+    else:
+        # Streaming the right side, the matches are bucketed per left row to restore the left order
+        table = Index(left_keys)._rev_index  # noqa: SLF001
+        buckets: list[list[int]] = [[] for _ in left_keys]
+        for j, key in enumerate(right_keys):
+            if (ilocs := table.get(key)) is None:
+                unmatched.append(j)
+                continue
+            for i in ilocs:
+                buckets[i].append(j)
+        for i, js in enumerate(buckets):
+            if len(js) > 0:
+                left_pos.extend([i] * len(js))
+                right_pos.extend(js)
+            elif how != "inner":
+                left_pos.append(i)
+                right_pos.append(-1)
+    if how == "outer":
+        left_pos.extend([-1] * len(unmatched))
+        right_pos.extend(unmatched)
+    return left_pos, right_pos
+
+
+def _take(values: Array, positions: list[int]) -> Array:
+    # Gathers values by position, -1 yielding None
+    padded = [*values, None]
+    return Array([padded[i] for i in positions])
+
+
+def _compress(values: Array, keep: Iterable[Any]) -> Array:
+    # Keeps the values whose flag in `keep` is set, in a single pass that preserves the dtype
+    return Array(itertools.compress(values.data, keep), dtype=values.dtype)
+
+
+def _sizeof_objects(values: Iterable[Any]) -> int:
+    # Bytes used by the distinct objects in `values`. Objects that appear more than once (eg: small
+    # ints and strings that Python caches) are counted once.
+    return sum(map(sys.getsizeof, {id(v): v for v in values}.values()))
+
+
+if sys.version_info >= (3, 12):
+    _sumprod = math.sumprod
+else:
+
+    def _sumprod(p: Iterable[Any], q: Iterable[Any]) -> Any:
+        return sum(map(operator.mul, p, q))
+
+
+# Inputs shorter than this are mapped serially even when workers are requested, since starting the
+# pool and pickling the values costs more than it saves
+_PARALLEL_MIN_SIZE = 1_000
+
+
+def _uses_processes() -> bool:
+    # Threads run in parallel on free-threaded builds and need no pickling. Elsewhere the GIL
+    # serializes them, so processes are used.
+    return getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def _executor(workers: int) -> futures.Executor:
+    if _uses_processes():
+        return futures.ProcessPoolExecutor(max_workers=workers)
+    return futures.ThreadPoolExecutor(max_workers=workers)
+
+
+def _parallel_map(
+    func: Callable[[Any], Any], values: Iterable[Any], workers: int | None, chunksize: int | None = None
+) -> list[Any]:
+    # Maps `func` over `values` in a pool of `workers`, sending contiguous chunks of `chunksize`
+    # values to each task and keeping the results in order. By default every worker gets about four
+    # chunks, which balances uneven chunks without paying the per task overhead too often.
+    if workers is not None and workers > 1:
+        if _uses_processes():
+            # Checked upfront so that whether `func` works doesn't depend on the number of values
+            try:
+                pickle.dumps(func)
+            except (pickle.PicklingError, AttributeError, TypeError) as e:
+                msg = f"Can't send {func!r} to worker processes, use a module level function instead: {e}"
+                raise TypeError(msg) from e
+        values = list(values)
+        if len(values) >= _PARALLEL_MIN_SIZE:
+            chunksize = chunksize or -(-len(values) // (workers * 4))
+            with _executor(workers) as pool:
+                return list(pool.map(func, values, chunksize=chunksize))
+    return list(map(func, values))
+
+
+def _matmul_block(rows: Sequence[Sequence[Any]], columns: Sequence[Sequence[Any]]) -> list[list[Any]]:
+    # Products of every row with every column, column-major. Module level so that process pools
+    # can pickle it
+    return [[_sumprod(row, col) for row in rows] for col in columns]
+
+
+def _matmul(rows: Sequence[Sequence[Any]], columns: Sequence[Sequence[Any]], workers: int | None = None) -> list[Array]:
+    # Matrix product of `rows` (the left matrix, row-major) and `columns` (the right matrix,
+    # column-major). With `workers`, blocks of rows are multiplied in a worker pool and the
+    # partial columns are stitched back together.
+    if workers is None or workers <= 1 or len(rows) < 2:  # noqa: PLR2004
+        return [Array(col) for col in _matmul_block(rows, columns)]
+    size = -(-len(rows) // workers)
+    blocks = [rows[i : i + size] for i in range(0, len(rows), size)]
+    with _executor(len(blocks)) as pool:
+        parts = list(pool.map(_matmul_block, blocks, itertools.repeat(columns)))
+    return [Array(itertools.chain.from_iterable(part[j] for part in parts)) for j in range(len(columns))]
+
+
+def _keep_mask(size: int, positions: int | Iterable[int]) -> bytearray:
+    # Flags every position except the ones to be removed
+    keep = bytearray(b"\x01") * size
+    for i in [positions] if isinstance(positions, int) else positions:
+        keep[i] = 0
+    return keep
+
+
+def _coalesce(left: Array, left_pos: list[int], right: Array, right_pos: list[int]) -> Array:
+    # Gathers from the left when the row has a left match and from the right otherwise
+    lv, rv = left.data, right.data
+    return Array([lv[i] if i != -1 else rv[j] for i, j in zip(left_pos, right_pos)])
+
+
+def _argsort(
+    columns: Sequence[Sequence[Any]],
+    ascending: Sequence[bool],
+    key: Callable[[Any], Any] | None,
+    na_position: NaPosition,
+) -> list[int]:
+    # Sorts the positions by the columns with stable sorts from the last column to the first. Each
+    # pass decorates the positions with the values, mapped by `key` only once per value, and places
+    # the missing values (None) apart, since they cannot be compared
+    order = list(range(len(columns[0]))) if len(columns) > 0 else []
+    for values, asc in zip(reversed(columns), reversed(ascending)):
+        keys = values if key is None else [None if v is None else key(v) for v in values]
+        present = [i for i in order if keys[i] is not None]
+        missing = [i for i in order if keys[i] is None]
+        present.sort(key=cast(Callable[[int], Any], keys.__getitem__), reverse=not asc)
+        order = present + missing if na_position == "last" else missing + present
+    return order
+
+
+def _top_k(n: int, columns: Sequence[Sequence[Any]], *, largest: bool) -> list[int]:
+    # Positions of the `n` largest (or smallest) rows with a heap, ties keeping their order.
+    # Rows with missing values (None) are skipped
+    keys: Sequence[Any]
+    if len(columns) == 1:
+        keys = columns[0]
+        rows = [i for i, v in enumerate(keys) if v is not None]
+    else:
+        keys = list(zip(*columns))
+        rows = [i for i, row in enumerate(keys) if None not in row]
+    rank = cast(Callable[[int], Any], keys.__getitem__)
+    return heapq.nlargest(n, rows, key=rank) if largest else heapq.nsmallest(n, rows, key=rank)
+
+
+class _Stats(NamedTuple):
+    """
+    Summary statistics of a sequence of numbers, whose values are gathered in a single pass over
+    the input. Missing values (None) are skipped.
+
+    Results follow the `statistics` module. Ints use exact integer arithmetic, so means and
+    variances that are whole stay ints. Floats (and ints mixed with them) are summed with
+    `math.fsum`, which does not lose small values to cancellation. Any other type (eg: Decimal,
+    Fraction or bool) falls back to `statistics`.
+    """
+
+    values: list[Any]
+    kind: type | None
+    minimum: Any
+    maximum: Any
+
+    @classmethod
+    def of(cls, values: Iterable[Any]) -> _Stats:
+        present = [x for x in values if x is not None]
+        if len(present) == 0:
+            return cls(present, None, None, None)
+        types = set(map(type, present))
+        kind = int if types == {int} else float if types <= {int, float} else None
+        return cls(present, kind, min(present), max(present))
+
+    @property
+    def n(self) -> int:
+        return len(self.values)
+
+    def mean(self) -> Any:
+        if self.n < 1:
+            msg = "mean requires at least one data point"
+            raise statistics.StatisticsError(msg)
+        if self.kind is int:
+            total = sum(self.values)
+            return total // self.n if total % self.n == 0 else total / self.n
+        if self.kind is float:
+            return math.fsum(self.values) / self.n
+        return statistics.mean(self.values)
+
+    def var(self) -> Any:
+        if self.n < 2:  # noqa: PLR2004
+            msg = "variance requires at least two data points"
+            raise statistics.StatisticsError(msg)
+        n, values = self.n, self.values
+        if self.kind is int:
+            # n * (n - 1) * var = n * sum(x**2) - sum(x)**2, with no rounding on the way
+            total = sum(values)
+            squares, denominator = n * sum(x * x for x in values) - total * total, n * (n - 1)
+            return squares // denominator if squares % denominator == 0 else squares / denominator
+        if self.kind is float:
+            mean = math.fsum(values) / n
+            return math.fsum((x - mean) ** 2 for x in values) / (n - 1)
+        return statistics.variance(values)
+
+    def std(self) -> Any:
+        if self.kind is None:
+            if self.n < 2:  # noqa: PLR2004
+                msg = "stdev requires at least two data points"
+                raise statistics.StatisticsError(msg)
+            return statistics.stdev(self.values)
+        return math.sqrt(self.var())
+
+
+def _interpolate(values: Sequence[Any], qs: Iterable[float]) -> list[Any]:
+    # Quantiles of sorted `values` with linear interpolation between the two closest ranks (as pandas
+    # does)
+    out = []
+    for q in qs:
+        position = q * (len(values) - 1)
+        lo = math.floor(position)
+        low = values[lo]
+        out.append(low if position == lo else low + (values[lo + 1] - low) * (position - lo))
+    return out
+
+
+class _Expression(NamedTuple):
+    """
+    An expression parsed by `_parse_expression`. `names` are the identifiers the expression uses and
+    `references` what each of them refers to: ("column", label), ("variable", name) or ("name", name),
+    the latter being a column if there is one with that label and a variable otherwise. In `value`,
+    the i-th name is replaced by `__name_<i>`.
+    """
+
+    value: ast.expr
+    names: tuple[str, ...]
+    references: tuple[tuple[str, Any], ...]
+    target: str | None
+
+
+# Names of the ast nodes allowed in expressions (ast is only imported when one is parsed)
+_EXPRESSION_NODES = (
+    "BoolOp",
+    "BinOp",
+    "UnaryOp",
+    "Compare",
+    "IfExp",
+    "Name",
+    "Constant",
+    "Tuple",
+    "List",
+    "Set",
+    "boolop",
+    "operator",
+    "unaryop",
+    "cmpop",
+    "expr_context",
+)
+_BACKTICK_PREFIX = "__column_"
+_LOCAL_PREFIX = "__local_"
+_NAME_PREFIX = "__name_"
+
+
+def _expression_source(expr: str) -> tuple[str, list[str]]:
+    # Column labels quoted with backticks and local variables marked with `@` (like in pandas) are
+    # replaced by identifiers. `@` only marks a variable where a binary operator cannot appear.
+    quoted: list[str] = []
+
+    def quote(match: re.Match) -> str:
+        quoted.append(match.group(1))
+        return f"{_BACKTICK_PREFIX}{len(quoted) - 1}"
+
+    tokens = list(tokenize.generate_tokens(io.StringIO(re.sub(r"`([^`]*)`", quote, expr.strip())).readline))
+    out: list[tuple[int, str]] = []
+    previous: tokenize.TokenInfo | None = None
+    local = False
+    for token in tokens:
+        is_at = token.type == tokenize.OP and token.string == "@"
+        if is_at and (previous is None or (previous.type == tokenize.OP and previous.string not in ")]}")):
+            local = True
+            continue
+        string = f"{_LOCAL_PREFIX}{token.string}" if local and token.type == tokenize.NAME else token.string
+        local = False
+        out.append((token.type, string))
+        if token.type not in (tokenize.NL, tokenize.NEWLINE, tokenize.INDENT, tokenize.DEDENT, tokenize.COMMENT):
+            previous = token
+    return tokenize.untokenize(out), quoted
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_expression(expr: str) -> _Expression:
+    """
+    Parses an expression over column values, optionally assigned to a column (`"c = a + b"`).
+
+    Raises:
+        SyntaxError: If the expression is not valid.
+        ValueError: If the expression uses anything other than operators, names and literals.
+    """
+    source, quoted = _expression_source(expr)
+    body = ast.parse(source, mode="exec").body
+    target: str | None
+    match body:
+        case [ast.Assign(targets=[ast.Name(id=target)], value=value)]:
+            pass
+        case [ast.Expr(value=value)]:
+            target = None
+        case _:
+            msg = f"Expected a single expression or assignment: {expr!r}"
+            raise ValueError(msg)
+    allowed = tuple(getattr(ast, name) for name in _EXPRESSION_NODES)
+    unsupported = [type(node).__name__ for node in ast.walk(value) if not isinstance(node, allowed)]
+    if unsupported:
+        msg = f"Unsupported expression: {unsupported[0]} in {expr!r}"
+        raise ValueError(msg)
+
+    names = sorted({node.id for node in ast.walk(value) if isinstance(node, ast.Name)})
+    references: list[tuple[str, Any]] = []
+    for name in names:
+        if name.startswith(_BACKTICK_PREFIX):
+            references.append(("column", quoted[int(name.removeprefix(_BACKTICK_PREFIX))]))
+        elif name.startswith(_LOCAL_PREFIX):
+            references.append(("variable", name.removeprefix(_LOCAL_PREFIX)))
+        else:
+            references.append(("name", name))
+    # The identifiers are replaced by generated ones, so that names in the expression (eg: a variable
+    # called `zip`) can't clash with the parameters and helpers of the compiled function
+    generated = {name: f"{_NAME_PREFIX}{i}" for i, name in enumerate(names)}
+    for node in ast.walk(value):
+        if isinstance(node, ast.Name):
+            node.id = generated[node.id]
+    return _Expression(value, tuple(names), tuple(references), target)
+
+
+def _loop_function(value: ast.expr, params: list[str], loop: list[tuple[str, str]]) -> Callable[..., list[Any]]:
+    # Compiles `lambda <params>: [<value> for (name0, name1, ...) in zip(param0, param1, ...)]`, with
+    # `loop` pairing each loop name with the parameter it iterates. Parameters that are not iterated
+    # are bound once for the whole loop.
+    iters: list[ast.expr] = [ast.Name(param, ast.Load()) for _, param in loop]
+    match loop:
+        case []:
+            result: ast.expr = ast.List([value], ast.Load())
+        case [(name, _)]:
+            result = ast.ListComp(value, [ast.comprehension(ast.Name(name, ast.Store()), iters[0], ifs=[], is_async=0)])
+        case _:
+            loop_target = ast.Tuple([ast.Name(name, ast.Store()) for name, _ in loop], ast.Store())
+            loop_iter = ast.Call(ast.Name("__zip", ast.Load()), iters, [])
+            result = ast.ListComp(value, [ast.comprehension(loop_target, loop_iter, ifs=[], is_async=0)])
+    arguments = ast.arguments(
+        posonlyargs=[], args=[ast.arg(p) for p in params], kwonlyargs=[], kw_defaults=[], defaults=[]
+    )
+    code = compile(ast.fix_missing_locations(ast.Expression(ast.Lambda(arguments, result))), "<expression>", "eval")
+    # Only operators, names, literals and the functions below get here, and the names are all bound by the
+    # lambda or the loop. Expressions and plans only use generated names, so none of them shadows `__zip`.
+    return eval(code, {"__builtins__": {}, "__zip": zip, "abs": abs, "divmod": divmod, "_invert": _invert})  # noqa: S307
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_expression(expr: str, columns: tuple[bool, ...]) -> Callable[..., list[Any]]:
+    """
+    Compiles a parsed expression into a function that evaluates it in a single list comprehension
+    over the columns it uses. The function takes one argument per name: the values of a column where
+    `columns` is True and a variable otherwise, which is bound once instead of being repeated for
+    every row. Compiled expressions are cached by string.
+    """
+    parsed = _parse_expression(expr)
+    names = [f"{_NAME_PREFIX}{i}" for i in range(len(parsed.names))]
+    params = [f"__values_{i}" if column else name for i, (name, column) in enumerate(zip(names, columns))]
+    loop = [(name, param) for name, param, column in zip(names, params, columns) if column]
+    return _loop_function(parsed.value, params, loop)
+
+
+# Names of the ast nodes of each operator
+_PLAN_BINARY: dict[str, str] = {
+    "__add__": "Add",
+    "__sub__": "Sub",
+    "__mul__": "Mult",
+    "__truediv__": "Div",
+    "__floordiv__": "FloorDiv",
+    "__mod__": "Mod",
+    "__pow__": "Pow",
+    "__lshift__": "LShift",
+    "__rshift__": "RShift",
+    "__and__": "BitAnd",
+    "__xor__": "BitXor",
+    "__or__": "BitOr",
+}
+_PLAN_COMPARE: dict[str, str] = {
+    "__lt__": "Lt",
+    "__le__": "LtE",
+    "__eq__": "Eq",
+    "__ne__": "NotEq",
+    "__gt__": "Gt",
+    "__ge__": "GtE",
+}
+_PLAN_UNARY: dict[str, str] = {"__neg__": "USub", "__pos__": "UAdd"}
+_PLAN_BOOLEAN = ("__and__", "__xor__", "__or__", "__invert__")
+
+
+def _invert(value: Any) -> Any:
+    # Like Array.__invert__, booleans are negated instead of bitwise inverted
+    return not value if value is True or value is False else ~value
+
+
+def _plan_key(plan: tuple, columns: list[list[Array]], values: list[list[Any]]) -> tuple:
+    # Replaces the leaves of a LazyFrame plan by their position in `columns` (values that change row by
+    # row) and `values` (one value per column), so that the plan can be compiled and cached. Columns
+    # used more than once, eg: `df.lazy() * df`, are only iterated once.
+    match plan:
+        case ("column", arrays):
+            for i, known in enumerate(columns):
+                if all(a is b for a, b in zip(known, arrays)):
+                    return ("column", i)
+            columns.append(arrays)
+            return ("column", len(columns) - 1)
+        case ("value", per_column):
+            values.append(per_column)
+            return ("value", len(values) - 1)
+        case (op, *children):
+            return (op, *[_plan_key(child, columns, values) for child in children])
+    msg = f"Invalid plan: {plan!r}"  # no cover
+    raise ValueError(msg)  # no cover
+
+
+def _plan_expression(key: tuple) -> ast.expr:
+    # Builds the expression that computes one cell of a plan key, with `x<i>` the value of the i-th
+    # column in the current row and `v<i>` the i-th value of the current column
+    match key:
+        case ("column", int(i)):
+            return ast.Name(f"x{i}", ast.Load())
+        case ("value", int(i)):
+            return ast.Name(f"v{i}", ast.Load())
+        case ("__abs__" | "__invert__" as op, operand):
+            func = "abs" if op == "__abs__" else "_invert"
+            return ast.Call(ast.Name(func, ast.Load()), [_plan_expression(operand)], [])
+        case (op, operand):
+            return ast.UnaryOp(getattr(ast, _PLAN_UNARY[op])(), _plan_expression(operand))
+        case ("__divmod__", left, right):
+            return ast.Call(ast.Name("divmod", ast.Load()), [_plan_expression(left), _plan_expression(right)], [])
+        case (op, left, right) if op in _PLAN_COMPARE:
+            return ast.Compare(_plan_expression(left), [getattr(ast, _PLAN_COMPARE[op])()], [_plan_expression(right)])
+        case (op, left, right):
+            return ast.BinOp(_plan_expression(left), getattr(ast, _PLAN_BINARY[op])(), _plan_expression(right))
+    msg = f"Invalid plan: {key!r}"  # no cover
+    raise ValueError(msg)  # no cover
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_plan(key: tuple, columns: int, values: int) -> Callable[..., list[Any]]:
+    """
+    Compiles a LazyFrame plan key into a function that computes one column of the result in a single
+    list comprehension. The function takes the `columns` Arrays that change row by row followed by the
+    `values` that are constant within the column. Compiled plans are cached by key.
+    """
+    params = [f"c{i}" for i in range(columns)] + [f"v{i}" for i in range(values)]
+    return _loop_function(_plan_expression(key), params, [(f"x{i}", f"c{i}") for i in range(columns)])
+
+
+_DESCRIBE_INDEX = ("count", "mean", "std", "min", "25%", "50%", "75%", "max")
+
+
+def _describe(values: Iterable[Any]) -> list[Any]:
+    stats = _Stats.of(values)
+    if stats.n > 0 and stats.kind is None:
+        bad = next(x for x in stats.values if isinstance(x, bool) or not isinstance(x, int | float))
+        msg = f"Quantiles require numeric values, got {type(bad).__name__!r}"
+        raise TypeError(msg)
+    # The values are already in memory, so the quartiles are exact. The sort runs in C, which is
+    # faster than summarizing them with a quantile sketch in Python.
+    qs = (0.25, 0.5, 0.75)
+    quartiles = _interpolate(sorted(stats.values), qs) if stats.n > 0 else [None for _ in qs]
+    mean = stats.mean() if stats.n > 0 else None
+    std = stats.std() if stats.n > 1 else None
+    return [stats.n, mean, std, stats.minimum, *quartiles, stats.maximum]
 
 
 ###########################################################################
@@ -822,22 +1749,59 @@ class Array(UserList):
 ###########################################################################
 class Index(Array):
     name: Scalar | None
-    _rev_index: dict[Scalar, list[int]]
-    __slots__ = ("name", "_rev_index")
+    _rev_index_cache: dict[Scalar, list[int]] | None
+    _monotonic_cache: bool | None
+    __slots__ = ("name", "_rev_index_cache", "_monotonic_cache")
+
+    def __new__(cls, data: Index | ArrayLike | Iterator | None = None, name: Scalar | None = None):  # noqa: ARG004
+        # Like pandas, integer ranges build a RangeIndex
+        if cls is Index and isinstance(data, range | RangeIndex):
+            return super().__new__(RangeIndex)
+        return super().__new__(cls)
 
     def __init__(self, data: Index | ArrayLike | Iterator, name: Scalar | None = None):
         self.name = name
+        if isinstance(data, Index) and name is None:
+            self.name = data.name
+        # Indexes hold labels, so they are always untyped. Labels are never mutated, so copies of an
+        # Index share them.
         if isinstance(data, Index):
-            super().__init__(data.data)
-            if name is None:
-                self.name = data.name
+            self.data = data.data
         else:
-            super().__init__(data)
+            super().__init__(data.data if isinstance(data, Array) else data)
+        # Copies of an Index hold the same labels, so they can share its lookup map and sortedness
+        self._rev_index_cache = data._rev_index_cache if isinstance(data, Index) else None  # noqa: SLF001
+        self._monotonic_cache = data._monotonic_cache if isinstance(data, Index) else None  # noqa: SLF001
+
+    @property
+    def _rev_index(self) -> dict[Scalar, list[int]]:
+        # The label -> positions map is built on the first label lookup, so indexes that are only
+        # used positionally (slices, results of aligned operations, rows) never hash their labels
+        if self._rev_index_cache is None:
+            rev_index = defaultdict(list)
+            for i, d in enumerate(self.data):
+                rev_index[d].append(i)
+            self._rev_index_cache = dict(rev_index)
+        return self._rev_index_cache
+
+    def memory_usage(self, *, deep: bool = False) -> int:
+        """
+        Returns the memory used by the Index in bytes: the labels (see `Array.memory_usage`) and, once
+        a label lookup built it, the label -> positions dict with its lists of positions.
+
+        Args:
+            deep (bool, optional): If True, also counts the label and position objects. Defaults to False.
 
-        _rev_index = defaultdict(list)
-        for i, d in enumerate(self.data):
-            _rev_index[d].append(i)
-        self._rev_index = dict(_rev_index)
+        Returns:
+            int: The memory usage in bytes.
+        """
+        size = super().memory_usage(deep=deep)
+        if self._rev_index_cache is not None:
+            size += sys.getsizeof(self._rev_index_cache)
+            size += sum(map(sys.getsizeof, self._rev_index_cache.values()))
+            if deep:
+                size += _sizeof_objects(itertools.chain.from_iterable(self._rev_index_cache.values()))
+        return size
 
     def __repr__(self) -> str:
         match self.name:
@@ -854,6 +1818,9 @@ class Index(Array):
         msg = "Index does not support mutable operations"
         raise TypeError(msg)
 
+    # Labels may be shared between indexes, so list mutations are refused like item assignment
+    append = extend = insert = pop = remove = reverse = sort = clear = __setitem__  # type: ignore
+
     @property
     def values(self) -> list[Any]:
         """
@@ -862,22 +1829,79 @@ class Index(Array):
         Returns:
             list: The values of the Index.
         """
-        return self.data
+        return self.data  # type: ignore
+
+    @property
+    def is_monotonic_increasing(self) -> bool:
+        """
+        Returns True if the labels are sorted in increasing order. It is computed once and cached.
+
+        Returns:
+            bool: True if the labels are sorted, False otherwise or if they cannot be compared.
+        """
+        if self._monotonic_cache is None:
+            try:
+                self._monotonic_cache = all(a <= b for a, b in itertools.pairwise(self.data))
+            except TypeError:
+                self._monotonic_cache = False
+        return self._monotonic_cache
+
+    def searchsorted(self, value: Scalar, side: Literal["left", "right"] = "left") -> int:
+        """
+        Finds by binary search the position where `value` would be inserted to keep the Index sorted.
+
+        Args:
+            value (Scalar): The label to search for.
+            side (Literal["left", "right"], optional): "left" returns the first suitable position and
+                "right" the last one. Defaults to "left".
+
+        Returns:
+            int: The insertion position.
+        """
+        search = bisect.bisect_right if side == "right" else bisect.bisect_left
+        return search(self.data, value)
+
+    def slice_locs(self, start: Scalar | None = None, end: Scalar | None = None) -> tuple[int, int]:
+        """
+        Computes the positions of a label slice, which includes both `start` and `end` like `loc`.
+
+        Sorted indexes are searched in O(log n) and the labels do not need to be present. Otherwise
+        the slice goes from the first occurrence of `start` to the last occurrence of `end`.
+
+        Args:
+            start (Scalar, optional): First label of the slice. Defaults to the beginning of the Index.
+            end (Scalar, optional): Last label of the slice. Defaults to the end of the Index.
+
+        Returns:
+            tuple[int, int]: Start and stop positions of the slice.
+
+        Raises:
+            KeyError: If the Index is not sorted and a label is missing.
+        """
+        if self.is_monotonic_increasing:
+            lo = 0 if start is None else self.searchsorted(start, "left")
+            hi = len(self) if end is None else self.searchsorted(end, "right")
+        else:
+            lo = 0 if start is None else self._lookup(start)[0]
+            hi = len(self) if end is None else self._lookup(end)[-1] + 1
+        return lo, hi
 
     def get_ilocs(self, key: LocIndexes) -> int | list[int]:
         match key:
             case Series():
-                if _is_boolean_mask(key.values):
-                    return [i for i, v in enumerate(key) if v]
-                return [index for label in key.values for index in self._rev_index[label]]
+                if _is_boolean_mask(key._data):  # noqa: SLF001
+                    return list(itertools.compress(range(len(key)), key._data))  # noqa: SLF001
+                return [index for label in key._data for index in self._lookup(label)]  # noqa: SLF001
             case Array() | list():
                 if _is_boolean_mask(key):
-                    return [i for i, v in enumerate(key) if v]
-                return [index for label in key for index in self._rev_index[label]]
+                    return list(itertools.compress(range(len(key)), key))
+                return [index for label in key for index in self._lookup(label)]
+            case slice() if _is_label_slice(key):
+                return list(range(*self.slice_locs(key.start, key.stop)))[:: key.step]
             case slice():
                 return list(range(len(self)))[key]
             case k if _is_scalar(k):
-                match self._rev_index[key]:
+                match self._lookup(key):
                     case [i]:
                         return i
                     case m:
@@ -886,6 +1910,177 @@ class Index(Array):
                 msg = f"Cannot index with: {key=}"
                 raise KeyError(msg)
 
+    def __contains__(self, label: Any) -> bool:
+        return label in self._rev_index
+
+    def _lookup(self, label: Scalar) -> list[int]:
+        return self._rev_index[label]
+
+    def _equals(self, other: Index) -> bool:
+        return other is self or other.data == self.data
+
+    def _extend(self, labels: Sequence[Any]):
+        # Appends labels in place, keeping the caches up to date instead of dropping them. Only for
+        # indexes that are not shared with anyone else (see `Series._append_labels`).
+        start = len(self.data)
+        self.data.extend(labels)
+        if self._rev_index_cache is not None:
+            for i, label in enumerate(labels, start):
+                self._rev_index_cache.setdefault(label, []).append(i)
+        if self._monotonic_cache:
+            try:
+                self._monotonic_cache = all(a <= b for a, b in itertools.pairwise(self.data[max(start - 1, 0) :]))
+            except TypeError:
+                self._monotonic_cache = False
+
+    def _take_aligned(self, other: Index, values: Array) -> Array:
+        # Reorders `values`, labeled by `other`, into the label order of this Index. Repeated labels
+        # are matched in order of appearance.
+        if self._equals(other):
+            return values
+        cursors = {label: iter(ilocs) for label, ilocs in other._rev_index.items()}
+        try:
+            return Array([values.data[next(cursors[label])] for label in self.data])
+        except (KeyError, StopIteration):
+            msg = "Indexes do not match"
+            raise ValueError(msg) from None
+
+
+class RangeIndex(Index):
+    """
+    Immutable Index of evenly spaced integers that stores only start, stop and step.
+
+    Lookups and slices are computed from the range. The labels are materialized into a list
+    only when they are requested as a list, eg: through `values`.
+    """
+
+    _range: range
+    _materialized: list[int] | None
+    __slots__ = ("_materialized", "_range")
+
+    def __init__(self, data: range | RangeIndex | int = 0, name: Scalar | None = None):
+        """
+        Initializes a RangeIndex object.
+
+        Args:
+            data (range | RangeIndex | int, optional): The range of labels. An int `n` means `range(n)`. Defaults to 0.
+            name (Scalar, optional): Name of the index. Defaults to the name of `data` if it is a RangeIndex.
+        """
+        match data:
+            case RangeIndex():
+                self._range = data._range  # noqa: SLF001
+                name = data.name if name is None else name
+            case range():
+                self._range = data
+            case int():
+                self._range = range(data)
+            case _:
+                msg = f"RangeIndex requires a range or an int, got {type(data)=}"
+                raise TypeError(msg)
+        self.name = name
+        self._materialized = None
+        self._rev_index_cache = None
+
+    @property
+    def data(self) -> list[int]:  # type: ignore
+        if self._materialized is None:
+            self._materialized = list(self._range)
+        return self._materialized
+
+    @data.setter
+    def data(self, _value: Any):
+        msg = "Index does not support mutable operations"
+        raise TypeError(msg)
+
+    def __copy__(self) -> RangeIndex:
+        # UserList.__copy__ writes to `data` through __dict__, but here it is a property over the range
+        return RangeIndex(self._range, name=self.name)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> RangeIndex:
+        return RangeIndex(self._range, name=copy.deepcopy(self.name, memo))
+
+    def memory_usage(self, *, deep: bool = False) -> int:
+        # Only the range, unless the labels were materialized
+        size = sys.getsizeof(self) + sys.getsizeof(self._range)
+        if self._materialized is not None:
+            size += sys.getsizeof(self._materialized)
+            if deep:
+                size += _sizeof_objects(self._materialized)
+        return size
+
+    @property
+    def start(self) -> int:
+        return self._range.start
+
+    @property
+    def stop(self) -> int:
+        return self._range.stop
+
+    @property
+    def step(self) -> int:
+        return self._range.step
+
+    def __repr__(self) -> str:
+        args = f"start={self.start}, stop={self.stop}, step={self.step}"
+        if self.name is None:
+            return f"{self.__class__.__name__}({args})"
+        return f'{self.__class__.__name__}({args}, name="{self.name!s}")'
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._range)
+
+    def __contains__(self, label: Any) -> bool:
+        return self._position(label) is not None
+
+    @overload  # type: ignore
+    def __getitem__(self, key: int) -> int: ...  # no cov
+    @overload
+    def __getitem__(self, key: slice | list[int] | Array) -> Array: ...  # no cov
+    def __getitem__(self, key: int | slice | list[int] | Array) -> int | Array:  # type: ignore
+        match key:
+            case int():
+                return self._range[key]
+            case slice():
+                return RangeIndex(self._range[key])
+            case _:
+                return super().__getitem__(key)
+
+    @property
+    def dtype(self) -> None:
+        return None
+
+    @property
+    def is_monotonic_increasing(self) -> bool:
+        return self.step > 0 or len(self) <= 1
+
+    def searchsorted(self, value: Scalar, side: Literal["left", "right"] = "left") -> int:
+        if self.step < 0:
+            return super().searchsorted(value, side)
+        # Ranges are sequences, so they can be searched without materializing the labels
+        search = bisect.bisect_right if side == "right" else bisect.bisect_left
+        return search(self._range, value)  # type: ignore
+
+    def _position(self, label: Any) -> int | None:
+        # `range` falls back to a linear scan for anything but ints, so other labels are normalized first
+        if isinstance(label, float) and label.is_integer():
+            label = int(label)
+        if not isinstance(label, int) or label not in self._range:
+            return None
+        return (label - self.start) // self.step
+
+    def _lookup(self, label: Scalar) -> list[int]:
+        if (position := self._position(label)) is None:
+            raise KeyError(label)
+        return [position]
+
+    def _equals(self, other: Index) -> bool:
+        if isinstance(other, RangeIndex):
+            return other._range == self._range  # noqa: SLF001
+        return super()._equals(other)
+
 
 class BaseIndexer(Generic[T]):
     frame: T
@@ -896,23 +2091,18 @@ class BaseIndexer(Generic[T]):
 
 class LocSeriesIndexer(BaseIndexer["Series"]):
     def __getitem__(self, key: LocIndexes) -> Scalar | Series:
+        if isinstance(key, Series | Array | list) and _is_boolean_mask(mask := _mask_values(key)):
+            return self.frame._filter(mask)  # noqa: SLF001
         return self.frame.iloc[self.frame.index.get_ilocs(key)]
 
     def __setitem__(self, key: LocIndexes, value: Scalar | ArrayLike | Mapping | Series):
-        if _is_scalar(key) and key not in self.frame.index:
+        if _is_scalar(key) and key not in self.frame._index:  # noqa: SLF001
             self.frame._inplace_append({key: value})  # noqa: SLF001
         else:
             self.frame.iloc[self.frame.index.get_ilocs(key)] = value
 
     def __delitem__(self, key: LocIndexes):
-        idxs = self.frame.index.get_ilocs(key)
-        ilocs: list[int] = [idxs] if isinstance(idxs, int) else idxs
-        new_data = list(self.frame.values)
-        new_index = list(self.frame.index)
-        for iloc in sorted(ilocs, reverse=True):
-            del new_data[iloc]
-            del new_index[iloc]
-        self.frame._copy_from(Series(new_data, index=new_index, name=self.frame.name))  # noqa: SLF001
+        self.frame._delete(self.frame._index.get_ilocs(key))  # noqa: SLF001
 
 
 class IlocSeriesIndexer(BaseIndexer["Series"]):
@@ -922,30 +2112,31 @@ class IlocSeriesIndexer(BaseIndexer["Series"]):
     def __getitem__(self, key: list[int] | slice | Series) -> Series: ...  # no cov
     def __getitem__(self, key: IlocIndexes) -> Scalar | Series:
         if isinstance(key, Series):
-            key = key.values
+            key = key._data  # noqa: SLF001
         match key:
             case Array() | list() | slice():
-                return Series(self.frame.values[key], index=self.frame.index[key])
+                return Series(self.frame._data[key], index=self.frame.index[key])  # noqa: SLF001
             case k if isinstance(k, int):
-                return self.frame.values[key]
+                return self.frame._data[key]  # noqa: SLF001
             case _:
                 msg = f"Cannot index with: {key=}"
                 raise KeyError(msg)
 
     def __setitem__(self, key: IlocIndexes, value: Scalar | ArrayLike | Mapping | Series):
         if isinstance(key, Series):
-            key = key.values
+            key = key._data  # noqa: SLF001
         match value:
             case Series():
-                value = value.values
+                value = value._data  # noqa: SLF001
             case Mapping():
                 value = list(value.values())
 
+        self.frame._ensure_writable()  # noqa: SLF001
         match key:
             case Array() | list() | slice() as k:
-                self.frame.values[k] = value
+                self.frame._data[k] = value  # noqa: SLF001
             case k if _is_scalar(k):
-                self.frame.values[k] = value
+                self.frame._data[k] = value  # noqa: SLF001
             case _:
                 msg = f"Cannot index with: {key=}"
                 raise KeyError(msg)
@@ -956,13 +2147,22 @@ class LocDataFrameIndexer(BaseIndexer["DataFrame"]):
         match key:
             case tuple([row_indexer, col_indexer]):
                 return self.frame.iloc[
-                    self.frame.index.get_ilocs(row_indexer), self.frame.columns.get_ilocs(col_indexer)
+                    self._get_ilocs(self.frame.index, row_indexer), self._get_ilocs(self.frame.columns, col_indexer)
                 ]
             case tuple([_, *_]):
                 msg = f"{key!s}"
                 raise KeyError(msg)
+            case Series() | Array() | list() as indexer if _is_boolean_mask(mask := _mask_values(indexer)):
+                return self.frame._filter(mask)  # noqa: SLF001
             case indexer:
-                return self.frame.iloc[self.frame.index.get_ilocs(indexer)]
+                return self.frame.iloc[self._get_ilocs(self.frame.index, indexer)]
+
+    @staticmethod
+    def _get_ilocs(index: Index, key: LocIndexes) -> int | list[int] | slice:
+        # Slices are handed to iloc as slices, label bounds being converted to positions first
+        if isinstance(key, slice):
+            return slice(*index.slice_locs(key.start, key.stop), key.step) if _is_label_slice(key) else key
+        return index.get_ilocs(key)
 
 
 class IlocDataFrameIndexer(BaseIndexer["DataFrame"]):
@@ -986,29 +2186,32 @@ class IlocDataFrameIndexer(BaseIndexer["DataFrame"]):
                 col_indexer = slice(None, None, None)
 
         if isinstance(row_indexer, Series):
-            row_indexer = row_indexer.values
+            row_indexer = row_indexer._data  # noqa: SLF001
         if isinstance(col_indexer, Series):
-            col_indexer = col_indexer.values
+            col_indexer = col_indexer._data  # noqa: SLF001
 
+        columns = self.frame._data  # noqa: SLF001
         match (row_indexer, col_indexer):
             case (Array() | list() | slice(), Array() | list() | slice()):
-                return DataFrame(
-                    [row[col_indexer] for row in self.frame.values[row_indexer]],
-                    index=self.frame.index[row_indexer],
-                    columns=self.frame.columns[col_indexer],
+                return DataFrame._from_aligned(  # noqa: SLF001
+                    Array([col[row_indexer] for col in columns[col_indexer]]),
+                    index=Index(self.frame.index[row_indexer], name=self.frame.index.name),
+                    columns=Index(self.frame.columns[col_indexer]),
                 )
             case (r, Array() | list() | slice()) if isinstance(r, int):
-                rows = self.frame.values[r]
-                if len(rows) == 0:
-                    return Series([], name=self.frame.index[r])
-                return Series(rows[col_indexer], index=self.frame.columns[col_indexer], name=self.frame.index[r])
+                name = self.frame.index[r]
+                return Series(
+                    [col.data[r] for col in columns[col_indexer]], index=self.frame.columns[col_indexer], name=name
+                )
             case (Array() | list() | slice(), c) if isinstance(c, int):
-                rows = self.frame.values[row_indexer]
-                if len(rows) == 0:
-                    return Series([], name=self.frame.columns[c])
-                return Series([row[c] for row in rows], index=self.frame.index[row_indexer], name=self.frame.columns[c])
+                column = cast(Array, columns[c])
+                return Series._from_aligned(  # noqa: SLF001
+                    column[row_indexer],
+                    index=Index(self.frame.index[row_indexer], name=self.frame.index.name),
+                    name=self.frame.columns[c],
+                )
             case (r, c) if isinstance(r, int) and isinstance(c, int):
-                return self.frame.values[r][c]
+                return cast(Array, columns[c]).data[r]
             case _:
                 msg = f"Cannot index with: {row_indexer=}, {col_indexer=}"
                 raise KeyError(msg)
@@ -1030,7 +2233,9 @@ class Series(Sequence, Sized):
     _index: Index
     loc: LocSeriesIndexer
     iloc: IlocSeriesIndexer
-    __slots__ = ("name", "_data", "_index", "loc", "iloc")
+    _shared: bool
+    _index_owned: bool
+    __slots__ = ("name", "_data", "_index", "_shared", "_index_owned", "loc", "iloc")
 
     ###########################################################################
     # Initializer and general methods
@@ -1053,12 +2258,15 @@ class Series(Sequence, Sized):
             ValueError: If the length of data and index don't match, or if data type is unexpected.
         """
         if isinstance(data, Series):
+            self.name = data.name if name is None else name
             self._copy_from(data)
             return
         self.name = name
         array_index, array_data = self._normalize_data(data)
         self._data = array_data
         self._index = self._validate_index(array_index, index)
+        self._shared = False
+        self._index_owned = False
         self._set_indexers()
 
     @staticmethod
@@ -1069,9 +2277,9 @@ class Series(Sequence, Sized):
             case Mapping():
                 return list(data.keys()), Array(data.values())
             case ArrayLike():
-                return list(range(len(data))), Array(data)
+                return RangeIndex(len(data)), Array(data)
             case d if _is_scalar(d):
-                return [0], Array([data])
+                return RangeIndex(1), Array([data])
             case _:
                 msg = f"Unexpected data type: {type(data)=}"
                 raise ValueError(msg)
@@ -1082,10 +2290,11 @@ class Series(Sequence, Sized):
             case None:
                 return Index(array_index)
             case _:
-                if len(array_index) != len(list(index)):
-                    msg = f"Length of values ({len(array_index)}) does not match length of index ({len(list(index))})"
+                index = Index(index)
+                if len(array_index) != len(index):
+                    msg = f"Length of values ({len(array_index)}) does not match length of index ({len(index)})"
                     raise ValueError(msg)
-                return Index(index)
+                return index
 
     def _set_indexers(self):
         self.loc = LocSeriesIndexer(self)
@@ -1095,10 +2304,10 @@ class Series(Sequence, Sized):
         return len(self._data)
 
     def __iter__(self) -> Iterator:
-        return iter(self.values)
+        return iter(self._data)
 
     def __repr__(self) -> str:
-        match self.values, self.name:
+        match self._data, self.name:
             case [[], None]:
                 return f"{self.__class__.__name__}([])"
             case [[], name]:
@@ -1107,7 +2316,7 @@ class Series(Sequence, Sized):
                 return self._repr_not_empty()
 
     def _repr_not_empty(self) -> str:
-        columns = [self.index, self.values]
+        columns = [self.index, self._data]
         widths = [max([len(str(v)) for v in col]) for col in columns]
         height = len(columns[0])
         ret = [[f"{col[i]!s:>{width}}" for col, width in zip(columns, widths)] for i in range(height)]
@@ -1117,17 +2326,51 @@ class Series(Sequence, Sized):
         """
         Creates a copy of the Series.
 
+        Deep copies are copy-on-write: they share the values and index labels with the original until
+        either of them is modified, so copying is O(1). The values themselves are not copied recursively.
+
         Args:
-            deep (bool, optional): If True, creates a deep copy. Otherwise, creates a shallow copy. Defaults to True.
+            deep (bool, optional): If True, creates a deep copy. Otherwise, creates a shallow copy that
+                keeps sharing the values with the original. Defaults to True.
 
         Returns:
             Series: A copy of the Series.
         """
-        clone = copy.deepcopy(self) if deep else copy.copy(self)
-        clone.name = self.name
-        clone._set_indexers()  # noqa: SLF001
+        # Deep copies get their own Index object, which shares the labels, so renaming it is isolated
+        clone = Series._from_aligned(self._data, Index(self._index) if deep else self._index, self.name)
+        if deep:
+            self._shared = True
+        clone._shared = self._shared  # noqa: SLF001
+        self._index_owned = False
         return clone
 
+    def memory_usage(self, index: bool = True, *, deep: bool = False) -> int:  # noqa: FBT001, FBT002
+        """
+        Returns the memory used by the Series in bytes. See `Array.memory_usage` and
+        `Index.memory_usage` for what is counted.
+
+        Values and indexes shared with other objects (eg: copies) are counted in full by each of them.
+
+        Args:
+            index (bool, optional): Whether to count the index. Defaults to True.
+            deep (bool, optional): If True, also counts the objects the values and labels point to.
+                Defaults to False.
+
+        Returns:
+            int: The memory usage in bytes.
+        """
+        size = self._data.memory_usage(deep=deep)
+        if index:
+            size += self._index.memory_usage(deep=deep)
+        return size
+
+    def _ensure_writable(self):
+        # Copy-on-write: a Series that shares its values copies them before the first modification.
+        # Masks are copied into plain Arrays, so that any value can be written.
+        if self._shared or isinstance(self._data, Mask):
+            self._data = _writable_copy(self._data)
+            self._shared = False
+
     def rename(self, name: Scalar) -> Series:
         """
         Renames the Series.
@@ -1150,6 +2393,8 @@ class Series(Sequence, Sized):
         Returns:
             IndexLike: The index of the Series.
         """
+        # Once handed out, the index may be shared, so appends stop extending it in place
+        self._index_owned = False
         return self._index
 
     @index.setter
@@ -1169,6 +2414,7 @@ class Series(Sequence, Sized):
             msg = f"Length mismatch: Expected axis has {len(self)} elements, new values have {len(index)} elements"
             raise ValueError(msg)
         self._index = Index(index)
+        self._index_owned = False
 
     def reindex(self, index: Index | IndexLike | Iterator) -> Series:
         """
@@ -1194,8 +2440,9 @@ class Series(Sequence, Sized):
         Returns:
             Series: A new series with the removed values
         """
-        clone = self.copy(deep=True)
-        del clone[indexes]
+        # The clone gets new buffers from `_delete`, so it can start out sharing the current ones
+        clone = Series._from_aligned(self._data, self._index, self.name)
+        clone._delete(self._index.get_ilocs(indexes))  # noqa: SLF001
         return clone
 
     @property
@@ -1203,9 +2450,13 @@ class Series(Sequence, Sized):
         """
         Return a list representation of the Series.
 
+        The values can be modified in place. Values shared with a copy of the Series are copied
+        first, so changes never leak into the copy.
+
         Returns:
             list: The values of the Series.
         """
+        self._ensure_writable()
         return self._data
 
     @property
@@ -1284,7 +2535,7 @@ class Series(Sequence, Sized):
             int | None: The integer position (index) of the first occurrence of the value,
                         or None if the value is not found.
         """
-        for i, v in enumerate(self.values):
+        for i, v in enumerate(self._data):
             if v == val:
                 return i
         return None
@@ -1312,29 +2563,64 @@ class Series(Sequence, Sized):
     # Merge/Concatenate
     ###########################################################################
     def _copy_from(self, other: Series):
-        self._data = other.values.copy()
-        self._index = other.index.copy()
+        other._shared = True
+        other._index_owned = False
+        self._data = other._data
+        self._index = Index(other._index)
+        self._shared = True
+        self._index_owned = False
         self._set_indexers()
 
     def _inplace_append(self, other: Series | Mapping):
-        new_series: Series
+        # Extends the values and the index in place, so appending one item at a time is amortized O(1)
         match other:
             case Series():
-                duplicate_index = set(self.index) & set(other.index)
-                if len(duplicate_index) > 0:
-                    msg = f"Cannot append with duplicate indexes: {duplicate_index}"
-                    raise ValueError(msg)
-                new_series = Series(self.to_dict() | other.to_dict(), name=self.name)
+                labels, values = list(other._index), other._data.data  # noqa: SLF001
             case Mapping():
-                duplicate_index = set(self.index) & set(other.keys())
-                if len(duplicate_index) > 0:
-                    msg = f"Cannot append with duplicate indexes: {duplicate_index}"
-                    raise ValueError(msg)
-                new_series = Series(self.to_dict() | dict(other), name=self.name)
+                labels, values = list(other.keys()), list(other.values())
             case _:
                 msg = f"Cannot append with: {other=}"
                 raise ValueError(msg)
-        self._copy_from(new_series)
+        duplicate_index = {label for label in labels if label in self._index}
+        if len(duplicate_index) > 0:
+            msg = f"Cannot append with duplicate indexes: {duplicate_index}"
+            raise ValueError(msg)
+        self._ensure_writable()
+        if self._data.dtype is not None:
+            try:
+                values = array.array(self._data.dtype, values)
+            except (TypeError, OverflowError):
+                self._data = Array(self._data.to_list())
+        self._data.data.extend(values)  # type: ignore
+        self._append_labels(labels)
+
+    def _filter(self, mask: BooleanMask) -> Series:
+        # Gathers the selected values and labels in a single pass each
+        _validate_mask_length(mask, len(self))
+        index = Index(itertools.compress(self._index, mask), name=self._index.name)
+        return Series._from_aligned(_compress(self._data, mask), index, self.name)
+
+    def _delete(self, positions: int | list[int]):
+        # Compacts the values and the index with a single keep mask instead of deleting one by one
+        keep = _keep_mask(len(self), positions)
+        self._data = _compress(self._data, keep)
+        self._index = Index(itertools.compress(self._index, keep), name=self._index.name)
+        self._shared = False
+        self._index_owned = True
+
+    def _append_labels(self, labels: list[Any]):
+        index = self._index
+        if isinstance(index, RangeIndex):
+            r = index._range  # noqa: SLF001
+            extended = range(r.start, r.stop + len(labels) * r.step, r.step)
+            if labels == list(extended[len(r) :]):
+                self._index = RangeIndex(extended, name=index.name)
+                return
+        # The index is copied once and then extended in place for as long as nobody else holds it
+        if not self._index_owned:
+            self._index = Index(list(index), name=index.name)
+            self._index_owned = True
+        self._index._extend(labels)  # noqa: SLF001
 
     def append(self, other: Series | Mapping) -> Series:
         """
@@ -1354,10 +2640,26 @@ class Series(Sequence, Sized):
     ###########################################################################
     # Auxiliary Functions
     ###########################################################################
-    def _index_matches(self, index: Index):
-        if set(self.index) != set(index):
-            msg = "Indexes do not match"
-            raise ValueError(msg)
+    @classmethod
+    def _from_aligned(cls, data: Array, index: Index, name: Scalar | None = None) -> Series:
+        """
+        Builds a Series from `data` and `index` without copying or validating them. Both must have
+        the same length and `index` must not be mutated afterwards, since it may be shared.
+        """
+        series = cls.__new__(cls)
+        series.name = name
+        series._data = data  # noqa: SLF001
+        series._index = index  # noqa: SLF001
+        series._shared = False  # noqa: SLF001
+        series._index_owned = False  # noqa: SLF001
+        series._set_indexers()  # noqa: SLF001
+        return series
+
+    def _align(self, other: Series) -> Series:
+        data = self.index._take_aligned(other.index, other._data)  # noqa: SLF001
+        if data is other._data:
+            return other
+        return Series._from_aligned(data, self.index, other.name)
 
     @staticmethod
     def _standardize_input(method: Callable) -> Callable:
@@ -1366,12 +2668,15 @@ class Series(Sequence, Sized):
             match other:
                 case Series():
                     self._validate_length(other)
-                    self._index_matches(other.index)
+                    other = self._align(other)
+                case Mapping() as m:
+                    self._validate_length(m)
+                    other = Series._from_aligned(Array(m.values()), self.index, self.name)
                 case o if _is_array_like(o):
-                    other = Series(o, index=self.index, name=self.name)
-                    self._validate_length(other)
+                    self._validate_length(o)
+                    other = Series._from_aligned(Array(o), self.index, self.name)
                 case _ as o:
-                    other = Series(Array.full(len(self), o), index=self.index, name=self.name)  # type: ignore  # We let any type in
+                    other = Series._from_aligned(Array.full(len(self), o), self.index, self.name)  # type: ignore  # We let any type in
             return method(self, other)
 
         return wrapper
@@ -1384,17 +2689,28 @@ class Series(Sequence, Sized):
     ###########################################################################
     # Map/Reduce
     ###########################################################################
-    def map(self, func: Callable[[Scalar], Scalar]) -> Series:
+    def map(
+        self, func: Callable[[Scalar], Scalar], *, workers: int | None = None, chunksize: int | None = None
+    ) -> Series:
         """
         Applies a function to each value in the Series.
 
         Args:
             func (Callable[[Scalar], Scalar]): The function to apply.
+            workers (int, optional): Number of worker processes (threads on free-threaded builds) to
+                split the values between. With processes, `func` and the values must be picklable.
+                Series shorter than 1000 values are mapped serially. Defaults to None, which maps in
+                this process.
+            chunksize (int, optional): Number of values sent to a worker at a time. Defaults to about
+                four chunks per worker.
 
         Returns:
             Series: A new Series with the results of the function applied.
+
+        Raises:
+            TypeError: If `func` can't be pickled for worker processes.
         """
-        return Series(self._data.map(func), index=self.index, name=self.name)
+        return Series(self._data.map(func, workers=workers, chunksize=chunksize), index=self.index, name=self.name)
 
     def reduce(self, func: Callable[[Any, tuple[Scalar, Scalar]], Any], initial: Any) -> Any:
         """
@@ -1465,7 +2781,7 @@ class Series(Sequence, Sized):
             Scalar: The dot product of the Series.
         """
         other = cast(Series, other)
-        return sum(other[k] * v for k, v in self.iteritems())
+        return sum(v * o for v, o in zip(self._data, other._data))  # noqa: SLF001
 
     def max(self) -> Scalar:
         """
@@ -1561,16 +2877,126 @@ class Series(Sequence, Sized):
         return self.find(self.min())
 
     ###########################################################################
-    # Statistics
+    # GroupBy
     ###########################################################################
-    def mean(self) -> Scalar:
+    def groupby(self, by: Series | ArrayLike | Callable[[Scalar], Any], *, sort: bool = True) -> SeriesGroupBy:
         """
-        Computes the mean of the Series.
+        Groups the values by a key.
+
+        Args:
+            by (Series | ArrayLike | Callable[[Scalar], Any]): The group keys. A Series is aligned
+                by label, a collection is matched by position and a callable is applied to each
+                index label.
+            sort (bool, optional): Sort the group keys. Defaults to True.
+
+        Returns:
+            SeriesGroupBy: The grouped Series.
+        """
+        match by:
+            case Series():
+                return SeriesGroupBy(self, _Grouper(self.index._take_aligned(by.index, by._data), by.name, sort=sort))  # noqa: SLF001
+            case f if callable(f):
+                return SeriesGroupBy(self, _Grouper(map(f, self.index), None, sort=sort))
+            case keys if len(keys) != len(self):
+                msg = f"Length of keys ({len(keys)}) does not match length of Series ({len(self)})"
+                raise ValueError(msg)
+            case keys:
+                return SeriesGroupBy(self, _Grouper(keys, None, sort=sort))
+
+    ###########################################################################
+    # Sorting
+    ###########################################################################
+    def _take(self, order: list[int], *, ignore_index: bool = False) -> Series:
+        index = RangeIndex(len(order)) if ignore_index else Index(self.index[order], name=self.index.name)
+        return Series._from_aligned(self._data[order], index, self.name)
+
+    def sort_values(
+        self,
+        *,
+        ascending: bool = True,
+        key: Callable[[Scalar], Any] | None = None,
+        na_position: NaPosition = "last",
+        ignore_index: bool = False,
+    ) -> Series:
+        """
+        Sorts the Series by its values. The sort is stable.
+
+        Args:
+            ascending (bool, optional): Sort in ascending order. Defaults to True.
+            key (Callable[[Scalar], Any], optional): Function applied once to each value to produce the
+                sort key, like the `key` of `sorted`. Defaults to None.
+            na_position (NaPosition, optional): Place missing values (None) "first" or "last". Defaults to "last".
+            ignore_index (bool, optional): Label the result 0, 1, ..., n - 1. Defaults to False.
+
+        Returns:
+            Series: A new sorted Series.
+        """
+        order = _argsort([self._data.data], [ascending], key, na_position)
+        return self._take(order, ignore_index=ignore_index)
+
+    def sort_index(
+        self,
+        *,
+        ascending: bool = True,
+        key: Callable[[Scalar], Any] | None = None,
+        na_position: NaPosition = "last",
+        ignore_index: bool = False,
+    ) -> Series:
+        """
+        Sorts the Series by its index labels. The sort is stable.
+
+        Args:
+            ascending (bool, optional): Sort in ascending order. Defaults to True.
+            key (Callable[[Scalar], Any], optional): Function applied once to each label to produce the
+                sort key, like the `key` of `sorted`. Defaults to None.
+            na_position (NaPosition, optional): Place missing labels (None) "first" or "last". Defaults to "last".
+            ignore_index (bool, optional): Label the result 0, 1, ..., n - 1. Defaults to False.
+
+        Returns:
+            Series: A new sorted Series.
+        """
+        order = _argsort([self.index.values], [ascending], key, na_position)
+        return self._take(order, ignore_index=ignore_index)
+
+    def nlargest(self, n: int = 5) -> Series:
+        """
+        Returns the `n` largest values in descending order, using a heap instead of a full sort.
+
+        Missing values (None) are skipped and ties keep the order in which they appear.
+
+        Args:
+            n (int, optional): Number of values to return. Defaults to 5.
+
+        Returns:
+            Series: The `n` largest values.
+        """
+        return self._take(_top_k(n, [self._data.data], largest=True))
+
+    def nsmallest(self, n: int = 5) -> Series:
+        """
+        Returns the `n` smallest values in ascending order, using a heap instead of a full sort.
+
+        Missing values (None) are skipped and ties keep the order in which they appear.
+
+        Args:
+            n (int, optional): Number of values to return. Defaults to 5.
+
+        Returns:
+            Series: The `n` smallest values.
+        """
+        return self._take(_top_k(n, [self._data.data], largest=False))
+
+    ###########################################################################
+    # Statistics
+    ###########################################################################
+    def mean(self) -> Scalar:
+        """
+        Computes the mean of the Series.
 
         Returns:
             float: Series mean
         """
-        return self.agg(statistics.mean)
+        return _Stats.of(self._data.data).mean()
 
     def median(self) -> Scalar:
         """
@@ -1610,6 +3036,8 @@ class Series(Sequence, Sized):
         Returns:
             float: Series standard deviation
         """
+        if xbar is None:
+            return _Stats.of(self._data.data).std()
         return self.agg(lambda values: statistics.stdev(values, xbar=xbar))
 
     def var(self, xbar=None) -> Scalar:
@@ -1622,8 +3050,23 @@ class Series(Sequence, Sized):
         Returns:
             float: Series variance
         """
+        if xbar is None:
+            return _Stats.of(self._data.data).var()
         return self.agg(lambda values: statistics.variance(values, xbar=xbar))
 
+    def describe(self) -> Series:
+        """
+        Generates descriptive statistics of numeric data: count, mean, standard deviation, minimum,
+        quartiles and maximum, as in pandas. Missing values (None) are skipped.
+
+        Returns:
+            Series: The statistics, labeled "count", "mean", "std", "min", "25%", "50%", "75%" and "max"
+
+        Raises:
+            TypeError: If the Series has non-numeric values.
+        """
+        return Series._from_aligned(Array(_describe(self._data.data)), Index(_DESCRIBE_INDEX), self.name)
+
     ###########################################################################
     # Exports
     ###########################################################################
@@ -1662,7 +3105,7 @@ class Series(Sequence, Sized):
             Series: A Series of boolean values indicating the result of the comparison.
         """
         other = cast(Series, other)
-        return Series({k: v < other[k] for k, v in self.iteritems()}, name=self.name)
+        return Series._from_aligned(self._data < other._data, self.index, self.name)
 
     @_standardize_input
     def __le__(self, other: Series | ArrayLike | Scalar) -> Series:
@@ -1678,7 +3121,7 @@ class Series(Sequence, Sized):
             Series: A Series of boolean values indicating the result of the comparison.
         """
         other = cast(Series, other)
-        return Series({k: v <= other[k] for k, v in self.iteritems()}, name=self.name)
+        return Series._from_aligned(self._data <= other._data, self.index, self.name)
 
     @_standardize_input
     def __eq__(self, other: Series | ArrayLike | Scalar) -> Series:  # type: ignore
@@ -1694,7 +3137,7 @@ class Series(Sequence, Sized):
             Series: A Series of boolean values indicating the result of the comparison.
         """
         other = cast(Series, other)
-        return Series({k: v == other[k] for k, v in self.iteritems()}, name=self.name)
+        return Series._from_aligned(self._data == other._data, self.index, self.name)
 
     @_standardize_input
     def __ne__(self, other: Series | ArrayLike | Scalar) -> Series:  # type: ignore
@@ -1710,7 +3153,7 @@ class Series(Sequence, Sized):
             Series: A Series of boolean values indicating the result of the comparison.
         """
         other = cast(Series, other)
-        return Series({k: v != other[k] for k, v in self.iteritems()}, name=self.name)
+        return Series._from_aligned(self._data != other._data, self.index, self.name)
 
     @_standardize_input
     def __gt__(self, other: Series | ArrayLike | Scalar) -> Series:
@@ -1726,7 +3169,7 @@ class Series(Sequence, Sized):
             Series: A Series of boolean values indicating the result of the comparison.
         """
         other = cast(Series, other)
-        return Series({k: v > other[k] for k, v in self.iteritems()}, name=self.name)
+        return Series._from_aligned(self._data > other._data, self.index, self.name)
 
     @_standardize_input
     def __ge__(self, other: Series | ArrayLike | Scalar) -> Series:
@@ -1742,7 +3185,7 @@ class Series(Sequence, Sized):
             Series: A Series of boolean values indicating the result of the comparison.
         """
         other = cast(Series, other)
-        return Series({k: v >= other[k] for k, v in self.iteritems()}, name=self.name)
+        return Series._from_aligned(self._data >= other._data, self.index, self.name)
 
     ###########################################################################
     # Operators
@@ -1759,7 +3202,7 @@ class Series(Sequence, Sized):
             Series: A Series with the results of the operation.
         """
         other = cast(Series, other)
-        return Series({k: v + other[k] for k, v in self.iteritems()}, name=self.name)
+        return Series._from_aligned(self._data + other._data, self.index, self.name)
 
     @_standardize_input
     def __sub__(self, other: Series | ArrayLike | Scalar) -> Series:
@@ -1773,7 +3216,7 @@ class Series(Sequence, Sized):
             Series: A Series with the results of the operation.
         """
         other = cast(Series, other)
-        return Series({k: v - other[k] for k, v in self.iteritems()}, name=self.name)
+        return Series._from_aligned(self._data - other._data, self.index, self.name)
 
     @_standardize_input
     def __mul__(self, other: Series | ArrayLike | Scalar) -> Series:
@@ -1787,7 +3230,7 @@ class Series(Sequence, Sized):
             Series: A Series with the results of the operation.
         """
         other = cast(Series, other)
-        return Series({k: v * other[k] for k, v in self.iteritems()}, name=self.name)
+        return Series._from_aligned(self._data * other._data, self.index, self.name)
 
     @_standardize_input
     def __matmul__(self, other: Series | ArrayLike) -> Scalar:
@@ -1817,7 +3260,7 @@ class Series(Sequence, Sized):
             Series: A Series with the results of the operation.
         """
         other = cast(Series, other)
-        return Series({k: v / other[k] for k, v in self.iteritems()}, name=self.name)
+        return Series._from_aligned(self._data / other._data, self.index, self.name)
 
     @_standardize_input
     def __floordiv__(self, other: Series | ArrayLike | Scalar) -> Series:
@@ -1831,7 +3274,7 @@ class Series(Sequence, Sized):
             Series: A Series with the results of the operation.
         """
         other = cast(Series, other)
-        return Series({k: v // other[k] for k, v in self.iteritems()}, name=self.name)
+        return Series._from_aligned(self._data // other._data, self.index, self.name)
 
     @_standardize_input
     def __mod__(self, other: Series | ArrayLike | Scalar) -> Series:
@@ -1845,7 +3288,7 @@ class Series(Sequence, Sized):
             Series: A Series with the results of the operation.
         """
         other = cast(Series, other)
-        return Series({k: v % other[k] for k, v in self.iteritems()}, name=self.name)
+        return Series._from_aligned(self._data % other._data, self.index, self.name)
 
     @_standardize_input
     def __divmod__(self, other: Series | ArrayLike | Scalar) -> Series:
@@ -1859,7 +3302,7 @@ class Series(Sequence, Sized):
             Series: A Series with the results of the operation.
         """
         other = cast(Series, other)
-        return Series({k: divmod(v, other[k]) for k, v in self.iteritems()}, name=self.name)
+        return Series._from_aligned(divmod(self._data, other._data), self.index, self.name)
 
     @_standardize_input
     def __pow__(self, other: Series | ArrayLike | Scalar) -> Series:
@@ -1873,7 +3316,7 @@ class Series(Sequence, Sized):
             Series: A Series with the results of the operation.
         """
         other = cast(Series, other)
-        return Series({k: pow(v, other[k]) for k, v in self.iteritems()}, name=self.name)  # type: ignore
+        return Series._from_aligned(pow(self._data, other._data), self.index, self.name)  # type: ignore
 
     @_standardize_input
     def __lshift__(self, other: Series | ArrayLike | Scalar) -> Series:
@@ -1887,7 +3330,7 @@ class Series(Sequence, Sized):
             Series: A Series with the results of the operation.
         """
         other = cast(Series, other)
-        return Series({k: v << other[k] for k, v in self.iteritems()}, name=self.name)
+        return Series._from_aligned(self._data << other._data, self.index, self.name)
 
     @_standardize_input
     def __rshift__(self, other: Series | ArrayLike | Scalar) -> Series:
@@ -1901,7 +3344,7 @@ class Series(Sequence, Sized):
             Series: A Series with the results of the operation.
         """
         other = cast(Series, other)
-        return Series({k: v >> other[k] for k, v in self.iteritems()}, name=self.name)
+        return Series._from_aligned(self._data >> other._data, self.index, self.name)
 
     @_standardize_input
     def __and__(self, other: Series | ArrayLike | Scalar) -> Series:
@@ -1915,7 +3358,7 @@ class Series(Sequence, Sized):
             Series: A Series with the results of the operation.
         """
         other = cast(Series, other)
-        return Series({k: v & other[k] for k, v in self.iteritems()}, name=self.name)
+        return Series._from_aligned(self._data & other._data, self.index, self.name)
 
     @_standardize_input
     def __xor__(self, other: Series | ArrayLike | Scalar) -> Series:
@@ -1929,7 +3372,7 @@ class Series(Sequence, Sized):
             Series: A Series with the results of the operation.
         """
         other = cast(Series, other)
-        return Series({k: v ^ other[k] for k, v in self.iteritems()}, name=self.name)
+        return Series._from_aligned(self._data ^ other._data, self.index, self.name)
 
     @_standardize_input
     def __or__(self, other: Series | ArrayLike | Scalar) -> Series:
@@ -1943,7 +3386,7 @@ class Series(Sequence, Sized):
             Series: A Series with the results of the operation.
         """
         other = cast(Series, other)
-        return Series({k: v | other[k] for k, v in self.iteritems()}, name=self.name)
+        return Series._from_aligned(self._data | other._data, self.index, self.name)
 
     ###########################################################################
     # Right-hand Side Operators
@@ -2011,22 +3454,22 @@ class Series(Sequence, Sized):
     @_standardize_input
     def __iadd__(self, other: Series | ArrayLike | Scalar) -> Self:
         other = cast(Series, other)
-        for k in self.index:
-            self[k] += other[k]
+        self._ensure_writable()
+        self._data += other._data
         return self
 
     @_standardize_input
     def __isub__(self, other: Series | ArrayLike | Scalar) -> Self:
         other = cast(Series, other)
-        for k in self.index:
-            self[k] -= other[k]
+        self._ensure_writable()
+        self._data -= other._data
         return self
 
     @_standardize_input
     def __imul__(self, other: Series | ArrayLike | Scalar) -> Self:
         other = cast(Series, other)
-        for k in self.index:
-            self[k] *= other[k]
+        self._ensure_writable()
+        self._data *= other._data
         return self
 
     def __imatmul__(self, other: Series | ArrayLike) -> Scalar:  # type: ignore  # noqa: PYI034
@@ -2036,64 +3479,64 @@ class Series(Sequence, Sized):
     @_standardize_input
     def __itruediv__(self, other: Series | ArrayLike | Scalar) -> Self:
         other = cast(Series, other)
-        for k in self.index:
-            self[k] /= other[k]
+        self._ensure_writable()
+        self._data /= other._data
         return self
 
     @_standardize_input
     def __ifloordiv__(self, other: Series | ArrayLike | Scalar) -> Self:
         other = cast(Series, other)
-        for k in self.index:
-            self[k] //= other[k]
+        self._ensure_writable()
+        self._data //= other._data
         return self
 
     @_standardize_input
     def __imod__(self, other: Series | ArrayLike | Scalar) -> Self:
         other = cast(Series, other)
-        for k in self.index:
-            self[k] %= other[k]
+        self._ensure_writable()
+        self._data %= other._data
         return self
 
     @_standardize_input
     def __ipow__(self, other: Series | ArrayLike | Scalar) -> Self:
         other = cast(Series, other)
-        for k in self.index:
-            self[k] **= other[k]
+        self._ensure_writable()
+        self._data **= other._data
         return self
 
     @_standardize_input
     def __ilshift__(self, other: Series | ArrayLike | Scalar) -> Self:
         other = cast(Series, other)
-        for k in self.index:
-            self[k] <<= other[k]
+        self._ensure_writable()
+        self._data <<= other._data
         return self
 
     @_standardize_input
     def __irshift__(self, other: Series | ArrayLike | Scalar) -> Self:
         other = cast(Series, other)
-        for k in self.index:
-            self[k] >>= other[k]
+        self._ensure_writable()
+        self._data >>= other._data
         return self
 
     @_standardize_input
     def __iand__(self, other: Series | ArrayLike | Scalar) -> Self:
         other = cast(Series, other)
-        for k in self.index:
-            self[k] &= other[k]
+        self._ensure_writable()
+        self._data &= other._data
         return self
 
     @_standardize_input
     def __ixor__(self, other: Series | ArrayLike | Scalar) -> Self:
         other = cast(Series, other)
-        for k in self.index:
-            self[k] ^= other[k]
+        self._ensure_writable()
+        self._data ^= other._data
         return self
 
     @_standardize_input
     def __ior__(self, other: Series | ArrayLike | Scalar) -> Self:  # type: ignore
         other = cast(Series, other)
-        for k in self.index:
-            self[k] |= other[k]
+        self._ensure_writable()
+        self._data |= other._data
         return self
 
     ###########################################################################
@@ -2109,7 +3552,7 @@ class Series(Sequence, Sized):
         return self.abs()
 
     def __invert__(self) -> Series:
-        return Series({k: ~v for k, v in self.iteritems()})  # type: ignore
+        return Series._from_aligned(~self._data, self.index, self.name)
 
 
 ###########################################################################
@@ -2127,10 +3570,11 @@ class DataFrame:
 
     _index: Index
     _columns: Index
-    _data: Array
+    _data: Array  # Column-major: one Array per column
     loc: LocDataFrameIndexer
     iloc: IlocDataFrameIndexer
-    __slots__ = ("_index", "_columns", "_data", "loc", "iloc")
+    _shared: bool
+    __slots__ = ("_index", "_columns", "_data", "_shared", "loc", "iloc")
 
     ###########################################################################
     # Initializer and general methods
@@ -2161,15 +3605,25 @@ class DataFrame:
             case ArrayLike() | Mapping() if len(data) == 0:
                 self._init_empty(index, columns)
             case Mapping() as m if all(isinstance(v, ArrayLike) for v in m.values()):
-                self._init_mapping_of_series({col: Series(val) for col, val in data.items()}, index, columns)
+                if any(isinstance(v, (Series, Mapping)) for v in m.values()):
+                    self._init_mapping_of_series({col: Series(val) for col, val in data.items()}, index, columns)
+                else:
+                    labels = list(m.keys()) if columns is None else list(columns)
+                    self._init_columns([m[c] for c in labels], labels, index)
             case ArrayLike() as c if all(isinstance(v, (Mapping, ArrayLike)) for v in c) and _is_array_like(c):
-                self._init_collection_of_series([Series(row) for row in data], index, columns)
+                if all(isinstance(v, Mapping) for v in c):
+                    self._init_records(list(c), index, columns)
+                elif not any(isinstance(v, (Series, Mapping)) for v in c):
+                    self._init_rows(list(c), index, columns)
+                else:
+                    self._init_collection_of_series([Series(row) for row in data], index, columns)
             case ArrayLike() as c if all(_is_scalar(v) for v in c) and _is_array_like(c):
                 self._init_mapping_of_series({0: Series(data)}, index, columns)
             case _:
                 msg = "DataFrame constructor not properly called!"
                 raise ValueError(msg)
         self._validate_index_and_columns()
+        self._shared = False
         self._set_indexers()
 
     def _init_empty(self, index: IndexLike | None = None, columns: IndexLike | None = None):
@@ -2178,7 +3632,7 @@ class DataFrame:
             raise ValueError(msg)
         self._index = Index([] if index is None else index)
         self._columns = Index([] if columns is None else columns)
-        self._data = Array([Array([])])
+        self._data = Array([Array([]) for _ in self._columns])
 
     def _init_mapping_of_series(
         self, data: Mapping[Scalar, Series], index: IndexLike | None = None, columns: IndexLike | None = None
@@ -2197,7 +3651,7 @@ class DataFrame:
             implied = (len(self._index), len(self._columns))
             msg = f"Shape of passed values is {passed}, indices imply {implied}"
             raise ValueError(msg)
-        self._data = Array([Array([data[c].iloc[i] for c in self.columns]) for i in range(len(self.index))])
+        self._data = Array([Array(data[c]._data) for c in self.columns])  # noqa: SLF001
 
     def _init_collection_of_series(
         self, data: list[Series], index: IndexLike | None = None, columns: IndexLike | None = None
@@ -2218,29 +3672,205 @@ class DataFrame:
             raise ValueError(msg)
 
         # # @TODO: Deal with Series with names
-        self._index = Index(list(range(len(data))) if index is None else index)
+        self._index = Index(range(len(data)) if index is None else index)
         if (len(self._index) != len(data)) or (len(self._columns) != len(src_columns)):
             passed = (len(data), len(src_columns))
             implied = (len(self._index), len(self._columns))
             msg = f"Shape of passed values is {passed}, indices imply {implied}"
             raise ValueError(msg)
 
-        self._data = Array([Array(row) for row in data])
+        self._data = Array([Array(col) for col in zip(*data)])
 
-    def _validate_index_and_columns(self):
-        # @TODO: How to validate empty DataFrames?
-        if len(self.columns) == 0:
+    def _init_columns(
+        self,
+        data: list[ArrayLike],
+        labels: list[Scalar] | None,
+        index: IndexLike | None = None,
+        columns: IndexLike | None = None,
+        *,
+        adopt: bool = False,
+    ) -> bool:
+        # Builds the storage straight from the columns, checking their lengths once. With `adopt`,
+        # Arrays are used without copying. Returns whether any column was adopted.
+        lengths = {len(col) for col in data}
+        if len(lengths) > 1:
+            msg = "All arrays must be of the same length"
+            raise ValueError(msg)
+        length = lengths.pop() if lengths else len(index or [])
+        self._index = RangeIndex(length) if index is None else Index(index)
+        self._columns = Index(columns if columns is not None else labels if labels is not None else range(len(data)))
+        if (len(self._index) != length) or (len(self._columns) != len(data)):
+            passed = (length, len(data))
+            implied = (len(self._index), len(self._columns))
+            msg = f"Shape of passed values is {passed}, indices imply {implied}"
+            raise ValueError(msg)
+        self._data = Array([col if adopt and isinstance(col, Array) else Array(col) for col in data])
+        return adopt and any(isinstance(col, Array) for col in data)
+
+    def _init_rows(self, data: list[ArrayLike], index: IndexLike | None = None, columns: IndexLike | None = None):
+        # Transposes rows of values with zip, checking their widths once
+        width = len(data[0])
+        if width == 0:
+            self._init_empty([0] if index is None else index, columns)
             return
-        if len(self.index) == 0:
+        if set(map(len, data)) != {width}:
+            msg = f"Misaligned columns. Expected {width} values per row: {[len(row) for row in data]}"
+            raise ValueError(msg)
+        self._init_columns(list(zip(*data)), None, index, columns)
+
+    def _init_records(
+        self,
+        data: list[Mapping],
+        index: IndexLike | None = None,
+        columns: IndexLike | None = None,
+        *,
+        fill: bool = False,
+    ):
+        # Builds one column per key with an itemgetter over the records. Unless `fill` is set (missing
+        # keys become None) every record must have the keys of the first one.
+        keys = list(data[0].keys()) if not fill else list(dict.fromkeys(itertools.chain.from_iterable(data)))
+        if len(keys) == 0:
+            self._init_empty([0] if index is None else index, columns)
             return
+        values: list[ArrayLike] | None = None
+        if set(map(len, data)) == {len(keys)}:
+            getter = operator.itemgetter(*keys)
+            try:
+                values = list(zip(*map(getter, data))) if len(keys) > 1 else [list(map(getter, data))]
+            except KeyError:
+                values = None
+        elif fill:
+            values = [[record.get(key) for record in data] for key in keys]
+        if values is None:
+            missing_cols = {key for record in data for key in keys if key not in record} or "{}"
+            extra_cols = {key for record in data for key in record} - set(keys) or "{}"
+            msg = f"Misaligned columns. Expected {keys}. Missing: {missing_cols}, Extra: {extra_cols}"
+            raise ValueError(msg)
+        self._init_columns(values, keys, index, columns)
+
+    @classmethod
+    def from_columns(
+        cls,
+        data: Mapping[Scalar, ArrayLike] | Iterable[ArrayLike],
+        index: IndexLike | None = None,
+        columns: IndexLike | None = None,
+    ) -> DataFrame:
+        """
+        Builds a DataFrame from its columns, checking their lengths once instead of building a Series
+        per column.
+
+        Arrays are adopted without copying: the DataFrame copies them before its first modification
+        (copy-on-write), but modifying them afterwards changes the DataFrame. The values of Series are
+        shared copy-on-write both ways, so modifying the Series afterwards doesn't change the DataFrame.
+        Other collections are copied once.
+
+        Args:
+            data (Mapping[Scalar, ArrayLike] | Iterable[ArrayLike]): The columns, labeled by the keys of a
+                mapping or by their position.
+            index (IndexLike, optional): The row labels. Defaults to a RangeIndex.
+            columns (IndexLike, optional): The column labels. Defaults to the keys of `data`.
+
+        Returns:
+            DataFrame: The new DataFrame.
+
+        Raises:
+            ValueError: If the columns have different lengths or don't match `index` and `columns`.
+        """
+        if isinstance(data, Mapping):
+            values, labels = list(data.values()), list(data.keys())
+        else:
+            values, labels = list(data), None
+        for col in values:
+            if isinstance(col, Series):
+                # The Series copies its values before its next modification, so the DataFrame keeps them
+                col._shared = True  # noqa: SLF001
+        values = [col._data if isinstance(col, Series) else col for col in values]  # noqa: SLF001
+        df = cls.__new__(cls)
+        adopted = df._init_columns(values, labels, index, columns, adopt=True)  # noqa: SLF001
+        df._shared = adopted  # noqa: SLF001
+        df._set_indexers()  # noqa: SLF001
+        return df
+
+    @classmethod
+    def from_records(
+        cls, data: Iterable[Mapping[Scalar, Any]], index: IndexLike | None = None, columns: IndexLike | None = None
+    ) -> DataFrame:
+        """
+        Builds a DataFrame from records (one mapping per row), one column at a time.
+
+        The columns are the keys of all records, in order of appearance. Keys missing from a record
+        are filled with None.
+
+        Args:
+            data (Iterable[Mapping[Scalar, Any]]): The records.
+            index (IndexLike, optional): The row labels. Defaults to a RangeIndex.
+            columns (IndexLike, optional): The column labels. Defaults to the keys of the records.
+
+        Returns:
+            DataFrame: The new DataFrame.
+
+        Raises:
+            ValueError: If the shape of the records doesn't match `index` and `columns`.
+        """
+        records = list(data)
+        if len(records) == 0:
+            return cls(index=index, columns=columns)
+        df = cls.__new__(cls)
+        df._init_records(records, index, columns, fill=True)  # noqa: SLF001
+        df._shared = False  # noqa: SLF001
+        df._set_indexers()  # noqa: SLF001
+        return df
+
+    @classmethod
+    def from_rows(
+        cls, data: Iterable[ArrayLike], index: IndexLike | None = None, columns: IndexLike | None = None
+    ) -> DataFrame:
+        """
+        Builds a DataFrame from rows of values, transposing them with a single `zip`.
+
+        Args:
+            data (Iterable[ArrayLike]): The rows, all with the same number of values.
+            index (IndexLike, optional): The row labels. Defaults to a RangeIndex.
+            columns (IndexLike, optional): The column labels. Defaults to a RangeIndex.
+
+        Returns:
+            DataFrame: The new DataFrame.
+
+        Raises:
+            ValueError: If the rows have different lengths or don't match `index` and `columns`.
+        """
+        rows = list(data)
+        if len(rows) == 0:
+            return cls(index=index, columns=columns)
+        df = cls.__new__(cls)
+        df._init_rows(rows, index, columns)  # noqa: SLF001
+        df._shared = False  # noqa: SLF001
+        df._set_indexers()  # noqa: SLF001
+        return df
+
+    @classmethod
+    def _from_aligned(cls, data: Array, index: Index, columns: Index) -> DataFrame:
+        """
+        Builds a DataFrame from column-major `data` without copying or validating it. Each column
+        must have the same length as `index` and neither `index` nor `columns` may be mutated
+        afterwards, since they may be shared.
+        """
+        df = cls.__new__(cls)
+        df._data = data  # noqa: SLF001
+        df._index = index  # noqa: SLF001
+        df._columns = columns  # noqa: SLF001
+        df._shared = False  # noqa: SLF001
+        df._set_indexers()  # noqa: SLF001
+        return df
 
-        if len(self._data) != len(self.index):
-            msg = "Somehow indexes and DataFrame length don't match. This shouldn't happen!"
+    def _validate_index_and_columns(self):
+        if len(self._data) != len(self.columns):
+            msg = "Somehow columns and DataFrame width don't match. This shouldn't happen!"
             raise ValueError(msg)
 
-        for row in self._data:
-            if len(row) != len(self.columns):
-                msg = "Somehow columns and DataFrame width don't match. This shouldn't happen!"
+        for col in self._data:
+            if len(col) != len(self.index):
+                msg = "Somehow indexes and DataFrame length don't match. This shouldn't happen!"
                 raise ValueError(msg)
 
     @staticmethod
@@ -2264,9 +3894,9 @@ class DataFrame:
         return len(self.index)
 
     def __repr__(self):
-        if len(self) == 0 or len(self.iloc[0]) == 0:
+        if len(self.index) == 0 or len(self.columns) == 0:
             return f"Empty DataFrame\nColumns: {self.columns.values!s}\nIndex: {self.index.values!s}"
-        columns = list(zip(["", *self.columns], *[[idx, *s] for idx, s in zip(self.index, self._data)]))
+        columns = [["", *self.index], *[[c, *col] for c, col in zip(self.columns, self._data)]]
         widths = [max([len(str(v)) for v in col]) for col in columns]
         height = len(columns[0])
         ret = [[f"{col[i]!s:>{width}}" for col, width in zip(columns, widths)] for i in range(height)]
@@ -2276,16 +3906,54 @@ class DataFrame:
         """
         Creates a copy of the DataFrame.
 
+        Deep copies are copy-on-write: they share the columns, index labels and column labels with the
+        original until either of them is modified, so copying is O(1). The values themselves are not
+        copied recursively.
+
         Args:
-            deep (bool, optional): If True, creates a deep copy. Otherwise, creates a shallow copy. Defaults to True.
+            deep (bool, optional): If True, creates a deep copy. Otherwise, creates a shallow copy that
+                keeps sharing the columns with the original. Defaults to True.
 
         Returns:
             DataFrame: A copy of the DataFrame.
         """
-        clone = copy.deepcopy(self) if deep else copy.copy(self)
-        clone._set_indexers()  # noqa: SLF001
+        # Deep copies get their own Index objects, which share the labels, so renaming them is isolated
+        index, columns = (Index(self._index), Index(self._columns)) if deep else (self._index, self._columns)
+        clone = DataFrame._from_aligned(self._data, index, columns)
+        if deep:
+            self._shared = True
+        clone._shared = self._shared  # noqa: SLF001
         return clone
 
+    def memory_usage(self, index: bool = True, *, deep: bool = False) -> Series:  # noqa: FBT001, FBT002
+        """
+        Returns the memory used by each column in bytes, preceded by the memory used by the index
+        (labeled "Index") and by the column labels and the list of columns (labeled "Columns"). See
+        `Array.memory_usage` and `Index.memory_usage` for what is counted.
+
+        Columns and indexes shared with other objects (eg: copies) are counted in full by each of them.
+
+        Args:
+            index (bool, optional): Whether to count the index and the column labels. Defaults to True.
+            deep (bool, optional): If True, also counts the objects the values and labels point to.
+                Defaults to False.
+
+        Returns:
+            Series: The memory usage of each structure in bytes.
+        """
+        usage = [col.memory_usage(deep=deep) for col in self._data]
+        if not index:
+            return Series(usage, index=self.columns[:])
+        labels = self._columns.memory_usage(deep=deep) + self._data.memory_usage()
+        return Series([self._index.memory_usage(deep=deep), labels, *usage], index=["Index", "Columns", *self.columns])
+
+    def _ensure_writable(self):
+        # Copy-on-write: a DataFrame that shares its columns copies them before the first modification.
+        # Masks are copied into plain Arrays, so that any value can be written.
+        if self._shared or any(isinstance(col, Mask) for col in self._data):
+            self._data = Array([_writable_copy(col) for col in self._data])
+            self._shared = False
+
     @property
     def index(self) -> Index:
         """
@@ -2310,10 +3978,7 @@ class DataFrame:
         if len(self) != len(index):
             msg = f"Length mismatch: Expected axis has {len(self)} elements, new values have {len(index)} elements"
             raise ValueError(msg)
-        idx = Index(index)
-        self._index = idx
-        for s in self._data:
-            s.index = idx
+        self._index = Index(index)
 
     @property
     def columns(self) -> Index:
@@ -2341,6 +4006,36 @@ class DataFrame:
             raise ValueError(msg)
         self._columns = Index(columns)
 
+    def drop(self, index: LocIndexes | None = None, columns: LocIndexes | None = None) -> DataFrame:
+        """
+        Removes rows and/or columns by label and returns a new DataFrame.
+
+        Args:
+            index (LocIndexes, optional): Row labels to remove. Defaults to None.
+            columns (LocIndexes, optional): Column labels to remove. Defaults to None.
+
+        Returns:
+            DataFrame: A new DataFrame without the removed rows and columns
+
+        Raises:
+            KeyError: If a label is not found.
+        """
+        data, new_index, new_columns = self._data, self._index, self._columns
+        if columns is not None:
+            keep = _keep_mask(len(new_columns), new_columns.get_ilocs(columns))
+            data = Array(itertools.compress(data, keep))
+            new_columns = Index(itertools.compress(new_columns, keep), name=new_columns.name)
+        if index is not None:
+            # Every remaining column is compacted with the same keep mask, in a single pass each
+            keep = _keep_mask(len(new_index), new_index.get_ilocs(index))
+            data = Array([_compress(col, keep) for col in data])
+            new_index = Index(itertools.compress(new_index, keep), name=new_index.name)
+        df = DataFrame._from_aligned(data, new_index, new_columns)
+        if index is None:
+            # The remaining columns are still the ones of this DataFrame
+            self._shared = df._shared = True  # noqa: SLF001
+        return df
+
     @property
     def T(self) -> DataFrame:  # noqa: N802
         """
@@ -2355,17 +4050,29 @@ class DataFrame:
                 - Original index becomes the new columns
                 - Data values are transposed accordingly
         """
-        return DataFrame(dict(self.iterrows()), index=self.columns[:])
+        data = Array([Array(row) for row in self._iter_rows()])
+        return DataFrame._from_aligned(data, Index(self._columns), Index(self._index))
 
     @property
     def values(self) -> Array[Array[Any]]:  # type: ignore
         """
         Return a list representation of the DataFrame.
 
+        Data is stored by column, so the rows are built on each access.
+
         Returns:
             list: The values of the DataFrame.
         """
-        return self._data
+        return Array([Array(row) for row in self._iter_rows()])
+
+    def _iter_rows(self) -> Iterator[tuple[Any, ...]]:
+        if len(self._data) == 0:
+            return iter([()] * len(self.index))
+        return zip(*self._data)
+
+    def _iter_columns(self) -> Generator[tuple[Scalar, Series]]:
+        for col, values in zip(self.columns, self._data):
+            yield col, Series._from_aligned(Array(values), self.index, col)  # noqa: SLF001
 
     def iterrows(self) -> Generator[tuple[Scalar, Series]]:
         """
@@ -2379,8 +4086,8 @@ class DataFrame:
                 - Scalar: The label of the current row
                 - Series: Row data
         """
-        for idx, row in zip(self.index, self._data):
-            yield idx, Series(row, index=self.columns, name=idx)
+        for idx, row in zip(self.index, self._iter_rows()):
+            yield idx, Series._from_aligned(Array(row), self.columns, idx)  # noqa: SLF001
 
     ###########################################################################
     # Accessors
@@ -2405,8 +4112,8 @@ class DataFrame:
             case tuple():
                 return self.loc[index]
             case Series() | Array() | list():
-                if _is_boolean_mask(Series(index)):
-                    return self.loc[index]
+                if _is_boolean_mask(mask := _mask_values(index)):
+                    return self._filter(mask)
                 return self.loc[:, index]
             case slice():
                 return self.iloc[index]
@@ -2443,7 +4150,14 @@ class DataFrame:
     ###########################################################################
     # Apply/Agg/Map/Reduce
     ###########################################################################
-    def apply(self, method: Callable[[Series], Any], axis: Axis = 0) -> Series:
+    def apply(
+        self,
+        method: Callable[[Series], Any],
+        axis: Axis = 0,
+        *,
+        workers: int | None = None,
+        chunksize: int | None = None,
+    ) -> Series:
         """
         Apply a function along a DataFrame axis (columns or rows).
 
@@ -2458,18 +4172,28 @@ class DataFrame:
             axis: Axis along which to apply:
                 - 0: Apply to each column (default)
                 - 1: Apply to each row
+            workers: Number of worker processes (threads on free-threaded builds) to split the
+                columns (or rows) between. With processes, `method` must be picklable. Fewer than
+                1000 columns (or rows) are processed serially. Defaults to None, which applies in
+                this process.
+            chunksize: Number of columns (or rows) sent to a worker at a time. Defaults to about
+                four chunks per worker.
 
         Returns:
             Series: Results of applying the method along specified axis.
+
+        Raises:
+            TypeError: If `method` can't be pickled for worker processes.
         """
         self._validate_axis(axis)
         match axis:
             case int(c) if c == AxisRows:
-                return self.T.apply(method, axis=1)
+                labels, series = self.columns, (s for _, s in self._iter_columns())
             case int(c) if c == AxisCols:
-                return Series({col: method(s) for col, s in self.iterrows()})
+                labels, series = self.index, (s for _, s in self.iterrows())
             case unreachable:  # no cov
                 assert_never(unreachable)  # type: ignore # @TODO: How to exhaust this check?
+        return Series(dict(zip(labels, _parallel_map(method, series, workers, chunksize))))
 
     def _apply_with_none(self, method: Callable[[Series], Any], axis: AxisOrNone = 0):
         match axis:
@@ -2499,16 +4223,31 @@ class DataFrame:
         self._validate_axis(axis)
         match axis:
             case int(c) if c == AxisRows:
-                return self.T.agg(method, axis=1)
+                return Series({col: method(s) for col, s in self._iter_columns()})
+            case int(c) if c == AxisCols:
+                return Series({idx: method(s) for idx, s in self.iterrows()})
+            case unreachable:  # no cov
+                assert_never(unreachable)  # type: ignore # @TODO: How to exhaust this check?
+
+    def _reduce_stats(self, method: Callable[[_Stats], Any], axis: AxisOrNone = 0):
+        # Statistics read from accumulators built in a single pass over each column (or row)
+        if axis is None:
+            return method(_Stats.of(itertools.chain.from_iterable(self._data)))
+        self._validate_axis(axis)
+        match axis:
+            case int(c) if c == AxisRows:
+                values = Array([method(_Stats.of(col.data)) for col in self._data])
+                return Series._from_aligned(values, self.columns)  # noqa: SLF001
             case int(c) if c == AxisCols:
-                return Series({col: method(s) for col, s in self.iterrows()})
+                values = Array([method(_Stats.of(row)) for row in self._iter_rows()])
+                return Series._from_aligned(values, self.index)  # noqa: SLF001
             case unreachable:  # no cov
                 assert_never(unreachable)  # type: ignore # @TODO: How to exhaust this check?
 
     def _agg_with_none(self, method: Callable[[ArrayLike[Any]], Any], axis: AxisOrNone = 0):
         match axis:
             case None:
-                return method([item for sublist in self.values for item in sublist])
+                return method([item for col in self._data for item in col])
             case _:
                 return self.agg(method, axis)
 
@@ -2522,7 +4261,109 @@ class DataFrame:
         Returns:
             DataFrame: A new DataFrame with the results of the function applied.
         """
-        return DataFrame((s.map(func) for _, s in self.iterrows()), index=self.index, columns=self.columns)
+        return DataFrame._from_aligned(Array([col.map(func) for col in self._data]), self.index, self.columns)
+
+    def _evaluate(self, expr: str, variables: Mapping[str, Any] | None) -> tuple[list[Any] | Any, str | None]:
+        # Runs a compiled expression over the columns it references. Expressions that do not reference
+        # any column are evaluated once and returned as a scalar.
+        parsed = _parse_expression(expr)
+        variables = {} if variables is None else variables
+        lookup = dict(zip(self.columns, self._data))
+        args: list[Any] = []
+        columns: list[bool] = []
+        for kind, key in parsed.references:
+            if kind != "variable" and key in lookup:
+                args.append(lookup[key].data)
+            elif kind == "column":
+                msg = f"Columns not found: {[key]}"
+                raise KeyError(msg)
+            elif key in variables:
+                args.append(variables[key])
+            else:
+                msg = f"name {key!r} is not defined"
+                raise NameError(msg)
+            columns.append(kind != "variable" and key in lookup)
+        values = _compile_expression(expr, tuple(columns))(*args)
+        return (values if any(columns) else values[0]), parsed.target
+
+    def query(self, expr: str, variables: Mapping[str, Any] | None = None) -> DataFrame:
+        """
+        Selects the rows for which a boolean expression over the columns is True, eg:
+        `df.query("a > 3 and b == 'x'")`. The expression is compiled once (and cached) into a single
+        loop over the rows, instead of building an intermediate Series for every operator.
+
+        Columns are referenced by name, or quoted with backticks if their label is not an identifier.
+        Other names, or names prefixed with `@`, are looked up in `variables`. Expressions may use
+        operators, comparisons, `and`, `or`, `not`, conditional expressions and literals.
+
+        Args:
+            expr (str): The expression.
+            variables (Mapping[str, Any], optional): Values of the names that are not columns. Defaults to None.
+
+        Returns:
+            DataFrame: The selected rows.
+
+        Raises:
+            KeyError: If a column quoted with backticks is not found.
+            NameError: If a name is neither a column nor a variable.
+            TypeError: If the expression does not evaluate to booleans.
+            ValueError: If the expression is not supported.
+        """
+        values, _ = self._evaluate(expr, variables)
+        if not isinstance(values, list):
+            values = [values] * len(self)
+        mask = _mask_or_array(values)
+        if not isinstance(mask, Mask):
+            msg = f"Query expression must evaluate to booleans: {expr!r}"
+            raise TypeError(msg)
+        return self._filter(mask)
+
+    def eval(self, expr: str, variables: Mapping[str, Any] | None = None) -> Series | DataFrame | Any:
+        """
+        Evaluates an expression over the columns, eg: `df.eval("a * b + 1")`, or assigns its result to
+        a column, eg: `df.eval("c = a * b + 1")`. See `query` for the expression syntax.
+
+        Args:
+            expr (str): The expression, optionally assigned to a column label.
+            variables (Mapping[str, Any], optional): Values of the names that are not columns. Defaults to None.
+
+        Returns:
+            Series | DataFrame | Any: The values of the expression, or a new DataFrame with the assigned
+                column. Expressions that reference no columns return a scalar.
+
+        Raises:
+            KeyError: If a column quoted with backticks is not found.
+            NameError: If a name is neither a column nor a variable.
+            ValueError: If the expression is not supported.
+        """
+        values, target = self._evaluate(expr, variables)
+        if target is None:
+            if not isinstance(values, list):
+                return values
+            return Series._from_aligned(Array(values), self.index)  # noqa: SLF001
+        column = Array(values) if isinstance(values, list) else Array.full(len(self), values)
+        if target in self.columns:
+            data = Array([column if label == target else col for label, col in zip(self.columns, self._data)])
+            columns = self.columns
+        else:
+            data = Array([*self._data, column])
+            columns = Index([*self.columns, target], name=self.columns.name)
+        df = DataFrame._from_aligned(data, self.index, columns)
+        # The other columns are still the ones of this DataFrame
+        self._shared = df._shared = True  # noqa: SLF001
+        return df
+
+    def lazy(self) -> LazyFrame:
+        """
+        Starts a lazy computation. Element-wise operators on the result are recorded instead of
+        computed, and `LazyFrame.collect` computes all of them in a single loop per column, without
+        building an intermediate DataFrame for every step, eg:
+        `((df.lazy() + 1) * 2 - df2).abs().collect()`.
+
+        Returns:
+            LazyFrame: A LazyFrame starting from the values of this DataFrame.
+        """
+        return LazyFrame(self)
 
     def astype(self, new_type: type) -> DataFrame:
         """
@@ -2540,12 +4381,18 @@ class DataFrame:
     # def dot(self, other: DataFrame) -> DataFrame: ...  # no cov
     # @overload
     # def dot(self, other: Series | ArrayLike) -> Series: ...  # no cov
-    def dot(self, other: DataFrame | Series | ArrayLike) -> DataFrame | Series:
+    def dot(self, other: DataFrame | Series | ArrayLike, *, workers: int | None = None) -> DataFrame | Series:
         """
         Compute the matrix multiplication between the DataFrame and another DataFrame or Series.
 
+        The rows of the DataFrame are built once and multiplied with the columns of `other` as
+        they are stored, so nothing is transposed per row.
+
         Args:
             other (DataFrame or Series): The other DataFrame or Series to multiply with.
+            workers (int, optional): Number of worker processes (threads on free-threaded builds) to
+                split the rows between. Worth it for large matrices only, since the operands are
+                pickled to every process. Defaults to None, which multiplies in this process.
 
         Returns:
             DataFrame or Series: The result of the matrix multiplication.
@@ -2559,8 +4406,9 @@ class DataFrame:
             case DataFrame():
                 if list(self.columns) != list(other.index):
                     raise ValueError(not_aligned_msg)
-                df_data = [[s_a.dot(s_b) for s_b in other.T.values] for s_a in self.values]
-                return DataFrame(df_data, index=self.index, columns=other.columns)
+                columns = [col.data for col in other._data]  # noqa: SLF001
+                data = _matmul(list(self._iter_rows()), columns, workers)
+                return DataFrame._from_aligned(Array(data), self.index, other.columns)
             case Series() | ArrayLike():
                 if len(self.columns) != len(other):
                     raise ValueError(not_aligned_msg)
@@ -2568,8 +4416,8 @@ class DataFrame:
                     other = Series(other, index=self.columns)
                 if list(self.columns) != list(other.index):
                     raise ValueError(not_aligned_msg)
-                s_data = [sa.dot(other) for sa in self.values]
-                return Series(s_data, index=self.index, name=other.name)
+                (values,) = _matmul(list(self._iter_rows()), [other._data.data], workers)  # noqa: SLF001
+                return Series._from_aligned(values, self.index, other.name)  # noqa: SLF001
             case _:
                 msg = "Dot product requires other to be a DataFrame or Series."
                 raise TypeError(msg)
@@ -2719,54 +4567,238 @@ class DataFrame:
     ###########################################################################
     # GroupBy
     ###########################################################################
+    def groupby(self, by: Scalar | list[Scalar], *, sort: bool = True) -> DataFrameGroupBy:
+        """
+        Groups the rows by the values of one or more columns.
+
+        The key columns are hashed once. Aggregations then walk each column a single time
+        without building a DataFrame per group.
+
+        Args:
+            by (Scalar | list[Scalar]): Column label, or list of column labels, to group by.
+                Grouping by several columns produces tuple keys.
+            sort (bool, optional): Sort the group keys. Defaults to True.
+
+        Returns:
+            DataFrameGroupBy: The grouped DataFrame.
+        """
+        labels = by if isinstance(by, list) else [by]
+        if len(labels) == 0:
+            msg = "No group keys passed"
+            raise ValueError(msg)
+        keys = self._get_columns(labels)
+        name = labels[0] if len(labels) == 1 else None
+        grouper = _Grouper(keys[0] if len(labels) == 1 else zip(*keys), name, sort=sort)
+        columns, data = [], []
+        for col, values in zip(self.columns, self._data):
+            if col not in labels:
+                columns.append(col)
+                data.append(values)
+        return DataFrameGroupBy(self, grouper, Index(columns), Array(data))
+
+    ###########################################################################
+    # Sorting
+    ###########################################################################
+    def _get_columns(self, labels: list[Scalar]) -> list[Array]:
+        lookup = dict(zip(self.columns, self._data))
+        if missing := [label for label in labels if label not in lookup]:
+            msg = f"Columns not found: {missing}"
+            raise KeyError(msg)
+        return [lookup[label] for label in labels]
+
+    def _filter(self, mask: BooleanMask) -> DataFrame:
+        # Gathers the selected rows of every column in a single pass each
+        _validate_mask_length(mask, len(self))
+        index = Index(itertools.compress(self._index, mask), name=self._index.name)
+        return DataFrame._from_aligned(Array([_compress(col, mask) for col in self._data]), index, self.columns)
+
+    def _take(self, order: list[int], *, ignore_index: bool = False) -> DataFrame:
+        # Applies a row permutation with a single gather per column
+        index = RangeIndex(len(order)) if ignore_index else Index(self.index[order], name=self.index.name)
+        return DataFrame._from_aligned(Array([col[order] for col in self._data]), index, self.columns)
+
+    def sort_values(
+        self,
+        by: Scalar | list[Scalar],
+        *,
+        ascending: bool | list[bool] = True,
+        key: Callable[[Scalar], Any] | None = None,
+        na_position: NaPosition = "last",
+        ignore_index: bool = False,
+    ) -> DataFrame:
+        """
+        Sorts the rows by the values of one or more columns. The sort is stable.
+
+        Args:
+            by (Scalar | list[Scalar]): Column label, or list of column labels, to sort by.
+            ascending (bool | list[bool], optional): Sort in ascending order, either for all columns or one
+                flag per column in `by`. Defaults to True.
+            key (Callable[[Scalar], Any], optional): Function applied once to each value to produce the
+                sort key, like the `key` of `sorted`. Defaults to None.
+            na_position (NaPosition, optional): Place missing values (None) "first" or "last". Defaults to "last".
+            ignore_index (bool, optional): Label the result 0, 1, ..., n - 1. Defaults to False.
+
+        Returns:
+            DataFrame: A new sorted DataFrame.
+
+        Raises:
+            KeyError: If a column is missing.
+            ValueError: If `ascending` and `by` have different lengths.
+        """
+        labels = by if isinstance(by, list) else [by]
+        flags = ascending if isinstance(ascending, list) else [ascending] * len(labels)
+        if len(flags) != len(labels):
+            msg = f"Length of ascending ({len(flags)}) != length of by ({len(labels)})"
+            raise ValueError(msg)
+        columns = [col.data for col in self._get_columns(labels)]
+        return self._take(_argsort(columns, flags, key, na_position), ignore_index=ignore_index)
+
+    def sort_index(
+        self,
+        *,
+        ascending: bool = True,
+        key: Callable[[Scalar], Any] | None = None,
+        na_position: NaPosition = "last",
+        ignore_index: bool = False,
+    ) -> DataFrame:
+        """
+        Sorts the rows by their index labels. The sort is stable.
+
+        Args:
+            ascending (bool, optional): Sort in ascending order. Defaults to True.
+            key (Callable[[Scalar], Any], optional): Function applied once to each label to produce the
+                sort key, like the `key` of `sorted`. Defaults to None.
+            na_position (NaPosition, optional): Place missing labels (None) "first" or "last". Defaults to "last".
+            ignore_index (bool, optional): Label the result 0, 1, ..., n - 1. Defaults to False.
+
+        Returns:
+            DataFrame: A new sorted DataFrame.
+        """
+        return self._take(_argsort([self.index.values], [ascending], key, na_position), ignore_index=ignore_index)
+
+    def nlargest(self, n: int, columns: Scalar | list[Scalar]) -> DataFrame:
+        """
+        Returns the `n` rows with the largest values in `columns`, in descending order, using a heap
+        instead of a full sort.
+
+        Rows with missing values (None) are skipped and ties keep the order in which they appear.
+
+        Args:
+            n (int): Number of rows to return.
+            columns (Scalar | list[Scalar]): Column label, or list of column labels, to rank by.
+
+        Returns:
+            DataFrame: The `n` largest rows.
+        """
+        labels = columns if isinstance(columns, list) else [columns]
+        return self._take(_top_k(n, [col.data for col in self._get_columns(labels)], largest=True))
+
+    def nsmallest(self, n: int, columns: Scalar | list[Scalar]) -> DataFrame:
+        """
+        Returns the `n` rows with the smallest values in `columns`, in ascending order, using a heap
+        instead of a full sort.
+
+        Rows with missing values (None) are skipped and ties keep the order in which they appear.
+
+        Args:
+            n (int): Number of rows to return.
+            columns (Scalar | list[Scalar]): Column label, or list of column labels, to rank by.
+
+        Returns:
+            DataFrame: The `n` smallest rows.
+        """
+        labels = columns if isinstance(columns, list) else [columns]
+        return self._take(_top_k(n, [col.data for col in self._get_columns(labels)], largest=False))
+
+    ###########################################################################
+    # Merge/Concatenate
+    ###########################################################################
+    def merge(
+        self,
+        right: DataFrame,
+        how: DfMergeHow = "inner",
+        on: Scalar | IndexLike | None = None,
+        *,
+        left_on: Scalar | IndexLike | None = None,
+        right_on: Scalar | IndexLike | None = None,
+        left_index: bool = False,
+        right_index: bool = False,
+        suffixes: tuple[str, str] = ("_x", "_y"),
+    ) -> DataFrame:
+        """
+        Merges with another DataFrame with a database-style join. See `lontras.merge`.
+
+        Args:
+            right (DataFrame): Right DataFrame.
+            how (DfMergeHow, optional): Type of join: "inner", "left", "right" or "outer". Defaults to "inner".
+            on (Scalar | IndexLike, optional): Column label(s) present in both DataFrames to join on.
+            left_on (Scalar | IndexLike, optional): Column label(s) of this DataFrame to join on.
+            right_on (Scalar | IndexLike, optional): Column label(s) of the right DataFrame to join on.
+            left_index (bool, optional): Use this index as the join key. Defaults to False.
+            right_index (bool, optional): Use the right index as the join key. Defaults to False.
+            suffixes (tuple[str, str], optional): Suffixes appended to overlapping column labels.
+                Defaults to ("_x", "_y").
+
+        Returns:
+            DataFrame: The merged DataFrame.
+        """
+        return merge(
+            self,
+            right,
+            how,
+            on,
+            left_on=left_on,
+            right_on=right_on,
+            left_index=left_index,
+            right_index=right_index,
+            suffixes=suffixes,
+        )
+
+    def append(self, other: DataFrame, axis: Axis = 0) -> DataFrame:
+        """
+        Appends `other` to the end of the DataFrame
+
+        Args:
+            other (DataFrame): The data to append
+            axis: Axis to append along:
+                - 0: Append the rows of `other`, which must have the same columns (default)
+                - 1: Append the columns of `other`, which must have the same index
+
+        Returns:
+            DataFrame: A new DataFrame with new data
 
-    #     ###########################################################################
-    #     # Merge/Concatenate
-    #     ###########################################################################
-    #     def append(self, other: DataFrame, axis: Axis = 0) -> DataFrame:
-    #         """
-    #         Appends `other` to the end of the DataFrame
-
-    #         Args:
-    #             other (DataFrame): The data to append
-    #             axis: Axis to aggregate along:
-    #                 - 0: Aggregate each column (default)
-    #                 - 1: Aggregate each row
-
-    #         Returns:
-    #             DataFrame: A new DataFrame with new data
-    #         """
-    #         # @TODO: Support more data types for other?
-    #         self._validate_axis(axis)
-    #         match axis:
-    #             case int(c) if c == AxisRows:
-    #                 missing_columns = set(self.columns) ^ set(other.columns)
-    #                 if len(missing_columns) > 0:
-    #                     msg = f"Cannot append data with missing columns: {missing_columns}"
-    #                     raise ValueError(msg)
-    #                 return DataFrame({col: s.append(other[col]) for col, s in self.data.items()})
-    #             case int(c) if c == AxisCols:
-    #                 missing_indexes = set(self.index) ^ set(other.index)
-    #                 if len(missing_indexes) > 0:
-    #                     msg = f"Cannot append data with missing indexes: {missing_indexes}"
-    #                     raise ValueError(msg)
-    #                 return DataFrame(dict(self.data | other.data))
-    #             case unreachable:  # no cov
-    #                 assert_never(unreachable)  # type: ignore # @TODO: How to exhaust this check?
-
-    #     def merge(
-    #         self,
-    #         right: DataFrame,
-    #         how:DfMergeHow="inner",
-    #         on: Scalar | IndexLike | None = None,
-    #         *,
-    #         left_on: Scalar | IndexLike | None = None,
-    #         right_on: Scalar | IndexLike | None = None,
-    #         left_index: bool = False,
-    #         right_index: bool = False,
-    #         suffixes: tuple[str, str]=("_x", "_y")
-    #     ) -> DataFrame:
-    #         return merge(self, right, how, on, left_on=left_on, right_on=right_on, left_index=left_index, right_index=right_index, suffixes=suffixes)
+        Raises:
+            ValueError: If the DataFrames are not aligned or if labels would be repeated.
+        """
+        # @TODO: Support more data types for other?
+        self._validate_axis(axis)
+        match axis:
+            case int(c) if c == AxisRows:
+                missing_columns = set(self.columns) ^ set(other.columns)
+                if len(missing_columns) > 0:
+                    msg = f"Cannot append data with missing columns: {missing_columns}"
+                    raise ValueError(msg)
+                duplicate_index = {label for label in other.index if label in self.index}
+                if len(duplicate_index) > 0:
+                    msg = f"Cannot append with duplicate indexes: {duplicate_index}"
+                    raise ValueError(msg)
+                data = Array([Array([*col, *o]) for col, o in zip(self._data, other._get_columns(self.columns.values))])
+                index = Index([*self.index, *other.index], name=self.index.name)
+                return DataFrame._from_aligned(data, index, self.columns)
+            case int(c) if c == AxisCols:
+                missing_indexes = set(self.index) ^ set(other.index)
+                if len(missing_indexes) > 0:
+                    msg = f"Cannot append data with missing indexes: {missing_indexes}"
+                    raise ValueError(msg)
+                duplicate_columns = {label for label in other.columns if label in self.columns}
+                if len(duplicate_columns) > 0:
+                    msg = f"Cannot append with duplicate columns: {duplicate_columns}"
+                    raise ValueError(msg)
+                aligned = [self.index._take_aligned(other.index, col) for col in other._data]  # noqa: SLF001
+                columns = Index([*self.columns, *other.columns], name=self.columns.name)
+                return DataFrame._from_aligned(Array([*self._data, *aligned]), self.index, columns)
+            case unreachable:  # no cov
+                assert_never(unreachable)  # type: ignore # @TODO: How to exhaust this check?
 
     ###########################################################################
     # Statistics
@@ -2788,7 +4820,7 @@ class DataFrame:
         Returns:
             Series | float: Axis mean
         """
-        return self._agg_with_none(statistics.mean, axis=axis)
+        return self._reduce_stats(_Stats.mean, axis)
 
     @overload
     def median(self, axis: Axis) -> Series: ...  # no cov
@@ -2854,6 +4886,8 @@ class DataFrame:
         Returns:
             Series: Standard deviations along axis
         """
+        if xbar is None:
+            return self._reduce_stats(_Stats.std, axis)
         return self.agg(lambda values: statistics.stdev(values, xbar=xbar), axis=axis)
 
     def var(self, xbar=None, axis: Axis = 0) -> Series | Scalar:
@@ -2871,19 +4905,61 @@ class DataFrame:
         Returns:
             Series: Variances along axis
         """
+        if xbar is None:
+            return self._reduce_stats(_Stats.var, axis)
         return self._agg_with_none(lambda values: statistics.variance(values, xbar=xbar), axis=axis)
 
-    ###########################################################################
-    # Exports
-    ###########################################################################
-    def to_list(self) -> list[list[Any]]:
+    @overload
+    def count(self, axis: Axis = 0) -> Series: ...  # no cov
+    @overload
+    def count(self, axis: None) -> int: ...  # no cov
+    def count(self, axis: AxisOrNone = 0) -> Series | int:
         """
-        Converts the DataFrame to a list.
+        Counts the values that are not missing (None).
+
+        Args:
+            axis: AxisOrNone to aggregate along:
+                - 0: Aggregate each column (default)
+                - 1: Aggregate each row
+                - None: Aggregates along both axes returning a scalar
+
+        Returns:
+            Series | int: Counts along the axis
+        """
+        return self._reduce_stats(lambda stats: stats.n, axis)
+
+    def describe(self) -> DataFrame:
+        """
+        Generates descriptive statistics of the numeric columns: count, mean, standard deviation,
+        minimum, quartiles and maximum, as in pandas. Missing values (None) are skipped. Columns
+        without numeric values are left out.
+
+        Returns:
+            DataFrame: The statistics of each numeric column, indexed by "count", "mean", "std", "min",
+                "25%", "50%", "75%" and "max"
+        """
+        summaries, columns = [], []
+        for label, col in zip(self.columns, self._data):
+            try:
+                summary = _describe(col.data)
+            except TypeError:
+                continue
+            if summary[0] > 0:
+                summaries.append(Array(summary))
+                columns.append(label)
+        return DataFrame._from_aligned(Array(summaries), Index(_DESCRIBE_INDEX), Index(columns))
+
+    ###########################################################################
+    # Exports
+    ###########################################################################
+    def to_list(self) -> list[list[Any]]:
+        """
+        Converts the DataFrame to a list.
 
         Returns:
             list[list[Any]]: A list of the Series values.
         """
-        return list(self.T.apply(list))
+        return [list(row) for row in self._iter_rows()]
 
     @overload
     def to_dict(self) -> dict[Scalar, dict[Scalar, Any]]: ...  # no cov
@@ -2906,11 +4982,11 @@ class DataFrame:
         """
         match orient:
             case "dict":
-                return dict(self.apply(lambda col: col.to_dict()).iteritems())
+                return {col: dict(zip(self.index, values)) for col, values in zip(self.columns, self._data)}
             case "list":
-                return dict(self.apply(lambda col: col.to_list()).iteritems())
+                return {col: values.to_list() for col, values in zip(self.columns, self._data)}
             case "records":
-                return self.apply(lambda row: row.to_dict(), axis=1).to_list()
+                return [dict(zip(self.columns, row)) for row in self._iter_rows()]
             case _:
                 msg = f"orient '{orient}' not understood"
                 raise ValueError(msg)
@@ -2926,6 +5002,9 @@ class DataFrame:
                 return self._op_dataframe(op, other)
             case Series():
                 return self._op_series(op, other)
+            case LazyFrame():
+                # Lets Python call the reflected operator of the LazyFrame, which records the operation
+                return NotImplemented
             case ArrayLike() | Mapping() as c if len(c) == 0 and len(self) == 0:
                 return DataFrame()
             case ArrayLike() | Mapping() as c if len(c) != len(self.columns):
@@ -2943,18 +5022,25 @@ class DataFrame:
         if len(self.columns) != len(other):
             msg = "Operands are not aligned. Do `left, right = left.align(right, axis=1, copy=False)` before operating."
             raise ValueError(msg)
-        return DataFrame([getattr(row, op)(other) for _, row in self.iterrows()], index=self.index)
+        other_values = self.columns._take_aligned(other.index, other._data)  # noqa: SLF001
+        data = Array([getattr(col, op)(o) for col, o in zip(self._data, other_values)])
+        return DataFrame._from_aligned(data, self.index, self.columns)
 
     def _op_dataframe(self, op: str, other: DataFrame) -> DataFrame:
         if set(self.columns) != set(other.columns):
             msg = "Can only compare identically-labeled (both index and columns) DataFrame objects"
             raise ValueError(msg)
-        return DataFrame(
-            (getattr(s, op)(other.loc[idx]) for idx, s in self.iterrows()), index=self.index, columns=self.columns
+        other_columns = self.columns._take_aligned(other.columns, other._data)  # noqa: SLF001
+        data = Array(
+            [
+                getattr(col, op)(self.index._take_aligned(other.index, o))  # noqa: SLF001
+                for col, o in zip(self._data, other_columns)
+            ]
         )
+        return DataFrame._from_aligned(data, self.index, self.columns)
 
     def _op_scalar(self, op: str, other: ArrayLike | Scalar) -> DataFrame:
-        return DataFrame((getattr(s, op)(other) for _, s in self.iterrows()))
+        return DataFrame._from_aligned(Array([getattr(col, op)(other) for col in self._data]), self.index, self.columns)
 
     def __lt__(self, other: DataFrame | Series | ArrayLike | Scalar) -> DataFrame:  # type: ignore
         """
@@ -3237,8 +5323,9 @@ class DataFrame:
             msg = f"shapes {Series(other).shape} and {self.shape} not aligned"
             raise ValueError(msg)
         other = Series(other, index=self.index)
-        data = [other.dot(s_a) for s_a in self.T.values]
-        return Series(data, index=self.columns, name=other.name)
+        values = other._data.data
+        data = Array([_sumprod(values, col.data) for col in self._data])
+        return Series._from_aligned(data, self.columns, other.name)
 
     def __rtruediv__(self, other: DataFrame | Series | ArrayLike | Scalar) -> DataFrame:
         return self._op("__rtruediv__", other)
@@ -3274,6 +5361,7 @@ class DataFrame:
     # In-place Operators
     ###########################################################################
     def _iop(self, op: str, other: DataFrame | Series | Mapping | ArrayLike | Scalar) -> Self:
+        self._ensure_writable()
         match other:
             case DataFrame():
                 return self._iop_dataframe(op, other)
@@ -3296,21 +5384,22 @@ class DataFrame:
         if len(self.columns) != len(other):
             msg = "Operands are not aligned. Do `left, right = left.align(right, axis=1, copy=False)` before operating."
             raise ValueError(msg)
-        for s in self.values:
-            getattr(s, op)(other)
+        other_values = self.columns._take_aligned(other.index, other._data)  # noqa: SLF001
+        for col, o in zip(self._data, other_values):
+            getattr(col, op)(o)
         return self
 
     def _iop_dataframe(self, op: str, other: DataFrame) -> Self:
         if set(self.columns) != set(other.columns) or self.shape != other.shape:
             msg = "Can only compare identically-labeled (both index and columns) DataFrame objects"
             raise ValueError(msg)
-        for s, o in zip(self.values, other.values):
-            getattr(s, op)(o)
+        for col, o in zip(self._data, other._data):
+            getattr(col, op)(o)
         return self
 
     def _iop_scalar(self, op: str, other: ArrayLike[Any] | Scalar) -> Self:
-        for s in self.values:
-            getattr(s, op)(other)
+        for col in self._data:
+            getattr(col, op)(other)
         return self
 
     def __iadd__(self, other: DataFrame | Series | ArrayLike | Scalar) -> Self:
@@ -3361,13 +5450,831 @@ class DataFrame:
     # Unary Operators
     ###########################################################################
     def __neg__(self) -> DataFrame:
-        return DataFrame([-s for s in self.values], index=self.index, columns=self.columns)  # type: ignore
+        return DataFrame._from_aligned(Array([-col for col in self._data]), self.index, self.columns)
 
     def __pos__(self) -> DataFrame:
-        return DataFrame([+s for s in self.values], index=self.index, columns=self.columns)  # type: ignore
+        return DataFrame._from_aligned(Array([+col for col in self._data]), self.index, self.columns)
 
     def __abs__(self) -> DataFrame:
         return self.abs()
 
     def __invert__(self) -> DataFrame:
-        return DataFrame([~s for s in self.values], index=self.index, columns=self.columns)  # type: ignore
+        return DataFrame._from_aligned(Array([~col for col in self._data]), self.index, self.columns)
+
+
+class LazyFrame:
+    """
+    Deferred element-wise computation over a DataFrame, created by `DataFrame.lazy`.
+
+    Operators on a LazyFrame record a plan instead of computing an intermediate DataFrame for every
+    step. `collect` fuses the whole plan into a single loop per column, eg:
+    `((df.lazy() + 1) * 2 - df2).abs().collect()`.
+
+    The result is labeled like the DataFrame `lazy` was called on. Other DataFrames, Series and
+    collections are aligned when they are recorded, following the same rules as the DataFrame
+    operators. The operands are copied (copy-on-write), so modifying them afterwards does not change
+    the result.
+    """
+
+    _frame: DataFrame
+    _plan: tuple
+    __slots__ = ("_frame", "_plan")
+    # `==` records a comparison instead of testing equality, so LazyFrames are not hashable
+    __hash__ = None  # type: ignore
+
+    def __init__(self, frame: DataFrame):
+        """
+        Initializes a LazyFrame that starts from the values of a DataFrame.
+
+        Args:
+            frame (DataFrame): The DataFrame.
+        """
+        self._frame = frame.copy()
+        self._plan = ("column", list(self._frame._data))  # noqa: SLF001
+
+    @classmethod
+    def _from_plan(cls, frame: DataFrame, plan: tuple) -> LazyFrame:
+        lazy = cls.__new__(cls)
+        lazy._frame = frame  # noqa: SLF001
+        lazy._plan = plan  # noqa: SLF001
+        return lazy
+
+    def __repr__(self) -> str:
+        key = _plan_key(self._plan, [], [])
+        return f"LazyFrame({ast.unparse(_plan_expression(key))})"
+
+    def collect(self) -> DataFrame:
+        """
+        Computes the plan in a single loop per column.
+
+        Returns:
+            DataFrame: The result, with the index and columns of the DataFrame the LazyFrame started from.
+        """
+        columns: list[list[Array]] = []
+        values: list[list[Any]] = []
+        key = _plan_key(self._plan, columns, values)
+        func = _compile_plan(key, len(columns), len(values))
+        data = []
+        for j in range(len(self._frame.columns)):
+            result = func(*[c[j].data for c in columns], *[v[j] for v in values])
+            mask = _mask_or_array(result) if key[0] in _PLAN_COMPARE or key[0] in _PLAN_BOOLEAN else None
+            data.append(mask if isinstance(mask, Mask) else columns[0][j]._new(result))  # noqa: SLF001
+        return DataFrame._from_aligned(Array(data), self._frame.index, self._frame.columns)  # noqa: SLF001
+
+    def _operand(self, other: LazyFrame | DataFrame | Series | Mapping | ArrayLike | Scalar) -> tuple:
+        # Records `other` as a plan aligned with this LazyFrame's DataFrame
+        frame = self._frame
+        if isinstance(other, LazyFrame):
+            if other._frame.index._equals(frame.index) and other._frame.columns._equals(frame.columns):  # noqa: SLF001
+                return other._plan  # noqa: SLF001
+            other = other.collect()
+        match other:
+            case DataFrame():
+                if set(frame.columns) != set(other.columns):
+                    msg = "Can only compare identically-labeled (both index and columns) DataFrame objects"
+                    raise ValueError(msg)
+                other = other.copy()
+                other_columns = frame.columns._take_aligned(other.columns, other._data)  # noqa: SLF001
+                return ("column", [frame.index._take_aligned(other.index, o) for o in other_columns])  # noqa: SLF001
+            case Series():
+                if len(frame.columns) != len(other):
+                    msg = "Operands are not aligned. Do `left, right = left.align(right, axis=1, copy=False)` before operating."
+                    raise ValueError(msg)
+                return ("value", list(frame.columns._take_aligned(other.index, other._data)))  # noqa: SLF001
+            case ArrayLike() | Mapping() as c if len(c) != len(frame.columns):
+                msg = f"Unable to coerce to Series, length must be {len(frame.columns)}: given {len(other)}"
+                raise ValueError(msg)
+            case Mapping():
+                return self._operand(Series(other))
+            case ArrayLike() as c if not isinstance(c, str):
+                return ("value", list(c))
+            case _:  # Everithing else is a scalar then
+                return ("value", [other] * len(frame.columns))
+
+    def _op(self, op: str, other: LazyFrame | DataFrame | Series | Mapping | ArrayLike | Scalar) -> LazyFrame:
+        return LazyFrame._from_plan(self._frame, (op, self._plan, self._operand(other)))
+
+    def _rop(self, op: str, other: LazyFrame | DataFrame | Series | Mapping | ArrayLike | Scalar) -> LazyFrame:
+        return LazyFrame._from_plan(self._frame, (op, self._operand(other), self._plan))
+
+    def abs(self) -> LazyFrame:
+        """
+        Records the absolute values.
+
+        Returns:
+            LazyFrame: The LazyFrame with the operation recorded.
+        """
+        return LazyFrame._from_plan(self._frame, ("__abs__", self._plan))
+
+    ###########################################################################
+    # Comparisons
+    ###########################################################################
+    def __lt__(self, other: LazyFrame | DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._op("__lt__", other)
+
+    def __le__(self, other: LazyFrame | DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._op("__le__", other)
+
+    def __eq__(self, other: LazyFrame | DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:  # type: ignore
+        return self._op("__eq__", other)
+
+    def __ne__(self, other: LazyFrame | DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:  # type: ignore
+        return self._op("__ne__", other)
+
+    def __gt__(self, other: LazyFrame | DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._op("__gt__", other)
+
+    def __ge__(self, other: LazyFrame | DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._op("__ge__", other)
+
+    ###########################################################################
+    # Operators
+    ###########################################################################
+    def __add__(self, other: LazyFrame | DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._op("__add__", other)
+
+    def __sub__(self, other: LazyFrame | DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._op("__sub__", other)
+
+    def __mul__(self, other: LazyFrame | DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._op("__mul__", other)
+
+    def __truediv__(self, other: LazyFrame | DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._op("__truediv__", other)
+
+    def __floordiv__(self, other: LazyFrame | DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._op("__floordiv__", other)
+
+    def __mod__(self, other: LazyFrame | DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._op("__mod__", other)
+
+    def __divmod__(self, other: LazyFrame | DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._op("__divmod__", other)
+
+    def __pow__(self, other: LazyFrame | DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._op("__pow__", other)
+
+    def __lshift__(self, other: LazyFrame | DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._op("__lshift__", other)
+
+    def __rshift__(self, other: LazyFrame | DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._op("__rshift__", other)
+
+    def __and__(self, other: LazyFrame | DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._op("__and__", other)
+
+    def __xor__(self, other: LazyFrame | DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._op("__xor__", other)
+
+    def __or__(self, other: LazyFrame | DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._op("__or__", other)
+
+    ###########################################################################
+    # Right-hand Side Operators
+    ###########################################################################
+    def __radd__(self, other: DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._rop("__add__", other)
+
+    def __rsub__(self, other: DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._rop("__sub__", other)
+
+    def __rmul__(self, other: DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._rop("__mul__", other)
+
+    def __rtruediv__(self, other: DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._rop("__truediv__", other)
+
+    def __rfloordiv__(self, other: DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._rop("__floordiv__", other)
+
+    def __rmod__(self, other: DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._rop("__mod__", other)
+
+    def __rdivmod__(self, other: DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._rop("__divmod__", other)
+
+    def __rpow__(self, other: DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._rop("__pow__", other)
+
+    def __rlshift__(self, other: DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._rop("__lshift__", other)
+
+    def __rrshift__(self, other: DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._rop("__rshift__", other)
+
+    def __rand__(self, other: DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._rop("__and__", other)
+
+    def __rxor__(self, other: DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._rop("__xor__", other)
+
+    def __ror__(self, other: DataFrame | Series | ArrayLike | Scalar) -> LazyFrame:
+        return self._rop("__or__", other)
+
+    ###########################################################################
+    # Unary Operators
+    ###########################################################################
+    def __neg__(self) -> LazyFrame:
+        return LazyFrame._from_plan(self._frame, ("__neg__", self._plan))
+
+    def __pos__(self) -> LazyFrame:
+        return LazyFrame._from_plan(self._frame, ("__pos__", self._plan))
+
+    def __abs__(self) -> LazyFrame:
+        return self.abs()
+
+    def __invert__(self) -> LazyFrame:
+        return LazyFrame._from_plan(self._frame, ("__invert__", self._plan))
+
+
+class DataFrameBuilder:
+    """
+    Collects rows one at a time and builds a DataFrame from them at once. Appending a row is amortized
+    O(1), while appending rows to a DataFrame one by one copies all of its data every time.
+
+    Examples:
+        >>> builder = DataFrameBuilder(["a", "b"])
+        >>> builder.append({"a": 1, "b": 2})
+        >>> builder.append([3, 4])
+        >>> df = builder.build()
+    """
+
+    def __init__(self, columns: Index | IndexLike):
+        """
+        Initializes a DataFrameBuilder object.
+
+        Args:
+            columns (Index | IndexLike): Column labels of the DataFrame.
+        """
+        self._columns = Index(columns)
+        self._positions = {label: i for i, label in enumerate(self._columns)}
+        self._data: list[list[Any]] = [[] for _ in self._columns]
+        self._labels: list[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._data[0]) if len(self._data) > 0 else len(self._labels)
+
+    def append(self, row: Mapping[Scalar, Any] | ArrayLike, label: Scalar | None = None):
+        """
+        Appends a row.
+
+        Args:
+            row (Mapping | ArrayLike): The row values, either mapped by column label or in column order.
+                Columns missing from a mapping are filled with None.
+            label (Scalar, optional): Index label of the row. Either every row or no row has a label,
+                in which case rows are labeled by position. Defaults to None.
+
+        Raises:
+            KeyError: If a mapping has labels that are not columns.
+            ValueError: If a sequence does not have one value per column, or if only some rows have labels.
+        """
+        if (label is None) != (len(self._labels) == 0) and len(self) > 0:
+            msg = "Either every row or no row must have a label"
+            raise ValueError(msg)
+        match row:
+            case Mapping():
+                if not row.keys() <= self._positions.keys():
+                    msg = f"Columns not found: {[key for key in row if key not in self._positions]}"
+                    raise KeyError(msg)
+                for col, values in zip(self._columns, self._data):
+                    values.append(row.get(col))
+            case _:
+                if len(row) != len(self._data):
+                    msg = f"Row has {len(row)} values, expected {len(self._data)}"
+                    raise ValueError(msg)
+                for values, value in zip(self._data, row):
+                    values.append(value)
+        if label is not None:
+            self._labels.append(label)
+
+    def extend(self, rows: Iterable[Mapping[Scalar, Any] | ArrayLike]):
+        """
+        Appends several rows, labeled by position.
+
+        Args:
+            rows (Iterable[Mapping | ArrayLike]): The rows to append.
+        """
+        for row in rows:
+            self.append(row)
+
+    def build(self) -> DataFrame:
+        """
+        Builds a DataFrame with the rows appended so far. The builder can keep being used afterwards.
+
+        Returns:
+            DataFrame: The new DataFrame.
+        """
+        index = Index(self._labels) if len(self._labels) > 0 else RangeIndex(len(self))
+        return DataFrame._from_aligned(Array([Array(values) for values in self._data]), index, self._columns)  # noqa: SLF001
+
+
+###########################################################################
+# GroupBy
+###########################################################################
+class _Grouper:
+    """
+    Hash table from group key to group code, built in a single pass over the keys.
+
+    Every row gets the code of its group, so aggregations walk a column once and
+    update one accumulator per group instead of materializing each group.
+
+    Like pandas, rows whose key is None or NaN are dropped. They get the code -1, so accumulators
+    have an extra last slot that collects them and is never read.
+    """
+
+    def __init__(self, keys: Iterable[Any], name: Scalar | None, *, sort: bool):
+        table: dict[Any, int] = {}
+        self.codes = [-1 if _is_na_key(key) else table.setdefault(key, len(table)) for key in keys]
+        self.ngroups = len(table)
+        labels = list(table)
+        self.order = sorted(range(self.ngroups), key=labels.__getitem__) if sort else list(range(self.ngroups))
+        self.index = Index([labels[g] for g in self.order], name=name)
+
+    @functools.cached_property
+    def positions(self) -> list[list[int]]:
+        positions: list[list[int]] = [[] for _ in range(self.ngroups + 1)]
+        for i, g in enumerate(self.codes):
+            positions[g].append(i)
+        return positions[:-1]
+
+    def _ordered(self, acc: list[Any]) -> Array:
+        return Array([acc[g] for g in self.order])
+
+    def size(self) -> Array:
+        acc = [0] * (self.ngroups + 1)
+        for g in self.codes:
+            acc[g] += 1
+        return self._ordered(acc)
+
+    # The aggregations below skip None values, like count
+    def count(self, values: Iterable[Any]) -> Array:
+        acc = [0] * (self.ngroups + 1)
+        for g, v in zip(self.codes, values):
+            if v is not None:
+                acc[g] += 1
+        return self._ordered(acc)
+
+    def sum(self, values: Iterable[Any]) -> Array:
+        acc: list[Any] = [0] * (self.ngroups + 1)
+        for g, v in zip(self.codes, values):
+            if v is not None:
+                acc[g] += v
+        return self._ordered(acc)
+
+    def mean(self, values: Iterable[Any]) -> Array:
+        sums: list[Any] = [0] * (self.ngroups + 1)
+        counts = [0] * (self.ngroups + 1)
+        for g, v in zip(self.codes, values):
+            if v is not None:
+                sums[g] += v
+                counts[g] += 1
+        return self._ordered([s / c if c > 0 else None for s, c in zip(sums, counts)])
+
+    def _extreme(self, values: Iterable[Any], pick: Callable[[Any, Any], Any]) -> Array:
+        acc: list[Any] = [_NO_VALUE] * (self.ngroups + 1)
+        for g, v in zip(self.codes, values):
+            if v is not None:
+                a = acc[g]
+                acc[g] = v if a is _NO_VALUE else pick(a, v)
+        return self._ordered([None if a is _NO_VALUE else a for a in acc])
+
+    def min(self, values: Iterable[Any]) -> Array:
+        return self._extreme(values, min)
+
+    def max(self, values: Iterable[Any]) -> Array:
+        return self._extreme(values, max)
+
+    def apply(self, values: Array, func: Callable[[Array], Any]) -> Array:
+        data = values.data
+        return self._ordered([func(Array([data[i] for i in pos])) for pos in self.positions])
+
+    def aggregate(self, values: Array, func: Callable[[Array], Any] | str) -> Array:
+        match func:
+            case "count" | "sum" | "mean" | "min" | "max":
+                return getattr(self, func)(values)
+            case str():
+                msg = f"Unknown aggregation: {func!r}"
+                raise ValueError(msg)
+            case _:
+                return self.apply(values, func)
+
+
+_NO_VALUE = object()
+
+
+def _is_na_key(key: Any) -> bool:
+    # None or NaN, or a tuple of keys (grouping by several columns) holding one
+    if isinstance(key, tuple):
+        return any(_is_na_key(k) for k in key)
+    return key is None or key != key  # noqa: PLR0124
+
+
+class SeriesGroupBy:
+    """
+    Series grouped by a key, returned by `Series.groupby` or by selecting a column of a `DataFrameGroupBy`.
+
+    Aggregations return a Series indexed by the group keys.
+    """
+
+    def __init__(self, series: Series, grouper: _Grouper):
+        self._series = series
+        self._grouper = grouper
+
+    def __len__(self) -> int:
+        return self._grouper.ngroups
+
+    def __iter__(self) -> Iterator[tuple[Any, Series]]:
+        for g, key in zip(self._grouper.order, self._grouper.index):
+            yield key, self._series.iloc[self._grouper.positions[g]]
+
+    def _wrap(self, values: Array) -> Series:
+        return Series._from_aligned(values, self._grouper.index, self._series.name)  # noqa: SLF001
+
+    def size(self) -> Series:
+        """
+        Returns the number of rows in each group.
+
+        Returns:
+            Series: Group sizes
+        """
+        return self._wrap(self._grouper.size())
+
+    def count(self) -> Series:
+        """
+        Returns the number of non-None values in each group.
+
+        Returns:
+            Series: Group counts
+        """
+        return self._wrap(self._grouper.count(self._series._data))  # noqa: SLF001
+
+    def sum(self) -> Series:
+        """
+        Returns the sum of each group.
+
+        Returns:
+            Series: Group sums
+        """
+        return self._wrap(self._grouper.sum(self._series._data))  # noqa: SLF001
+
+    def mean(self) -> Series:
+        """
+        Returns the mean of each group.
+
+        Returns:
+            Series: Group means
+        """
+        return self._wrap(self._grouper.mean(self._series._data))  # noqa: SLF001
+
+    def min(self) -> Series:
+        """
+        Returns the minimum value of each group.
+
+        Returns:
+            Series: Group minimums
+        """
+        return self._wrap(self._grouper.min(self._series._data))  # noqa: SLF001
+
+    def max(self) -> Series:
+        """
+        Returns the maximum value of each group.
+
+        Returns:
+            Series: Group maximums
+        """
+        return self._wrap(self._grouper.max(self._series._data))  # noqa: SLF001
+
+    def agg(self, func: Callable[[Array], Any] | str) -> Series:
+        """
+        Aggregates each group.
+
+        Args:
+            func (Callable[[Array], Any] | str): A function receiving the group values, or the
+                name of a built-in aggregation ("count", "sum", "mean", "min" or "max").
+
+        Returns:
+            Series: The aggregated values
+        """
+        return self._wrap(self._grouper.aggregate(self._series._data, func))  # noqa: SLF001
+
+
+class DataFrameGroupBy:
+    """
+    DataFrame grouped by one or more columns, returned by `DataFrame.groupby`.
+
+    Aggregations return a DataFrame indexed by the group keys with one column per non-key column.
+    """
+
+    def __init__(self, frame: DataFrame, grouper: _Grouper, columns: Index, data: Array):
+        self._frame = frame
+        self._grouper = grouper
+        self._columns = columns
+        self._data = data
+
+    def __len__(self) -> int:
+        return self._grouper.ngroups
+
+    def __iter__(self) -> Iterator[tuple[Any, DataFrame]]:
+        for g, key in zip(self._grouper.order, self._grouper.index):
+            yield key, self._frame.iloc[self._grouper.positions[g]]
+
+    @overload
+    def __getitem__(self, key: Scalar) -> SeriesGroupBy: ...  # no cov
+    @overload
+    def __getitem__(self, key: list[Scalar]) -> DataFrameGroupBy: ...  # no cov
+    def __getitem__(self, key: Scalar | list[Scalar]) -> SeriesGroupBy | DataFrameGroupBy:
+        lookup = dict(zip(self._columns, self._data))
+        labels = key if isinstance(key, list) else [key]
+        if missing := [label for label in labels if label not in lookup]:
+            msg = f"Columns not found: {missing}"
+            raise KeyError(msg)
+        if isinstance(key, list):
+            return DataFrameGroupBy(self._frame, self._grouper, Index(key), Array([lookup[k] for k in key]))
+        series = Series._from_aligned(lookup[key], self._frame.index, key)  # noqa: SLF001
+        return SeriesGroupBy(series, self._grouper)
+
+    def _aggregate(self, func: Callable[[Array], Any] | str) -> DataFrame:
+        data = Array([self._grouper.aggregate(col, func) for col in self._data])
+        return DataFrame._from_aligned(data, self._grouper.index, self._columns)  # noqa: SLF001
+
+    def size(self) -> Series:
+        """
+        Returns the number of rows in each group.
+
+        Returns:
+            Series: Group sizes
+        """
+        return Series._from_aligned(self._grouper.size(), self._grouper.index)  # noqa: SLF001
+
+    def count(self) -> DataFrame:
+        """
+        Returns the number of non-None values of each column in each group.
+
+        Returns:
+            DataFrame: Group counts
+        """
+        return self._aggregate("count")
+
+    def sum(self) -> DataFrame:
+        """
+        Returns the sum of each column in each group.
+
+        Returns:
+            DataFrame: Group sums
+        """
+        return self._aggregate("sum")
+
+    def mean(self) -> DataFrame:
+        """
+        Returns the mean of each column in each group.
+
+        Returns:
+            DataFrame: Group means
+        """
+        return self._aggregate("mean")
+
+    def min(self) -> DataFrame:
+        """
+        Returns the minimum of each column in each group.
+
+        Returns:
+            DataFrame: Group minimums
+        """
+        return self._aggregate("min")
+
+    def max(self) -> DataFrame:
+        """
+        Returns the maximum of each column in each group.
+
+        Returns:
+            DataFrame: Group maximums
+        """
+        return self._aggregate("max")
+
+    def agg(self, func: Callable[[Array], Any] | str | Mapping[Scalar, Callable[[Array], Any] | str]) -> DataFrame:
+        """
+        Aggregates each column in each group.
+
+        Args:
+            func (Callable[[Array], Any] | str | Mapping): A function receiving the group values, the
+                name of a built-in aggregation ("count", "sum", "mean", "min" or "max"), or a mapping
+                from column label to either of those.
+
+        Returns:
+            DataFrame: The aggregated values
+        """
+        if not isinstance(func, Mapping):
+            return self._aggregate(func)
+        selected = self[list(func)]
+        return DataFrame._from_aligned(  # noqa: SLF001
+            Array([self._grouper.aggregate(col, f) for col, f in zip(selected._data, func.values())]),  # noqa: SLF001
+            self._grouper.index,
+            selected._columns,  # noqa: SLF001
+        )
+
+
+###########################################################################
+# I/O
+###########################################################################
+_CSV_BOOLEANS = {"True": True, "False": False, "true": True, "false": False, "TRUE": True, "FALSE": False}
+# Fields read as missing, the same as the pandas defaults
+_CSV_NA = frozenset(
+    {
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    }
+)
+# Plain decimal numbers only: int() and float() also accept "1_000", " 1 ", "inf" and non ASCII digits
+_CSV_INT = re.compile(r"[+-]?[0-9]+")
+_CSV_FLOAT = re.compile(r"[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?")
+
+
+def _parse_int(value: str) -> int:
+    if _CSV_INT.fullmatch(value) is None:
+        msg = f"Not an int: {value!r}"
+        raise ValueError(msg)
+    return int(value)
+
+
+def _parse_float(value: str) -> float:
+    if _CSV_FLOAT.fullmatch(value) is None:
+        msg = f"Not a float: {value!r}"
+        raise ValueError(msg)
+    return float(value)
+
+
+def _parse_bool(value: str) -> bool:
+    try:
+        return _CSV_BOOLEANS[value]
+    except KeyError:
+        msg = f"Not a boolean: {value!r}"
+        raise ValueError(msg) from None
+
+
+def _infer_csv_column(values: Sequence[str]) -> Array:
+    # Picks the first parser that accepts every present field. Missing fields become None.
+    for parse in (_parse_int, _parse_float, _parse_bool):
+        try:
+            return Array([parse(v) if v not in _CSV_NA else None for v in values])
+        except ValueError:
+            continue
+    return Array([v if v not in _CSV_NA else None for v in values])
+
+
+def _csv_frame(
+    rows: list[list[str]],
+    columns: Index,
+    start: int,
+    index_col: Scalar | None,
+    converters: Mapping[Scalar, Callable[[str], Any]],
+) -> DataFrame:
+    raw_columns = list(zip(*rows)) if len(rows) > 0 else [() for _ in columns]
+    data = Array(
+        [
+            Array([converters[col](v) for v in raw]) if col in converters else _infer_csv_column(raw)
+            for col, raw in zip(columns, raw_columns)
+        ]
+    )
+    if index_col is None:
+        return DataFrame._from_aligned(data, Index(range(start, start + len(rows))), columns)  # noqa: SLF001
+    i = columns.get_ilocs(index_col) if index_col in columns else None
+    if not isinstance(i, int):
+        msg = f"Index column not found or not unique: {index_col!r}"
+        raise KeyError(msg)
+    index = Index(data.pop(i), name=index_col)
+    return DataFrame._from_aligned(data, index, Index([*columns[:i], *columns[i + 1 :]]))  # noqa: SLF001
+
+
+def _read_csv_chunks(
+    lines: Iterable[str],
+    sep: str,
+    header: int | None,
+    names: IndexLike | None,
+    index_col: Scalar | None,
+    converters: Mapping[Scalar, Callable[[str], Any]],
+    chunksize: int | None,
+) -> Generator[DataFrame]:
+    reader: Iterator[list[str]] = (row for row in csv.reader(lines, delimiter=sep) if len(row) > 0)
+    if header is not None:
+        for _ in range(header):
+            next(reader, None)
+        header_row = next(reader, [])
+        names = header_row if names is None else names
+    elif names is None:
+        first_row = next(reader, [])
+        names = list(range(len(first_row)))
+        reader = itertools.chain([first_row] if len(first_row) > 0 else [], reader)
+    columns = Index(names)
+
+    start = 0
+    while True:
+        rows = list(itertools.islice(reader, chunksize))
+        for line, row in enumerate(rows, start=start):
+            if len(row) != len(columns):
+                msg = f"Expected {len(columns)} fields in data row {line}, saw {len(row)}"
+                raise ValueError(msg)
+        if len(rows) == 0 and start > 0:
+            return
+        yield _csv_frame(rows, columns, start, index_col, converters)
+        start += len(rows)
+        if chunksize is None or len(rows) < chunksize:
+            return
+
+
+@overload
+def read_csv(
+    filepath_or_buffer: str | os.PathLike | Iterable[str],
+    *,
+    sep: str = ",",
+    header: int | None = 0,
+    names: IndexLike | None = None,
+    index_col: Scalar | None = None,
+    converters: Mapping[Scalar, Callable[[str], Any]] | None = None,
+    chunksize: None = None,
+    encoding: str = "utf-8",
+) -> DataFrame: ...  # no cov
+@overload
+def read_csv(
+    filepath_or_buffer: str | os.PathLike | Iterable[str],
+    *,
+    sep: str = ",",
+    header: int | None = 0,
+    names: IndexLike | None = None,
+    index_col: Scalar | None = None,
+    converters: Mapping[Scalar, Callable[[str], Any]] | None = None,
+    chunksize: int,
+    encoding: str = "utf-8",
+) -> Iterator[DataFrame]: ...  # no cov
+def read_csv(
+    filepath_or_buffer: str | os.PathLike | Iterable[str],
+    *,
+    sep: str = ",",
+    header: int | None = 0,
+    names: IndexLike | None = None,
+    index_col: Scalar | None = None,
+    converters: Mapping[Scalar, Callable[[str], Any]] | None = None,
+    chunksize: int | None = None,
+    encoding: str = "utf-8",
+) -> DataFrame | Iterator[DataFrame]:
+    """
+    Reads a comma-separated values (csv) file into a DataFrame.
+
+    Each column type is inferred from its values: int, float and bool are tried in that order and
+    str is used otherwise. Only plain decimal numbers are parsed, so fields like "1_000" or "inf"
+    stay strings. Empty fields and the pandas missing value markers (eg: "NA", "nan", "null") become
+    None. Columns are built directly from the parsed fields, without creating a Series per row.
+
+    Args:
+        filepath_or_buffer (str | PathLike | Iterable[str]): Path to the file or an iterable of lines
+            (eg: an open file).
+        sep (str, optional): Field delimiter. Defaults to ",".
+        header (int | None, optional): Row number of the column labels, rows before it are skipped.
+            None means the file has no header. Defaults to 0.
+        names (IndexLike, optional): Column labels to use instead of the header. Defaults to None.
+        index_col (Scalar, optional): Column to use as the index. Defaults to None.
+        converters (Mapping[Scalar, Callable[[str], Any]], optional): Functions to convert the
+            values of some columns, skipping type inference. Defaults to None.
+        chunksize (int, optional): If set, returns an iterator of DataFrames with up to `chunksize`
+            rows each, so large files can be processed in bounded memory. As in pandas, the column
+            types are inferred for each chunk on its own, so a column may be int in one chunk and
+            str in the next. Use `converters` to fix them. Defaults to None.
+        encoding (str, optional): File encoding when a path is given. Defaults to "utf-8".
+
+    Returns:
+        DataFrame | Iterator[DataFrame]: The data, or an iterator over chunks of it.
+
+    Raises:
+        ValueError: If a row does not have as many fields as there are columns.
+    """
+    if chunksize is not None and chunksize < 1:
+        msg = f"chunksize must be a positive integer, got {chunksize}"
+        raise ValueError(msg)
+
+    def chunks() -> Generator[DataFrame]:
+        args = (sep, header, names, index_col, converters or {}, chunksize)
+        if isinstance(filepath_or_buffer, (str, os.PathLike)):
+            with open(filepath_or_buffer, newline="", encoding=encoding) as f:
+                yield from _read_csv_chunks(f, *args)
+        else:
+            yield from _read_csv_chunks(filepath_or_buffer, *args)
+
+    if chunksize is None:
+        return next(chunks())
+    return chunks()
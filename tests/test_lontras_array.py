@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: 2025-present Luiz Eduardo Amaral <luizamaral306@gmail.com>
 #
 # SPDX-License-Identifier: MIT
+import sys
 from itertools import combinations, product
 
 import numpy as np
@@ -224,6 +225,25 @@ class TestArrayMapReduce:
         a = lt.Array(example_values)
         assert a.map(lambda x: x**2) == [v**2 for v in example_values]
 
+    def test_map_workers(self):
+        values = list(range(-1500, 1500))
+        assert lt.Array(values).map(abs, workers=2) == [abs(v) for v in values]
+        assert lt.Array(values).map(abs, workers=2, chunksize=7) == [abs(v) for v in values]
+
+    def test_map_workers_short(self):
+        a = lt.Array(example_values)
+        assert a.map(abs, workers=2) == [abs(v) for v in example_values]
+
+    @pytest.mark.parametrize("size", [5, 1_000])
+    def test_map_workers_unpicklable(self, size):
+        # Lambdas can't be sent to worker processes, whatever the number of values
+        a = lt.Array(range(size))
+        if getattr(sys, "_is_gil_enabled", lambda: True)():
+            with pytest.raises(TypeError, match="worker processes"):
+                a.map(lambda x: x**2, workers=2)
+        else:
+            assert a.map(lambda x: x**2, workers=2) == [v**2 for v in range(size)]
+
     def test_reduce(self):
         a = lt.Array(example_values)
         assert a.reduce(lambda acc, cur: acc + cur, 0) == sum(example_values)
@@ -447,3 +467,153 @@ class TestArrayUnaryOperators:
         s = lt.Array(example_values)
         ps = np.array(example_values)
         assert_array_equal_numpy(~s, ~ps)
+
+
+class TestArrayTyped:
+    def test_init_typed(self):
+        a = lt.Array(example_values, dtype="q")
+        na = np.array(example_values)
+        assert a.dtype == "q"
+        assert_array_equal_numpy(a, na)
+        assert lt.Array(example_values).dtype is None
+
+    def test_init_typed_error(self):
+        with pytest.raises(TypeError):
+            lt.Array(["a", "b"], dtype="d")
+
+    def test_init_keeps_dtype(self):
+        a = lt.Array(example_values, dtype="d")
+        assert lt.Array(a).dtype == "d"
+        assert lt.Array.full(3, 1, dtype="d").dtype == "d"
+        assert lt.Index(a).dtype is None
+
+    def test__repr__(self):
+        a = lt.Array([1, 2], dtype="q")
+        assert str(a) == 'Array([1, 2], dtype="q")'
+
+    def test_getitem_keeps_dtype(self):
+        a = lt.Array(example_values, dtype="q")
+        assert a[1:3].dtype == "q"
+        assert a[[0, 2]].dtype == "q"
+        assert a[[True, False, True, False, True]].dtype == "q"
+
+    @pytest.mark.parametrize("op", ["__add__", "__sub__", "__mul__", "__floordiv__", "__mod__", "__radd__"])
+    def test_op_keeps_dtype(self, op):
+        a = lt.Array(example_values, dtype="q")
+        na = np.array(example_values)
+        result = getattr(a, op)(example_cmp_scalar)
+        assert result.dtype == "q"
+        assert_array_equal_numpy(result, getattr(na, op)(example_cmp_scalar))
+
+    def test_op_falls_back_to_untyped(self):
+        a = lt.Array(example_values, dtype="q")
+        na = np.array(example_values)
+        result = a / 2
+        assert result.dtype is None
+        assert_array_equal_numpy(result, na / 2)
+        assert (a < 1).dtype is None
+
+    def test_sort(self):
+        a = lt.Array([3, 1, 2], dtype="q")
+        a.sort()
+        assert a.dtype == "q"
+        assert a.to_list() == [1, 2, 3]
+
+    def test_series_and_dataframe(self):
+        a = lt.Array(example_values, dtype="d")
+        s = lt.Series(a)
+        assert s.values.dtype == "d"
+        assert (s + s).values.dtype == "d"
+        df = lt.DataFrame({"a": a})
+        assert df["a"].values.dtype == "d"
+        assert (df * 2)["a"].values.dtype == "d"
+
+    def test_memory_usage(self):
+        values = [float(v) for v in range(1000)]
+        untyped, typed = lt.Array(values), lt.Array(values, dtype="d")
+        assert typed.memory_usage(deep=True) == typed.memory_usage() < untyped.memory_usage(deep=True)
+        assert untyped.memory_usage(deep=True) - untyped.memory_usage() == sum(map(sys.getsizeof, values))
+        # Repeated objects are counted once
+        assert lt.Array([values[-1]] * 1000).memory_usage(deep=True) < untyped.memory_usage(deep=True)
+
+
+class TestMask:
+    @pytest.mark.parametrize("op", ["__lt__", "__le__", "__eq__", "__ne__", "__gt__", "__ge__"])
+    def test_comparisons_build_masks(self, op):
+        a = lt.Array(example_values)
+        na = np.array(example_values)
+        mask = getattr(a, op)(example_cmp_scalar)
+        assert isinstance(mask, lt.Mask)
+        assert_array_equal_numpy(mask, getattr(na, op)(example_cmp_scalar))
+        assert mask.popcount == getattr(na, op)(example_cmp_scalar).sum()
+
+    def test_non_boolean_comparisons(self):
+        class Weird:
+            def __eq__(self, _other):
+                return "yes"
+
+            __hash__ = object.__hash__
+
+        assert type(lt.Array([Weird()]) == 1) is lt.Array
+
+    def test_init_error(self):
+        with pytest.raises(TypeError, match="booleans"):
+            lt.Mask([True, 1])
+
+    @pytest.mark.parametrize(
+        ("op", "nop"), [("__and__", np.logical_and), ("__or__", np.logical_or), ("__xor__", np.logical_xor)]
+    )
+    def test_combine(self, op, nop):
+        a = lt.Array(example_values)
+        na = np.array(example_values)
+        mask = getattr(a > 0, op)(a < 3)
+        assert isinstance(mask, lt.Mask)
+        assert_array_equal_numpy(mask, nop(na > 0, na < 3))
+
+    def test_invert(self):
+        mask = lt.Array(example_values) > 1
+        inverted = ~mask
+        assert isinstance(inverted, lt.Mask)
+        assert inverted.to_list() == [True, True, True, False, False]
+
+    def test_reductions(self):
+        mask = lt.Array(example_values) > 0
+        assert (mask.sum(), mask.all(), mask.any()) == (3, False, True)
+
+    def test_mutable(self):
+        mask = lt.Array(example_values) > 0
+        assert mask.popcount == 3
+        mask[0] = True
+        assert isinstance(mask, lt.Mask)
+        assert mask.popcount == 4
+        mask.append(False)
+        del mask[1]
+        assert isinstance(mask, lt.Mask)
+        assert (mask.to_list(), mask.popcount) == ([True, True, True, True, False], 4)
+        mask[1:3] = [1, 2]
+        assert type(mask) is lt.Array
+        assert mask.to_list() == [True, 1, 2, True, False]
+
+    def test_inplace_operators(self):
+        mask = lt.Array(example_values) > 0
+        mask += 1
+        assert type(mask) is lt.Array
+        assert mask.to_list() == [1, 1, 2, 2, 2]
+        mask = lt.Array(example_values) > 0
+        other = mask
+        mask &= lt.Array(example_values) < 3
+        assert other.to_list() == [False, False, True, True, True]
+        assert mask.to_list() == [False, False, True, True, False]
+
+    def test_series_values(self):
+        s = lt.Series(example_values) > 1
+        s.values[0] = True
+        assert s.to_list() == [True, False, False, True, True]
+        s += 1
+        assert s.to_list() == [2, 1, 1, 2, 2]
+
+    def test_getitem(self):
+        a = lt.Array(example_values, dtype="q")
+        assert a[a > 0].to_list() == [1, 2, 3]
+        with pytest.raises(IndexError, match="wrong length"):
+            a[lt.Mask([True, False])]
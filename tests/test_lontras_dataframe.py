@@ -2,7 +2,9 @@
 #
 # SPDX-License-Identifier: MIT
 
+import re
 import statistics
+from decimal import Decimal
 
 import pandas as pd
 import pytest
@@ -40,6 +42,16 @@ example_op_mapping = dict(enumerate(example_op_collection))
 example_op_a = [[-3, -1, 13, 1, 2], [10, 2, -1, -13, -4]]
 example_op_b = [[7, 2, -9, 1, 3], [-1, 20, -3, 12, 4]]
 example_unary = [[-3, -1, 0, 1, 2], [10, 2, -1, 0, -4]]
+example_merge_left = {"key": ["a", "b", "c", "a", "d"], "x": [1, 2, 3, 4, 5], "y": [0, 1, 0, 1, 0]}
+example_merge_right = {"key": ["b", "a", "e", "a"], "x": [10, 20, 30, 40]}
+example_sort = {"a": [2, 1, 2, 1, 3], "b": [5, 9, 4, 7, 4], "c": ["v", "w", "x", "y", "z"]}
+example_sort_index = [30, 10, 50, 20, 40]
+example_groupby = {
+    "key": ["b", "a", "b", "c", "a", "b"],
+    "sub": [1, 1, 2, 2, 1, 1],
+    "x": [1, 2, 3, 4, 5, 6],
+    "y": [1.5, 2.5, 3.5, 0.5, 5.5, -1.0],
+}
 
 
 class TestDataFrameInit:
@@ -196,6 +208,83 @@ class TestDataFrameInit:
         with pytest.raises(ValueError, match=match):
             lt.DataFrame([lt.Series({0: 1, 1: 2}), lt.Series({3: 4, 5: 6})])
 
+    @pytest.mark.parametrize("data", [[{"a": 0, "b": 1}, {"a": 3}], [{"a": 0}, {"b": 1}], [[0, 1, 2], [0, 1]]])
+    def test_init_constructor_error_misaligned_rows(self, data):
+        with pytest.raises(ValueError, match="Misaligned columns"):
+            lt.DataFrame(data)
+
+    def test_init_from_collection_of_unordered_mappings(self):
+        data = [{"a": 0, "b": 1}, {"b": 4, "a": 3}]
+        assert_dataframe_equal_pandas(lt.DataFrame(data), pd.DataFrame(data))
+
+    @pytest.mark.parametrize("columns", [["b", "a"], ["b"], lt.Index(["b", "a"])])
+    def test_init_mapping_selects_columns(self, columns):
+        data = {"a": [1, 2], "b": [3, 4]}
+        assert_dataframe_equal_pandas(lt.DataFrame(data, columns=columns), pd.DataFrame(data, columns=list(columns)))
+
+    @pytest.mark.parametrize(
+        ("data", "missing", "extra"),
+        [
+            ([{"a": 0, "b": 1}, {"a": 3, "c": 4}], "{'b'}", "{'c'}"),
+            ([{"a": 0, "b": 1}, {"a": 3}], "{'b'}", "{}"),
+            ([{"a": 0}, {"a": 3, "c": 4}], "{}", "{'c'}"),
+        ],
+    )
+    def test_init_constructor_error_misaligned_records(self, data, missing, extra):
+        with pytest.raises(ValueError, match=re.escape(f"Missing: {missing}, Extra: {extra}")):
+            lt.DataFrame(data)
+
+    def test_init_constructor_error_different_lengths(self):
+        assert_exception(
+            lambda: pd.DataFrame({"a": [1, 2], "b": [1]}), lambda: lt.DataFrame({"a": [1, 2], "b": [1]}), ValueError
+        )
+
+    @pytest.mark.parametrize("kwargs", [{}, {"index": example_index}, {"columns": ["x", "y"]}])
+    def test_from_columns(self, kwargs):
+        pdf = pd.DataFrame(example_dict_list, **kwargs)
+        if "columns" in kwargs:
+            pdf = pd.DataFrame(dict(zip(kwargs["columns"], example_dict_list.values())))
+        assert_dataframe_equal_pandas(lt.DataFrame.from_columns(example_dict_list, **kwargs), pdf)
+        columns = list(example_dict_list.values())
+        assert_dataframe_equal_pandas(
+            lt.DataFrame.from_columns(columns, **kwargs), pdf.set_axis(kwargs.get("columns", range(2)), axis=1)
+        )
+
+    def test_from_columns_adopts_arrays(self):
+        values = lt.Array([1, 2, 3], dtype="q")
+        df = lt.DataFrame.from_columns({"a": values, "b": lt.Series([4, 5, 6])})
+        assert df["a"].values.dtype == "q"
+        df += 10
+        assert values.to_list() == [1, 2, 3]
+
+    def test_from_columns_series_copy_on_write(self):
+        s = lt.Series([1, 2])
+        df = lt.DataFrame.from_columns({"a": s})
+        s[0] = 100
+        s.values[1] = 200
+        assert df["a"].to_dict() == {0: 1, 1: 2}
+        df += 1
+        assert s.to_dict() == {0: 100, 1: 200}
+
+    def test_from_records(self):
+        records = [{"a": 0, "b": 1}, {"b": 4, "a": 3}, {"a": 6, "c": 8}]
+        assert_dataframe_equal_pandas(
+            lt.DataFrame.from_records(records),
+            pd.DataFrame.from_records(records).astype(object).where(lambda x: x.notna(), None),
+        )
+        assert_dataframe_equal_pandas(
+            lt.DataFrame.from_records(example_list_dict, index=example_index),
+            pd.DataFrame.from_records(example_list_dict, index=example_index),
+        )
+
+    def test_from_rows(self):
+        assert_dataframe_equal_pandas(lt.DataFrame.from_rows(example_array), pd.DataFrame(example_array))
+        assert_dataframe_equal_pandas(
+            lt.DataFrame.from_rows(iter(map(tuple, example_array)), columns=example_columns),
+            pd.DataFrame(example_array, columns=example_columns),
+        )
+        assert_dataframe_equal_pandas(lt.DataFrame.from_rows([]), pd.DataFrame())
+
     #     def test_index_column_validator_index(self):
     #         df = lt.DataFrame(example_list_dict)
     #         df["a"] = df["a"].reindex([9, 8, 7])
@@ -244,12 +333,15 @@ class TestDataFrameInit:
         assert df.iloc[0, 0] == [456]
 
     def test_deepcopy(self):
-        df = lt.DataFrame([[[123]]])
+        df = lt.DataFrame([[1, 2], [3, 4]])
         t = df.copy()
-        df.iloc[0, 0][0] = 456
+        df += 10
         assert (t != df).all(axis=None)
-        assert df.iloc[0, 0] == [456]
-        assert t.iloc[0, 0] == [123]
+        assert df.iloc[0, 0] == 11
+        assert t.iloc[0, 0] == 1
+        t *= 2
+        assert df.to_list() == [[11, 12], [13, 14]]
+        assert t.to_list() == [[2, 4], [6, 8]]
 
     def test_index_getter(self):
         df = lt.DataFrame(example_list_dict)
@@ -279,53 +371,160 @@ class TestDataFrameInit:
         with pytest.raises(ValueError, match="Length mismatch"):
             df.columns = [*list(example_columns), "more_columnses"]
 
+    def test_mask_filter(self):
+        df = lt.DataFrame(example_list_dict)
+        pdf = pd.DataFrame(example_list_dict)
+        assert_dataframe_equal_pandas(df[df["a"] > 1], pdf[pdf["a"] > 1])
+        assert_dataframe_equal_pandas(df.loc[(df["a"] > 1) & (df["b"] < 6)], pdf.loc[(pdf["a"] > 1) & (pdf["b"] < 6)])
+        with pytest.raises(IndexError, match="wrong length"):
+            df[[True]]
+
+    def test_mask_frame_is_writable(self):
+        mask = lt.DataFrame(example_list_dict) > 1
+        mask |= True
+        assert mask.all(axis=None)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"index": 1},
+            {"index": [0, 2]},
+            {"columns": "a"},
+            {"columns": ["b"]},
+            {"index": [1], "columns": ["a"]},
+        ],
+    )
+    def test_drop(self, kwargs):
+        df = lt.DataFrame(example_list_dict)
+        pdf = pd.DataFrame(example_list_dict)
+        assert_dataframe_equal_pandas(df.drop(**kwargs), pdf.drop(**kwargs))
+        assert_dataframe_equal_pandas(df, pdf)
+
+    def test_drop_copy_on_write(self):
+        df = lt.DataFrame(example_list_dict)
+        dropped = df.drop(columns="a")
+        dropped += 100
+        assert df.to_dict() == pd.DataFrame(example_list_dict).to_dict()
+
+    def test_copy_index_names(self):
+        df = lt.DataFrame(example_list_dict, index=example_index)
+        copied = df.copy()
+        copied.index.name = "i"
+        copied.columns.name = "c"
+        assert df.index.name is None
+        assert df.columns.name is None
+        df.index.name = "j"
+        assert copied.index.name == "i"
+
+    @pytest.mark.parametrize("deep", [False, True])
+    def test_memory_usage(self, deep):
+        df = lt.DataFrame(example_list_dict)
+        pdf = pd.DataFrame(example_list_dict)
+        usage = df.memory_usage(deep=deep)
+        assert usage.index.to_list() == ["Index", "Columns", *pdf.memory_usage(deep=deep).index[1:]]
+        assert usage.iloc[0] == df.index.memory_usage(deep=deep)
+        columns = df.memory_usage(index=False, deep=deep)
+        assert columns.index.to_list() == pdf.memory_usage(index=False, deep=deep).index.to_list()
+        assert columns.to_list() == usage.to_list()[2:]
+
+    def test_drop_error(self):
+        df = lt.DataFrame(example_list_dict)
+        with pytest.raises(KeyError):
+            df.drop(index=10)
+        with pytest.raises(KeyError):
+            df.drop(columns="z")
+
     def test_transpose(self):
         df = lt.DataFrame(example_list_dict)
         pdf = pd.DataFrame(example_list_dict)
         assert_dataframe_equal_pandas(df.T, pdf.T)
+        assert_dataframe_equal_pandas(df.T.T, pdf.T.T)
 
+    def test_transpose_index_names(self):
+        df = lt.DataFrame(example_list_dict)
+        transposed = df.T
+        transposed.index.name = "i"
+        transposed.columns.name = "c"
+        assert df.columns.name is None
+        assert df.index.name is None
+
+    def test_transpose_duplicated_index(self):
+        df = lt.DataFrame(example_list_dict, index=[0, 1, 0])
+        pdf = pd.DataFrame(example_list_dict, index=[0, 1, 0])
+        assert df.T.shape == pdf.T.shape
+        assert df.T.values.to_list() == pdf.T.values.tolist()
+
+    def test_transpose_empty(self):
+        df = lt.DataFrame(columns=["a", "b"])
+        assert df.T.shape == (2, 0)
+        assert df.T.index.to_list() == ["a", "b"]
+
+
+class TestDataFrameMergeConcatenate:
+    def test_append_axis_0(self):
+        dfa = lt.DataFrame(example_list_dict)
+        pdfa = pd.DataFrame(example_list_dict)
+        new_values = {"b": {3: 11}, "a": {3: 10}}
+        dfb = lt.DataFrame(new_values)
+        pdfb = pd.DataFrame(new_values)
+        assert_dataframe_equal_pandas(dfa.append(dfb), pd.concat([pdfa, pdfb]))
+        assert_dataframe_equal_pandas(dfa.append(dfb, axis=0), pd.concat([pdfa, pdfb], axis=0))
 
-# class TestMergeConcatenate:
-#     def test_append_axis_0(self):
-#         dfa = lt.DataFrame(example_list_dict)
-#         pdfa = pd.DataFrame(example_list_dict)
-#         new_values = {"a": {3: 10}, "b": {3: 11}}
-#         dfb = lt.DataFrame(new_values)
-#         pdfb = pd.DataFrame(new_values)
-#         assert_dataframe_equal_pandas(dfa.append(dfb), pd.concat([pdfa, pdfb]))
-#         assert_dataframe_equal_pandas(dfa.append(dfb, axis=0), pd.concat([pdfa, pdfb], axis=0))
-
-#     def test_append_axis_0_error(self):
-#         dfa = lt.DataFrame(example_list_dict)
-#         new_values = {"a": {3: 10}, "c": {3: 11}}
-#         dfb = lt.DataFrame(new_values)
-#         with pytest.raises(ValueError, match="Cannot append data with missing columns:"):
-#             dfa.append(dfb, axis=0)
-
-#     def test_append_axis_1(self):
-#         dfa = lt.DataFrame(example_list_dict)
-#         pdfa = pd.DataFrame(example_list_dict)
-#         new_values = {"c": [10, 11, 12]}
-#         dfb = lt.DataFrame(new_values)
-#         pdfb = pd.DataFrame(new_values)
-#         assert_dataframe_equal_pandas(dfa.append(dfb, axis=1), pd.concat([pdfa, pdfb], axis=1))
-
-#     def test_append_axis_1_error(self):
-#         dfa = lt.DataFrame(example_list_dict)
-#         new_values = {"c": [10, 11]}
-#         dfb = lt.DataFrame(new_values)
-#         with pytest.raises(ValueError, match="Cannot append data with missing indexes:"):
-#             dfa.append(dfb, axis=1)
-
-#     # def test_merge(self):
-#     #     bananas = {"name": ["bob", "bob", "alice", "carlos", "einstein"], "bananas": [1, 10, 15, 20, 12], "day": [0, 1, 0, 0, 0]}
-#     #     ages = {"name": ["bob", "alice", "carlos", "dexter"], "age": [22, 23, 34, 25]}
-#     #     dfa = lt.DataFrame(bananas)
-#     #     dfb = lt.DataFrame(ages)
-#     #     pdfa = pd.DataFrame(bananas)
-#     #     pdfb = pd.DataFrame(ages)
-#     #     print(dfa.merge(dfb, on=["name"]))
-#     #     print(pdfa.merge(pdfb, on=["name"]))
+    def test_append_axis_0_error(self):
+        dfa = lt.DataFrame(example_list_dict)
+        new_values = {"a": {3: 10}, "c": {3: 11}}
+        dfb = lt.DataFrame(new_values)
+        with pytest.raises(ValueError, match="Cannot append data with missing columns:"):
+            dfa.append(dfb, axis=0)
+        with pytest.raises(ValueError, match="Cannot append with duplicate indexes:"):
+            dfa.append(dfa, axis=0)
+
+    def test_append_axis_1(self):
+        dfa = lt.DataFrame(example_list_dict)
+        pdfa = pd.DataFrame(example_list_dict)
+        new_values = {"c": {2: 12, 0: 10, 1: 11}}
+        dfb = lt.DataFrame(new_values)
+        pdfb = pd.DataFrame(new_values)
+        assert_dataframe_equal_pandas(dfa.append(dfb, axis=1), pd.concat([pdfa, pdfb], axis=1))
+
+    def test_append_axis_1_error(self):
+        dfa = lt.DataFrame(example_list_dict)
+        new_values = {"c": [10, 11]}
+        dfb = lt.DataFrame(new_values)
+        with pytest.raises(ValueError, match="Cannot append data with missing indexes:"):
+            dfa.append(dfb, axis=1)
+        with pytest.raises(ValueError, match="Cannot append with duplicate columns:"):
+            dfa.append(dfa, axis=1)
+
+    def test_builder(self):
+        builder = lt.DataFrameBuilder(["a", "b"])
+        builder.append({"a": 1, "b": 2})
+        builder.append([3, 4])
+        builder.extend([{"b": 6}, (7, 8)])
+        df = builder.build()
+        pdf = pd.DataFrame({"a": [1, 3, None, 7], "b": [2, 4, 6, 8]}, dtype=object)
+        assert_dataframe_equal_pandas(df, pdf)
+        assert isinstance(df.index, lt.RangeIndex)
+        builder.append([9, 10])
+        assert len(df) == len(builder) - 1
+
+    def test_builder_labels(self):
+        builder = lt.DataFrameBuilder(["a"])
+        builder.append([1], label="x")
+        builder.append({"a": 2}, label="y")
+        assert builder.build().to_dict() == {"a": {"x": 1, "y": 2}}
+        with pytest.raises(ValueError, match="no row must have a label"):
+            builder.append([3])
+
+    def test_builder_errors(self):
+        builder = lt.DataFrameBuilder(["a", "b"])
+        with pytest.raises(KeyError, match="Columns not found"):
+            builder.append({"c": 1})
+        with pytest.raises(ValueError, match="expected 2"):
+            builder.append([1])
+        builder.append([1, 2])
+        with pytest.raises(ValueError, match="no row must have a label"):
+            builder.append([3, 4], label="z")
 
 
 class TestDataFrameAccessors:
@@ -417,6 +616,13 @@ class TestDataFrameAccessors:
     #         pdf.loc[index, :] = value
     #         assert_dataframe_equal_pandas(df, pdf)
 
+    def test_loc_getitem_label_slice(self):
+        index = ["x", "y", "z"]
+        df = lt.DataFrame(example_array, index=index)
+        pdf = pd.DataFrame(example_array, index=index)
+        assert_dataframe_equal_pandas(df.loc["y":], pdf.loc["y":])
+        assert_dataframe_equal_pandas(df.loc["a":"y", :], pdf.loc["a":"y", :])
+
     def test_loc_getitem_list(self):
         df = lt.DataFrame(example_list_dict)
         pdf = pd.DataFrame(example_list_dict)
@@ -713,6 +919,14 @@ class TestDataFrameMapAggregate:
         with pytest.raises(ValueError, match=match):
             lt.DataFrame(example_list_dict).agg(lambda x: x, axis=-1)
 
+    @pytest.mark.parametrize("axis", [0, 1])
+    def test_apply_workers(self, axis):
+        data = {"a": list(range(1500)), "b": list(range(1500, 0, -1)), "c": [1, -1] * 750}
+        df = lt.DataFrame(data)
+        pdf = pd.DataFrame(data)
+        assert_series_equal_pandas(df.apply(sum, axis=axis, workers=2), pdf.apply(sum, axis=axis))
+        assert_series_equal_pandas(df.apply(max, axis=axis, workers=3, chunksize=100), pdf.apply(max, axis=axis))
+
     def test_apply_wrong_axis(self):
         match = "No axis named"
         with pytest.raises(ValueError, match=match):
@@ -731,12 +945,300 @@ class TestDataFrameMapAggregate:
         pdf = pd.DataFrame(example_list_dict)
         assert_dataframe_equal_pandas(df.astype(str), pdf.astype(str))
 
+    @pytest.mark.parametrize(
+        "expr",
+        [
+            "a > 1",
+            "a > 1 and b < 7",
+            "a == 0 or not b != 7",
+            "(a + b) % 2 == 1",
+            "1 < a <= 6",
+            "a in [0, 6]",
+            "a > @limit",
+            "`a` > @limit",
+        ],
+    )
+    def test_query(self, expr):
+        df = lt.DataFrame(example_list_dict)
+        pdf = pd.DataFrame(example_list_dict)
+        assert_dataframe_equal_pandas(df.query(expr, {"limit": 2}), pdf.query(expr, local_dict={"limit": 2}))
+
+    @pytest.mark.parametrize(
+        ("expr", "exc_type"),
+        [
+            ("a + 1", TypeError),
+            ("c > 1", NameError),
+            ("`c` > 1", KeyError),
+            ("a.real > 1", ValueError),
+            ("len(a) > 1", ValueError),
+            ("a = 1; b = 2", ValueError),
+        ],
+    )
+    def test_query_errors(self, expr, exc_type):
+        with pytest.raises(exc_type):
+            lt.DataFrame(example_list_dict).query(expr)
+
+    @pytest.mark.parametrize("expr", ["a * b + 1", "c = a * b + 1", "a = b - @offset", "b if a > 1 else -b"])
+    def test_eval(self, expr):
+        df = lt.DataFrame(example_list_dict)
+        pdf = pd.DataFrame(example_list_dict)
+        # pandas does not evaluate conditional expressions, so compare with the equivalent values
+        expected = (
+            pdf.eval(expr, local_dict={"offset": 2})
+            if " if " not in expr
+            else pdf["b"].where(pdf["a"] > 1, -pdf["b"]).rename(None)
+        )
+        result = df.eval(expr, {"offset": 2})
+        if isinstance(expected, pd.DataFrame):
+            assert_dataframe_equal_pandas(result, expected)
+        else:
+            assert_series_equal_pandas(result, expected)
+        assert_dataframe_equal_pandas(df, pdf)
+
+    def test_eval_scalar(self):
+        df = lt.DataFrame(example_list_dict)
+        assert df.eval("x * 2", {"x": 3}) == 6
+        assert_dataframe_equal_pandas(df.eval("c = 1"), pd.DataFrame(example_list_dict).assign(c=1))
+
+    @pytest.mark.parametrize(
+        ("expr", "variables", "expected"),
+        [
+            ("a + b + zip", {"zip": 1}, [2, 8, 14]),
+            ("a + @zip", {"zip": 1}, [1, 4, 7]),
+            ("a + __values_0 + __name_0", {"__values_0": 10, "__name_0": 100}, [110, 113, 116]),
+            ("a + b", {"__values_0": 10}, [1, 7, 13]),
+        ],
+    )
+    def test_eval_generated_names(self, expr, variables, expected):
+        # Names in the expression don't clash with the names of the compiled function
+        df = lt.DataFrame(example_list_dict)
+        assert df.eval(expr, variables).to_list() == expected
+
+    def test_eval_copy_on_write(self):
+        df = lt.DataFrame(example_list_dict)
+        evaluated = df.eval("c = a + b")
+        evaluated += 100
+        assert df.to_dict() == pd.DataFrame(example_list_dict).to_dict()
+
     def test_abs(self):
         df = lt.DataFrame(example_list_dict)
         pdf = pd.DataFrame(example_list_dict)
         assert_dataframe_equal_pandas(df.abs(), pdf.abs())
 
 
+class TestDataFrameGroupBy:
+    @pytest.mark.parametrize("func", ["sum", "mean", "min", "max", "count"])
+    def test_groupby_aggregations(self, func):
+        df = lt.DataFrame(example_groupby)
+        pdf = pd.DataFrame(example_groupby)
+        assert_dataframe_equal_pandas(
+            getattr(df.groupby("key")[["x", "y"]], func)(), getattr(pdf.groupby("key")[["x", "y"]], func)()
+        )
+
+    def test_groupby_multiple_keys(self):
+        df = lt.DataFrame(example_groupby)
+        pdf = pd.DataFrame(example_groupby)
+        assert df.groupby(["key", "sub"]).sum().to_dict() == pdf.groupby(["key", "sub"]).sum().to_dict()
+
+    def test_groupby_unsorted(self):
+        df = lt.DataFrame(example_groupby)
+        pdf = pd.DataFrame(example_groupby)
+        assert_dataframe_equal_pandas(df.groupby("key", sort=False).max(), pdf.groupby("key", sort=False).max())
+
+    def test_groupby_size(self):
+        df = lt.DataFrame(example_groupby)
+        pdf = pd.DataFrame(example_groupby)
+        assert_series_equal_pandas(df.groupby("key").size(), pdf.groupby("key").size())
+
+    def test_groupby_count_none(self):
+        df = lt.DataFrame({"key": [0, 0, 1], "x": [None, 1, None]})
+        pdf = pd.DataFrame({"key": [0, 0, 1], "x": [None, 1, None]})
+        assert_dataframe_equal_pandas(df.groupby("key").count(), pdf.groupby("key").count())
+
+    @pytest.mark.parametrize("func", ["sum", "mean", "min", "max", "count", "size"])
+    def test_groupby_none_keys(self, func):
+        data = {"key": ["b", None, "a", "b", None], "sub": [1, 1, 1, 2, None], "x": [1, 2, 3, 4, 5]}
+        df = lt.DataFrame(data)
+        pdf = pd.DataFrame(data)
+        assert getattr(df.groupby("key"), func)().to_dict() == getattr(pdf.groupby("key"), func)().to_dict()
+        assert (
+            getattr(df.groupby(["key", "sub"]), func)().to_dict()
+            == getattr(pdf.groupby(["key", "sub"]), func)().to_dict()
+        )
+        assert [key for key, _ in df.groupby("key")] == [key for key, _ in pdf.groupby("key")]
+
+    @pytest.mark.parametrize("func", ["sum", "mean", "min", "max"])
+    def test_groupby_none_values(self, func):
+        df = lt.DataFrame({"key": [0, 0, 1, 2], "x": [None, 1, 2, None]})
+        pdf = pd.DataFrame({"key": [0, 0, 1, 2], "x": [None, 1, 2, None]})
+        result = getattr(df.groupby("key"), func)()
+        expected = getattr(pdf.groupby("key"), func)()
+        assert result["x"].to_list()[:2] == expected["x"].to_list()[:2]
+        assert result["x"].iloc[2] == (0 if func == "sum" else None)
+
+    def test_groupby_agg(self):
+        df = lt.DataFrame(example_groupby)
+        pdf = pd.DataFrame(example_groupby)
+        assert_dataframe_equal_pandas(df.groupby("key").agg(sum), pdf.groupby("key").agg("sum"))
+        assert_dataframe_equal_pandas(
+            df.groupby("key").agg({"y": "min", "x": statistics.median}),
+            pdf.groupby("key").agg({"y": "min", "x": "median"}),
+        )
+
+    def test_groupby_select(self):
+        df = lt.DataFrame(example_groupby)
+        pdf = pd.DataFrame(example_groupby)
+        assert_series_equal_pandas(df.groupby("key")["x"].sum(), pdf.groupby("key")["x"].sum())
+        assert_dataframe_equal_pandas(df.groupby("key")[["y"]].mean(), pdf.groupby("key")[["y"]].mean())
+
+    def test_groupby_iter(self):
+        df = lt.DataFrame(example_groupby)
+        pdf = pd.DataFrame(example_groupby)
+        assert len(df.groupby("key")) == len(pdf.groupby("key"))
+        for (key, group), (pkey, pgroup) in zip(df.groupby("key"), pdf.groupby("key")):
+            assert key == pkey
+            assert_dataframe_equal_pandas(group, pgroup)
+
+    def test_groupby_errors(self):
+        df = lt.DataFrame(example_groupby)
+        with pytest.raises(KeyError, match="Columns not found"):
+            df.groupby("missing")
+        with pytest.raises(KeyError, match="Columns not found"):
+            df.groupby("key")["missing"]
+        with pytest.raises(ValueError, match="No group keys"):
+            df.groupby([])
+        with pytest.raises(ValueError, match="Unknown aggregation"):
+            df.groupby("key").agg("nope")
+
+
+def merged_to_dict(pdf: pd.DataFrame) -> dict:
+    # pandas fills the rows without a match with NaN, lontras with None
+    return {col: {i: None if v != v else v for i, v in values.items()} for col, values in pdf.to_dict().items()}  # noqa: PLR0124
+
+
+class TestDataFrameMerge:
+    @pytest.mark.parametrize("how", ["left", "right", "outer"])
+    @pytest.mark.parametrize("swap", [False, True])
+    def test_merge_on(self, how, swap):
+        left, right = (example_merge_right, example_merge_left) if swap else (example_merge_left, example_merge_right)
+        df = lt.merge(lt.DataFrame(left), lt.DataFrame(right), how, on="key")
+        pdf = pd.merge(pd.DataFrame(left), pd.DataFrame(right), how, on="key")
+        assert df.columns.values == pdf.columns.tolist()
+        assert df.to_dict() == merged_to_dict(pdf)
+
+    @pytest.mark.parametrize("swap", [False, True])
+    def test_merge_inner(self, swap):
+        # pandas does not keep the order of the left rows when both sides have repeated keys
+        left, right = (example_merge_right, example_merge_left) if swap else (example_merge_left, example_merge_right)
+        df = lt.DataFrame(left).merge(lt.DataFrame(right), on="key")
+        pdf = pd.DataFrame(left).merge(pd.DataFrame(right), on="key")
+        assert df.columns.values == pdf.columns.tolist()
+        assert sorted(df.to_list()) == sorted(pdf.values.tolist())
+
+    def test_merge_left_on_right_on(self):
+        left, right = lt.DataFrame(example_merge_left), lt.DataFrame(example_merge_right)
+        pleft, pright = pd.DataFrame(example_merge_left), pd.DataFrame(example_merge_right)
+        df = left.merge(right, "left", left_on="y", right_on="x", suffixes=("_l", "_r"))
+        pdf = pleft.merge(pright, "left", left_on="y", right_on="x", suffixes=("_l", "_r"))
+        assert df.to_dict() == merged_to_dict(pdf)
+
+    def test_merge_multiple_keys(self):
+        left = {"k1": [0, 0, 1, 1], "k2": ["a", "b", "a", "b"], "v": [1, 2, 3, 4]}
+        right = {"k1": [1, 0, 1], "k2": ["a", "b", "c"], "w": [5, 6, 7]}
+        df = lt.merge(lt.DataFrame(left), lt.DataFrame(right), "outer", on=["k1", "k2"])
+        pdf = pd.merge(pd.DataFrame(left), pd.DataFrame(right), "outer", on=["k1", "k2"])
+        assert df.to_dict() == merged_to_dict(pdf)
+
+    @pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+    def test_merge_none_keys(self, how):
+        left = {"key": [None, 1, None, 2], "v": [0, 1, 2, 3]}
+        right = {"key": [2, 3, None], "w": [4, 5, 6]}
+        df = lt.merge(lt.DataFrame(left), lt.DataFrame(right), how, on="key")
+        pdf = pd.merge(pd.DataFrame(left, dtype=object), pd.DataFrame(right, dtype=object), how, on="key")
+        assert df.to_dict() == merged_to_dict(pdf)
+
+    def test_merge_outer_mixed_keys(self):
+        # Keys that don't compare are not sorted
+        df = lt.merge(lt.DataFrame({"key": [1, "a"]}), lt.DataFrame({"key": ["b", 1]}), "outer", on="key")
+        assert df["key"].values == [1, "a", "b"]
+
+    def test_merge_common_columns(self):
+        df = lt.DataFrame(example_merge_left).merge(lt.DataFrame(example_merge_right), "left")
+        pdf = pd.DataFrame(example_merge_left).merge(pd.DataFrame(example_merge_right), "left")
+        assert df.to_dict() == merged_to_dict(pdf)
+
+    @pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+    def test_merge_index(self, how):
+        left = lt.DataFrame({"x": [1, 2, 3]}, index=["a", "b", "c"])
+        right = lt.DataFrame({"w": [4, 5]}, index=["c", "d"])
+        pleft = pd.DataFrame({"x": [1, 2, 3]}, index=["a", "b", "c"])
+        pright = pd.DataFrame({"w": [4, 5]}, index=["c", "d"])
+        df = lt.merge(left, right, how, left_index=True, right_index=True)
+        pdf = pd.merge(pleft, pright, how, left_index=True, right_index=True)
+        assert df.to_dict() == merged_to_dict(pdf)
+
+    def test_merge_column_with_index(self):
+        left = lt.DataFrame(example_merge_left)
+        right = lt.DataFrame({"w": [4, 5]}, index=["a", "c"])
+        pleft = pd.DataFrame(example_merge_left)
+        pright = pd.DataFrame({"w": [4, 5]}, index=["a", "c"])
+        df = lt.merge(left, right, "left", left_on="key", right_index=True)
+        pdf = pd.merge(pleft, pright, "left", left_on="key", right_index=True)
+        assert df.to_dict() == merged_to_dict(pdf)
+
+    def test_merge_errors(self):
+        left, right = lt.DataFrame(example_merge_left), lt.DataFrame(example_merge_right)
+        with pytest.raises(ValueError, match="how must be"):
+            lt.merge(left, right, "cross")  # type: ignore
+        with pytest.raises(ValueError, match="Merge requires"):
+            lt.merge(left, right, on="key", left_on="key")
+        with pytest.raises(ValueError, match="must equal"):
+            lt.merge(left, right, left_on=["key", "x"], right_on="key")
+        with pytest.raises(ValueError, match="No common columns"):
+            lt.merge(left, lt.DataFrame({"z": [0]}))
+        with pytest.raises(KeyError, match="Columns not found"):
+            lt.merge(left, right, on="y")
+
+
+class TestDataFrameSorting:
+    @pytest.mark.parametrize(
+        ("by", "ascending"),
+        [("a", True), ("b", False), (["a", "b"], True), (["a", "b"], [True, False]), (["b", "a"], [False, True])],
+    )
+    def test_sort_values(self, by, ascending):
+        df = lt.DataFrame(example_sort, index=example_sort_index)
+        pdf = pd.DataFrame(example_sort, index=example_sort_index)
+        assert_dataframe_equal_pandas(
+            df.sort_values(by, ascending=ascending), pdf.sort_values(by, ascending=ascending, kind="stable")
+        )
+
+    def test_sort_values_missing(self):
+        df = lt.DataFrame({"a": [2, None, 1]})
+        assert df.sort_values("a").index.values == [2, 0, 1]
+        assert df.sort_values("a", na_position="first").index.values == [1, 2, 0]
+
+    def test_sort_values_errors(self):
+        df = lt.DataFrame(example_sort)
+        with pytest.raises(KeyError, match="Columns not found"):
+            df.sort_values("missing")
+        with pytest.raises(ValueError, match="Length of ascending"):
+            df.sort_values(["a", "b"], ascending=[True])
+
+    @pytest.mark.parametrize("ascending", [True, False])
+    def test_sort_index(self, ascending):
+        df = lt.DataFrame(example_sort, index=example_sort_index)
+        pdf = pd.DataFrame(example_sort, index=example_sort_index)
+        assert_dataframe_equal_pandas(df.sort_index(ascending=ascending), pdf.sort_index(ascending=ascending))
+        assert_dataframe_equal_pandas(df.sort_index(ignore_index=True), pdf.sort_index(ignore_index=True))
+
+    @pytest.mark.parametrize("columns", ["a", "b", ["a", "b"]])
+    def test_nlargest_nsmallest(self, columns):
+        df = lt.DataFrame(example_sort, index=example_sort_index)
+        pdf = pd.DataFrame(example_sort, index=example_sort_index)
+        assert_dataframe_equal_pandas(df.nlargest(3, columns), pdf.nlargest(3, columns))
+        assert_dataframe_equal_pandas(df.nsmallest(3, columns), pdf.nsmallest(3, columns))
+
+
 class TestDataFrameStatistics:
     @pytest.mark.parametrize(
         "func",
@@ -767,6 +1269,40 @@ class TestDataFrameStatistics:
         assert_series_equal_pandas(getattr(df, func)(axis=0), getattr(pdf, func)(axis=0))
         assert_series_equal_pandas(getattr(df, func)(axis=1), getattr(pdf, func)(axis=1))
 
+    @pytest.mark.parametrize("func", ["mean", "std", "var", "count"])
+    def test_statistics_skip_missing(self, func):
+        data = {"a": [1.5, None, 4.0, 2.5], "b": [3, 2, None, 9]}
+        df = lt.DataFrame(data)
+        pdf = pd.DataFrame(data)
+        assert getattr(df, func)().to_list() == pytest.approx(getattr(pdf, func)().to_list())
+        assert getattr(df, func)(axis=None) == pytest.approx(getattr(pdf.stack(), func)())
+
+    def test_statistics_stable_variance(self):
+        # Large offsets make the naive sum of squares lose every significant digit
+        values = [1e9 + v for v in (4, 7, 13, 16)]
+        df = lt.DataFrame({"a": values})
+        assert df.var()["a"] == pytest.approx(statistics.variance(values))
+        assert df.std()["a"] == pytest.approx(statistics.stdev(values))
+
+    def test_statistics_exact(self):
+        # Decimals, cancelling floats and ints give the same values and types as the statistics module
+        data = {
+            "a": [Decimal("1.1"), Decimal("2.2"), Decimal("4.4"), None],
+            "b": [1e16, 1, -1e16, 3],
+            "c": [1, 2, 3, 6],
+        }
+        df = lt.DataFrame(data)
+        for func, method in (("mean", statistics.mean), ("var", statistics.variance)):
+            expected = {col: method([v for v in values if v is not None]) for col, values in data.items()}
+            assert getattr(df, func)().to_dict() == expected
+            assert [type(v) for v in getattr(df, func)().values] == [type(v) for v in expected.values()]
+
+    def test_statistics_errors(self):
+        with pytest.raises(statistics.StatisticsError, match="at least one"):
+            lt.DataFrame({"a": [None]}).mean()
+        with pytest.raises(statistics.StatisticsError, match="at least two"):
+            lt.DataFrame({"a": [1]}).var()
+
     def test_statistics_mode(self):
         # @TODO: This is a mess
         example_mode_input = [[0, 1, 1], [2, 2, 1], [3, 3, 2], [0, 0, 2], [1, 2, 1]]
@@ -781,6 +1317,15 @@ class TestDataFrameStatistics:
         assert df.quantiles(axis=0).values == [statistics.quantiles(row) for row in transposed]
         assert df.quantiles(axis=1).values == [statistics.quantiles(row.values()) for row in example_list_dict]
 
+    def test_describe(self):
+        data = {"a": [1, 5, 2, 8, None, 3.5], "b": [3, 1, 4, 1, 5, 9], "c": list("abcdef"), "d": [True] * 6}
+        described = lt.DataFrame(data).describe()
+        pdescribed = pd.DataFrame(data).describe()
+        assert described.columns.values == pdescribed.columns.to_list()
+        assert described.index.values == pdescribed.index.to_list()
+        for col in described.columns:
+            assert described[col].values == pytest.approx(pdescribed[col].to_list())
+
 
 class TestDataFrameExports:
     def test_to_list(self):
@@ -1024,6 +1569,22 @@ class TestDataFrameOperators:
         # Right hand operator
         assert_series_equal_pandas(example_op_collection @ dfa.T, example_op_collection @ pdfa.T)
 
+    @pytest.mark.parametrize("workers", [None, 1, 2, 3])
+    def test_dot_workers(self, workers):
+        dfa = lt.DataFrame(example_op_a * 3, index=list("abcdef"))
+        pdfa = pd.DataFrame(example_op_a * 3, index=list("abcdef"))
+        dfb = lt.DataFrame(example_op_b).T
+        pdfb = pd.DataFrame(example_op_b).T
+        assert_dataframe_equal_pandas(dfa.dot(dfb, workers=workers), pdfa.dot(pdfb))
+        sb = lt.Series(example_op_collection)
+        psb = pd.Series(example_op_collection)
+        assert_series_equal_pandas(dfa.dot(sb, workers=workers), pdfa.dot(psb))
+
+    def test_dot_no_columns(self):
+        df = lt.DataFrame(index=[0, 1]).dot(lt.DataFrame(columns=["a"]))
+        assert df.shape == (2, 1)
+        assert df.to_dict() == {"a": {0: 0, 1: 0}}
+
     def test_misaligned_dataframe_matmul(self):
         dfa = lt.DataFrame(example_op_a)
         dfb = lt.DataFrame(example_op_b)
@@ -1289,6 +1850,13 @@ class TestDataFrameOperators:
             )
         ).all(axis=None)
 
+    def test_op_with_index(self):
+        dfa = lt.DataFrame(example_op_a, index=example_index[:2])
+        pdfa = pd.DataFrame(example_op_a, index=example_index[:2])
+        assert_dataframe_equal_pandas(dfa + example_scalar, pdfa + example_scalar)
+        assert_dataframe_equal_pandas(dfa + dfa.iloc[::-1], pdfa + pdfa.iloc[::-1])
+        assert_dataframe_equal_pandas(dfa + dfa.loc[:, [4, 3, 2, 1, 0]], pdfa + pdfa.loc[:, [4, 3, 2, 1, 0]])
+
     def test_iop_matmul(self):
         dfa = lt.DataFrame(example_op_a)
         pdfa = pd.DataFrame(example_op_a)
@@ -1345,3 +1913,59 @@ class TestDataFrameUnaryOperators:
         df = lt.DataFrame(example_unary)
         pdf = pd.DataFrame(example_unary)
         assert_dataframe_equal_pandas(~df, ~pdf)
+
+    def test_invert_bool(self):
+        data = {"a": [True, False], "b": [False, False]}
+        assert_dataframe_equal_pandas(~lt.DataFrame(data), ~pd.DataFrame(data))
+
+
+class TestDataFrameLazy:
+    @pytest.mark.parametrize(
+        "func",
+        [
+            lambda a, b: ((a + 1) * 2 - b).abs(),
+            lambda a, b: -(a // 3) % 4 + b**2,
+            lambda a, b: 10 - a / 2 + b,
+            lambda a, b: (a > b) | (b < 0),
+            lambda a, b: ~(a == b),
+            lambda a, b: a * b + example_op_collection,
+            lambda a, b: a * b - a,
+        ],
+    )
+    def test_collect(self, func):
+        dfa, dfb = lt.DataFrame(example_op_a), lt.DataFrame(example_op_b)
+        pdfa, pdfb = pd.DataFrame(example_op_a), pd.DataFrame(example_op_b)
+        assert_dataframe_equal_pandas(func(dfa.lazy(), dfb).collect(), func(pdfa, pdfb))
+        assert_dataframe_equal_pandas(func(dfa.lazy(), dfb.lazy()).collect(), func(pdfa, pdfb))
+        assert func(dfa.lazy(), dfb).collect().to_dict() == func(dfa, dfb).to_dict()
+
+    @pytest.mark.parametrize("data", [{"a": [True, False], "b": [False, False]}, {"a": [1, -2], "b": [0, 5]}])
+    def test_collect_invert(self, data):
+        # `~` negates booleans and inverts ints bitwise, like the eager operator and pandas
+        df = lt.DataFrame(data)
+        assert (~df.lazy()).collect().to_dict() == (~df).to_dict()
+        assert_dataframe_equal_pandas((~df.lazy()).collect(), ~pd.DataFrame(data))
+
+    def test_collect_aligns(self):
+        df = lt.DataFrame(example_list_dict)
+        other = lt.DataFrame(example_list_dict)[["b", "a"]]
+        pdf = pd.DataFrame(example_list_dict)
+        assert_dataframe_equal_pandas((df.lazy() * other).collect(), pdf * pdf)
+        assert_dataframe_equal_pandas((df.lazy() - df.lazy()).collect(), pdf - pdf)
+        assert_dataframe_equal_pandas((df - df.lazy()).collect(), pdf - pdf)
+        series = {"b": 10, "a": 0}
+        assert_dataframe_equal_pandas((df.lazy() + lt.Series(series)).collect(), pdf + pd.Series(series))
+        assert_dataframe_equal_pandas((df.lazy() + series).collect(), pdf + pd.Series(series))
+
+    def test_collect_snapshot(self):
+        df = lt.DataFrame(example_list_dict)
+        lazy = df.lazy() + 1
+        df += 100
+        assert lazy.collect().to_dict() == (pd.DataFrame(example_list_dict) + 1).to_dict()
+
+    def test_collect_errors(self):
+        df = lt.DataFrame(example_list_dict)
+        with pytest.raises(ValueError, match="identically-labeled"):
+            df.lazy() + lt.DataFrame({"c": [1, 2, 3]})
+        with pytest.raises(ValueError, match="Unable to coerce"):
+            df.lazy() + [1, 2, 3]  # noqa: RUF005
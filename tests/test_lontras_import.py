@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2025-present Luiz Eduardo Amaral <luizamaral306@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import lontras as lt
+
+# `import lontras` must stay fast for short-lived processes. The budget (in ms) can be overridden
+# with the LONTRAS_IMPORT_BUDGET_MS environment variable on slow machines.
+import_budget_ms = float(os.environ.get("LONTRAS_IMPORT_BUDGET_MS", "50"))
+lazy_modules = ["ast", "concurrent.futures", "copy", "csv", "pickle", "statistics", "tokenize"]
+
+
+@pytest.fixture
+def env(tmp_path):
+    # Imports this lontras, with bytecode cached in a temporary directory so that only the first
+    # import compiles the sources
+    env = {key: value for key, value in os.environ.items() if key != "PYTHONDONTWRITEBYTECODE"}
+    env["PYTHONPATH"] = str(Path(lt.__file__).parents[1])
+    env["PYTHONPYCACHEPREFIX"] = str(tmp_path)
+    return env
+
+
+def run(code: str, env: dict[str, str], *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *options, "-c", code], env=env, capture_output=True, text=True, check=True)
+
+
+def import_time_ms(env: dict[str, str]) -> float:
+    # `-X importtime` lines look like "import time: <self us> | <cumulative us> | <module>"
+    for line in run("import lontras", env, "-X", "importtime").stderr.splitlines():
+        _, cumulative, module = line.removeprefix("import time:").split("|")
+        if module.strip() == "lontras":
+            return int(cumulative) / 1000
+    pytest.fail("lontras not found in the import times")  # no cover
+
+
+class TestImport:
+    def test_import_time_budget(self, env):
+        run("import lontras", env)
+        best = min(import_time_ms(env) for _ in range(5))
+        assert best <= import_budget_ms, f"import lontras took {best:.1f}ms, budget is {import_budget_ms:.1f}ms"
+
+    def test_lazy_modules(self, env):
+        code = f"import sys, lontras; print(*[m for m in {lazy_modules!r} if m in sys.modules])"
+        assert run(code, env).stdout.split() == []
+
+    def test_lazy_modules_load_on_use(self):
+        assert lt.Series([1, 2, 3, 3]).median() == 2.5
+        assert lt.DataFrame({"a": [1, 2]}).query("a > 1").shape == (1, 1)
+        assert lt.Array([1, 2]).copy().to_list() == [1, 2]
@@ -12,6 +12,7 @@ from .assertions import assert_exception, assert_index_equal_pandas
 
 example_index = [0, 1, 2, 3]
 example_label_index = ["a", "b", "c", "d"]
+example_array_rows = [[0, 1], [2, 3]]
 
 
 class TestIndexInit:
@@ -73,6 +74,17 @@ class TestIndexAccessors:
 
         assert_exception(pandas_error, lontras_error, TypeError)
 
+    @pytest.mark.parametrize("method", ["append", "extend", "insert", "pop", "remove", "reverse", "sort", "clear"])
+    def test_list_mutations(self, method):
+        i = lt.Index(example_label_index)
+        with pytest.raises(TypeError, match="mutable"):
+            getattr(i, method)()
+        assert i.values == example_label_index
+
+    def test_copies_share_labels(self):
+        i = lt.Index(example_label_index)
+        assert lt.Index(i, name="copy").values is i.values
+
 
 class TestIndexGetIlocs:
     def test_get_ilocs_series(self):
@@ -112,12 +124,65 @@ class TestIndexGetIlocs:
         positions = [i for i, idx in enumerate(dup_index) if idx == index]
         assert i.get_ilocs(index) == positions
 
+    def test_get_ilocs_builds_lookup_lazily(self):
+        i = lt.Index(example_label_index)
+        assert i._rev_index_cache is None  # noqa: SLF001
+        assert i.get_ilocs("b") == 1
+        assert lt.Index(i)._rev_index_cache is i._rev_index  # noqa: SLF001
+
     def test_get_ilocs_error(self):
         i = lt.Index(example_label_index)
         with pytest.raises(KeyError, match="Cannot index with:"):
             i.get_ilocs(int)
 
 
+class TestIndexMemoryUsage:
+    def test_memory_usage(self):
+        i = lt.Index(["a", "b", "c"] * 100)
+        before = i.memory_usage()
+        assert "a" in i
+        # The label lookup builds the label -> positions map
+        assert i.memory_usage() > before
+        assert i.memory_usage(deep=True) > i.memory_usage()
+
+
+class TestIndexSorted:
+    @pytest.mark.parametrize(
+        "labels", [[], [1], example_label_index, ["b", "a", "c"], [1, 1, 2], [3, 2, 1], [1, "a"], [0.5, 1, 1.5]]
+    )
+    def test_is_monotonic_increasing(self, labels):
+        assert lt.Index(labels).is_monotonic_increasing == pd.Index(labels).is_monotonic_increasing
+
+    @pytest.mark.parametrize("side", ["left", "right"])
+    @pytest.mark.parametrize("value", ["0", "a", "bb", "d", "z"])
+    def test_searchsorted(self, value, side):
+        labels = ["a", "b", "b", "c", "d"]
+        assert lt.Index(labels).searchsorted(value, side) == pd.Index(labels).searchsorted(value, side)
+
+    def test_searchsorted_range_index(self):
+        i = lt.RangeIndex(range(0, 20, 5))
+        pi = pd.RangeIndex(range(0, 20, 5))
+        assert [i.searchsorted(v) for v in (-1, 5, 6, 30)] == [pi.searchsorted(v) for v in (-1, 5, 6, 30)]
+
+    @pytest.mark.parametrize(
+        ("start", "end"), [("b", "c"), (None, "b"), ("c", None), ("bb", "cc"), ("0", "z"), ("d", "a")]
+    )
+    def test_slice_locs_sorted(self, start, end):
+        labels = ["a", "b", "b", "c", "d"]
+        assert lt.Index(labels).slice_locs(start, end) == pd.Index(labels).slice_locs(start, end)
+
+    def test_slice_locs_unsorted(self):
+        labels = ["c", "a", "d", "b"]
+        assert lt.Index(labels).slice_locs("a", "b") == pd.Index(labels).slice_locs("a", "b")
+        with pytest.raises(KeyError):
+            lt.Index(labels).slice_locs("a", "z")
+
+    def test_get_ilocs_label_slice(self):
+        i = lt.Index(example_label_index)
+        assert i.get_ilocs(slice("b", "c")) == [1, 2]
+        assert i.get_ilocs(slice("a", None, 2)) == [0, 2]
+
+
 class TestIndexComparison:
     @pytest.mark.parametrize(
         ("ia", "ib"),
@@ -139,3 +204,74 @@ class TestIndexComparison:
     )
     def test_ne(self, ia, ib):
         assert (ia != ib).all()
+
+
+class TestRangeIndex:
+    @pytest.mark.parametrize("r", [range(0), range(5), range(2, 10, 3), range(10, 0, -2)])
+    def test_init(self, r):
+        i = lt.RangeIndex(r)
+        pi = pd.RangeIndex(r)
+        assert_index_equal_pandas(i, pi)
+        assert (i.start, i.stop, i.step) == (pi.start, pi.stop, pi.step)
+
+    def test_index_of_range(self):
+        assert isinstance(lt.Index(range(3)), lt.RangeIndex)
+        assert isinstance(lt.Index(lt.RangeIndex(3)), lt.RangeIndex)
+        assert lt.Index(lt.RangeIndex(3, name="r")).name == "r"
+
+    def test_default_index(self):
+        assert isinstance(lt.Series([1, 2, 3]).index, lt.RangeIndex)
+        assert isinstance(lt.DataFrame(example_array_rows).index, lt.RangeIndex)
+
+    @pytest.mark.parametrize("deep", [True, False])
+    def test_copy(self, deep):
+        i = lt.RangeIndex(range(2, 10, 3), name="r")
+        copied = i.copy(deep=deep)
+        assert isinstance(copied, lt.RangeIndex)
+        assert copied is not i
+        assert (copied.start, copied.stop, copied.step, copied.name) == (2, 10, 3, "r")
+        assert copied.values == i.values
+
+    def test__repr__(self):
+        assert str(lt.RangeIndex(range(1, 7, 2))) == "RangeIndex(start=1, stop=7, step=2)"
+        assert str(lt.RangeIndex(3, name="r")) == 'RangeIndex(start=0, stop=3, step=1, name="r")'
+
+    @pytest.mark.parametrize("key", [0, 4, 8, 4.0, -2, 3, 20, "a"])
+    def test_get_ilocs(self, key):
+        i = lt.RangeIndex(range(0, 10, 2))
+        pi = pd.RangeIndex(range(0, 10, 2))
+        assert (key in i) == (key in pi)
+        if key in pi:
+            assert i.get_ilocs(key) == pi.get_loc(key)
+        else:
+            with pytest.raises(KeyError):
+                i.get_ilocs(key)
+
+    def test_get_ilocs_list(self):
+        i = lt.RangeIndex(range(10, 0, -1))
+        assert i.get_ilocs([1, 10, 5]) == [9, 0, 5]
+
+    def test_slice(self):
+        i = lt.RangeIndex(10)
+        pi = pd.RangeIndex(10)
+        assert isinstance(i[2:8:2], lt.RangeIndex)
+        assert_index_equal_pandas(i[2:8:2], pi[2:8:2])
+        assert i[-1] == pi[-1]
+        assert i[[0, 3]].to_list() == pi[[0, 3]].tolist()
+
+    def test_memory_usage(self):
+        i = lt.RangeIndex(100_000)
+        assert i.memory_usage(deep=True) < 1000
+        assert i.memory_usage() < lt.Index(list(i)).memory_usage()
+
+    def test_lazy_materialization(self):
+        s = lt.Series(list(range(5)))
+        assert (s.loc[3], s.iloc[1:3].index.values, len(s.index)) == (3, [1, 2], 5)
+        assert s.index._materialized is None  # noqa: SLF001
+
+    def test_immutable(self):
+        i = lt.RangeIndex(3)
+        with pytest.raises(TypeError, match="mutable"):
+            i.append(3)
+        with pytest.raises(TypeError, match="mutable"):
+            i.sort()
@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: 2025-present Luiz Eduardo Amaral <luizamaral306@gmail.com>
+#
+# SPDX-License-Identifier: MIT
+import io
+
+import pandas as pd
+import pytest
+
+import lontras as lt
+
+from .assertions import assert_dataframe_equal_pandas
+
+example_csv = """a,b,c,d
+1,1.5,x,True
+2,2.5,y,False
+3,3.5,z,True
+4,4.5,w,False
+5,5.5,v,True
+"""
+example_csv_no_header = "1,x\n2,y\n3,z\n"
+
+
+class TestReadCsv:
+    def test_read_csv(self):
+        df = lt.read_csv(io.StringIO(example_csv))
+        pdf = pd.read_csv(io.StringIO(example_csv))
+        assert_dataframe_equal_pandas(df, pdf)
+
+    def test_read_csv_path(self, tmp_path):
+        path = tmp_path / "example.csv"
+        path.write_text(example_csv)
+        assert_dataframe_equal_pandas(lt.read_csv(path), pd.read_csv(path))
+        assert_dataframe_equal_pandas(lt.read_csv(str(path)), pd.read_csv(str(path)))
+
+    def test_read_csv_types(self):
+        df = lt.read_csv(io.StringIO(example_csv))
+        assert [type(df[col].iloc[0]) for col in df.columns] == [int, float, str, bool]
+
+    def test_read_csv_empty_fields(self):
+        df = lt.read_csv(io.StringIO("a,b\n1,\n,y\n"))
+        assert df.to_dict(orient="list") == {"a": [1, None], "b": [None, "y"]}
+
+    def test_read_csv_strict_numbers(self):
+        text = "a,b,c,d\n1_0,1e3,inf,-2\n20,.5,1.0,+3\n"
+        df = lt.read_csv(io.StringIO(text))
+        pdf = pd.read_csv(io.StringIO(text))
+        assert df.to_dict(orient="list") == {"a": ["1_0", "20"], "b": [1000.0, 0.5], "c": ["inf", "1.0"], "d": [-2, 3]}
+        assert df.to_dict(orient="list")["b"] == pdf["b"].to_list()
+        assert df.to_dict(orient="list")["d"] == pdf["d"].to_list()
+
+    def test_read_csv_missing_values(self):
+        text = "a,b\n1,nan\nNA,y\nnull,N/A\n"
+        df = lt.read_csv(io.StringIO(text))
+        pdf = pd.read_csv(io.StringIO(text))
+        assert df.to_dict(orient="list") == {"a": [1, None, None], "b": [None, "y", None]}
+        assert (df.map(lambda v: v is None).to_dict() == pdf.isna().to_dict()) is True
+
+    def test_read_csv_no_header(self):
+        df = lt.read_csv(io.StringIO(example_csv_no_header), header=None)
+        pdf = pd.read_csv(io.StringIO(example_csv_no_header), header=None)
+        assert_dataframe_equal_pandas(df, pdf)
+
+    def test_read_csv_names(self):
+        names = ["n", "s"]
+        df = lt.read_csv(io.StringIO(example_csv_no_header), header=None, names=names)
+        pdf = pd.read_csv(io.StringIO(example_csv_no_header), header=None, names=names)
+        assert_dataframe_equal_pandas(df, pdf)
+
+    def test_read_csv_sep(self):
+        text = example_csv.replace(",", ";")
+        assert_dataframe_equal_pandas(lt.read_csv(io.StringIO(text), sep=";"), pd.read_csv(io.StringIO(text), sep=";"))
+
+    def test_read_csv_index_col(self):
+        df = lt.read_csv(io.StringIO(example_csv), index_col="c")
+        pdf = pd.read_csv(io.StringIO(example_csv), index_col="c")
+        assert_dataframe_equal_pandas(df, pdf)
+
+    def test_read_csv_index_col_error(self):
+        with pytest.raises(KeyError, match="Index column not found"):
+            lt.read_csv(io.StringIO(example_csv), index_col="nope")
+
+    def test_read_csv_converters(self):
+        df = lt.read_csv(io.StringIO(example_csv), converters={"a": str})
+        pdf = pd.read_csv(io.StringIO(example_csv), converters={"a": str})
+        assert_dataframe_equal_pandas(df, pdf)
+
+    def test_read_csv_empty(self):
+        df = lt.read_csv(io.StringIO("a,b\n"))
+        pdf = pd.read_csv(io.StringIO("a,b\n"))
+        assert df.shape == pdf.shape
+        assert df.columns.values == pdf.columns.to_list()
+
+    @pytest.mark.parametrize("chunksize", [1, 2, 5, 10])
+    def test_read_csv_chunksize(self, chunksize):
+        chunks = list(lt.read_csv(io.StringIO(example_csv), chunksize=chunksize))
+        pchunks = list(pd.read_csv(io.StringIO(example_csv), chunksize=chunksize))
+        assert len(chunks) == len(pchunks)
+        for df, pdf in zip(chunks, pchunks):
+            assert_dataframe_equal_pandas(df, pdf)
+
+    def test_read_csv_chunksize_types(self):
+        # Types are inferred per chunk, as in pandas
+        text = "a\n1\n2\nx\n"
+        chunks = list(lt.read_csv(io.StringIO(text), chunksize=2))
+        pchunks = list(pd.read_csv(io.StringIO(text), chunksize=2))
+        assert [df["a"].to_list() for df in chunks] == [pdf["a"].to_list() for pdf in pchunks] == [[1, 2], ["x"]]
+        chunks = list(lt.read_csv(io.StringIO(text), chunksize=2, converters={"a": str}))
+        assert [df["a"].to_list() for df in chunks] == [["1", "2"], ["x"]]
+
+    def test_read_csv_chunksize_error(self):
+        with pytest.raises(ValueError, match="chunksize must be a positive integer"):
+            lt.read_csv(io.StringIO(example_csv), chunksize=0)
+
+    def test_read_csv_misaligned_row_error(self):
+        with pytest.raises(ValueError, match="Expected 2 fields in data row 1, saw 3"):
+            lt.read_csv(io.StringIO("a,b\n1,2\n3,4,5\n"))
@@ -2,7 +2,10 @@
 #
 # SPDX-License-Identifier: MIT
 
+import random
 import statistics
+from decimal import Decimal
+from fractions import Fraction
 from types import MappingProxyType
 
 import numpy as np
@@ -115,14 +118,56 @@ name: snake
         assert_series_equal_pandas(s, ps)
 
     def test_deepcopy(self):
-        s = lt.Series([[123]])
-        p = s.copy(deep=False)
+        s = lt.Series([[123], [456]])
         q = s.copy(deep=True)
-        s.iloc[0][0] = 456
+        s.iloc[0] = [789]
+        assert q.iloc[0] == [123]
         # Pandas does not copy objects recursively
         # https://pandas.pydata.org/docs/reference/api/pandas.Series.copy.html
-        assert (s == p).all()
-        assert (s != q).all()
+        s.iloc[1].append(0)
+        assert q.iloc[1] == [456, 0]
+
+    @pytest.mark.parametrize(
+        "derive",
+        [
+            lambda s: s.copy(),
+            lambda s: s.rename("other"),
+            lambda s: s.reindex(["x", "y", "z"]),
+            lambda s: lt.Series(s),
+        ],
+    )
+    def test_copy_on_write(self, derive):
+        s = lt.Series([1, 2, 3])
+        t = derive(s)
+        t.iloc[0] = 10
+        t += 1
+        assert s.values == [1, 2, 3]
+        s.iloc[1] = 20
+        assert t.values == [11, 3, 4]
+
+    @pytest.mark.parametrize("index", [None, ["x", "y", "z"]])
+    def test_copy_index_name(self, index):
+        s = lt.Series([1, 2, 3], index=index)
+        t = s.copy()
+        s.index.name = "n"
+        assert t.index.name is None
+        t.index.name = "m"
+        assert s.index.name == "n"
+
+    def test_values_copy_on_write(self):
+        s = lt.Series([1, 2, 3])
+        t = s.copy()
+        s.values[0] = 50
+        assert t.to_list() == [1, 2, 3]
+        t.values[1] = 60
+        assert s.to_list() == [50, 2, 3]
+        assert t.to_list() == [1, 60, 3]
+
+    def test_memory_usage(self):
+        s = lt.Series([str(v) for v in range(100)])
+        assert s.memory_usage(index=False) == s.values.memory_usage()
+        assert s.memory_usage() == s.values.memory_usage() + s.index.memory_usage()
+        assert s.memory_usage(deep=True) > s.memory_usage()
 
     def test_index_getter(self):
         s = lt.Series(example_dict)
@@ -163,6 +208,26 @@ name: snake
             ps = ps.drop(k)
             assert_series_equal_pandas(s, ps)
 
+    def test_drop_collection(self):
+        s = lt.Series(example_dict)
+        ps = pd.Series(example_dict)
+        keys = list(example_dict.keys())[1::2]
+        assert_series_equal_pandas(s.drop(keys), ps.drop(keys))
+        assert_series_equal_pandas(s, ps)
+
+    def test_drop_typed(self):
+        s = lt.Series(lt.Array([1, 2, 3, 4], dtype="q"))
+        t = s.drop([0, 2])
+        assert t.values.dtype == "q"
+        assert t.to_dict() == {1: 2, 3: 4}
+
+    def test_delitem_copy_on_write(self):
+        s = lt.Series([1, 2, 3])
+        t = s.copy()
+        del t[1]
+        assert s.to_dict() == {0: 1, 1: 2, 2: 3}
+        assert t.to_dict() == {0: 1, 2: 3}
+
     def test_shape(self):
         s = lt.Series(example_dict)
         assert s.shape == (len(example_dict),)
@@ -189,6 +254,50 @@ class TestSeriesMergeConcatenate:
         with pytest.raises(ValueError, match="Cannot append with: other="):
             sa.append(int)
 
+    def test_mask_filter(self):
+        s = lt.Series(example_dict)
+        ps = pd.Series(example_dict)
+        assert_series_equal_pandas(s[s > 3], ps[ps > 3])
+        assert_series_equal_pandas(s[(s > 3) & (s < 7) | (s == 1)], ps[(ps > 3) & (ps < 7) | (ps == 1)])
+        assert_series_equal_pandas(s.loc[~(s > 3)], ps.loc[~(ps > 3)])
+        with pytest.raises(IndexError, match="wrong length"):
+            s[[True, False]]
+
+    def test_mask_series_is_writable(self):
+        mask = lt.Series([1, 2, 3]) > 1
+        mask.iloc[0] = True
+        mask += 1
+        assert mask.values == [2, 2, 2]
+
+    def test_append_loop(self):
+        s = lt.Series([], name="x")
+        for i, label in enumerate("abcde"):
+            s[label] = i
+        index = s.index
+        s["f"] = 5
+        assert s.to_dict() == {"a": 0, "b": 1, "c": 2, "d": 3, "e": 4, "f": 5}
+        assert s.loc["d"] == 3
+        # An index that was handed out is not extended in place
+        assert index.values == ["a", "b", "c", "d", "e"]
+        assert s.index.is_monotonic_increasing
+        assert s.loc["b":"d"].values == [1, 2, 3]
+
+    def test_append_keeps_range_index(self):
+        s = lt.Series([0, 1])
+        s.loc[2] = 2
+        s.loc[3] = 3
+        assert isinstance(s.index, lt.RangeIndex)
+        s.loc["a"] = 4
+        assert s.to_dict() == {0: 0, 1: 1, 2: 2, 3: 3, "a": 4}
+
+    def test_append_typed(self):
+        s = lt.Series(lt.Array([1, 2], dtype="q"))
+        s.loc[2] = 3
+        assert s.values.dtype == "q"
+        s.loc[3] = 1.5
+        assert s.values.dtype is None
+        assert s.values == [1, 2, 3, 1.5]
+
 
 class TestSeriesAccessors:
     def test_getitem_scalar(self):
@@ -348,6 +457,22 @@ class TestSeriesLoc:
         ps.loc[key] = value
         assert_series_equal_pandas(s, ps)
 
+    @pytest.mark.parametrize(
+        "key",
+        [slice("2024-01", "2024-03"), slice("2024-02-15", None), slice(None, "2024-02"), slice("2024", "2025", 2)],
+    )
+    def test_loc_getitem_label_slice(self, key):
+        index = ["2024-01", "2024-02", "2024-02-10", "2024-03", "2024-04"]
+        s = lt.Series(range(len(index)), index=index)
+        ps = pd.Series(range(len(index)), index=index)
+        assert_series_equal_pandas(s.loc[key], ps.loc[key])
+
+    def test_loc_getitem_label_slice_unsorted(self):
+        s = lt.Series(example_values, index=["c", "a", "b"])
+        ps = pd.Series(example_values, index=["c", "a", "b"])
+        assert_series_equal_pandas(s.loc["a":"b"], ps.loc["a":"b"])
+        assert_exception(lambda: ps.loc["a":"z"], lambda: s.loc["a":"z"], KeyError)
+
     def test_loc_getitem_collection(self):
         s = lt.Series(example_dict)
         ps = pd.Series(example_dict)
@@ -555,6 +680,11 @@ class TestSeriesMapReduce:
         ps = pd.Series(example_dict)
         assert_series_equal_pandas(s.map(lambda x: x**2), ps.map(lambda x: x**2))
 
+    def test_map_workers(self):
+        s = lt.Series(list(range(-1500, 1500)), name="s")
+        ps = pd.Series(list(range(-1500, 1500)), name="s")
+        assert_series_equal_pandas(s.map(abs, workers=2), ps.map(abs))
+
     def test_reduce(self):
         s = lt.Series(example_dict)
         assert s.reduce(lambda acc, cur: acc + cur[0], "") == "".join(example_index)
@@ -618,6 +748,79 @@ class TestSeriesMapReduce:
             getattr(s, func)()
 
 
+class TestSeriesGroupBy:
+    @pytest.mark.parametrize("func", ["sum", "mean", "min", "max", "count", "size"])
+    def test_groupby_aggregations(self, func):
+        keys = ["x", "y", "x", "y", "z", "x", "y", "x"]
+        s = lt.Series(example_stats, name=example_name)
+        ps = pd.Series(example_stats, name=example_name)
+        assert_series_equal_pandas(getattr(s.groupby(keys), func)(), getattr(ps.groupby(keys), func)())
+
+    def test_groupby_series(self):
+        s = lt.Series(example_dict)
+        ps = pd.Series(example_dict)
+        by = lt.Series({"c": 0, "a": 1, "b": 0}, name="by")
+        pby = pd.Series({"c": 0, "a": 1, "b": 0}, name="by")
+        assert_series_equal_pandas(s.groupby(by).sum(), ps.groupby(pby).sum())
+
+    def test_groupby_callable(self):
+        s = lt.Series(example_dict)
+        ps = pd.Series(example_dict)
+        assert_series_equal_pandas(
+            s.groupby(lambda label: label == "b").agg(max), ps.groupby(lambda label: label == "b").agg("max")
+        )
+
+    def test_groupby_iter(self):
+        s = lt.Series(example_stats)
+        ps = pd.Series(example_stats)
+        keys = [v % 3 for v in example_stats]
+        for (key, group), (pkey, pgroup) in zip(s.groupby(keys), ps.groupby(keys)):
+            assert key == pkey
+            assert_series_equal_pandas(group, pgroup)
+
+    def test_groupby_length_error(self):
+        with pytest.raises(ValueError, match="does not match length"):
+            lt.Series(example_dict).groupby([0, 1])
+
+
+class TestSeriesSorting:
+    example_sort = (5, 3, None, 8, 1, 3)
+    example_sort_index = ("d", "f", "b", "a", "e", "c")
+
+    @pytest.mark.parametrize("ascending", [True, False])
+    @pytest.mark.parametrize("na_position", ["first", "last"])
+    def test_sort_values(self, ascending, na_position):
+        s = lt.Series(self.example_sort, index=self.example_sort_index)
+        ps = pd.Series(self.example_sort, index=self.example_sort_index)
+        # pandas uses NaN for missing values, lontras uses None
+        assert_series_equal_pandas(
+            s.sort_values(ascending=ascending, na_position=na_position).map(lambda v: -1 if v is None else v),
+            ps.sort_values(ascending=ascending, na_position=na_position, kind="stable").fillna(-1).astype(int),
+        )
+
+    def test_sort_values_key(self):
+        s = lt.Series(["b", "C", "a"])
+        ps = pd.Series(["b", "C", "a"])
+        assert_series_equal_pandas(s.sort_values(key=str.lower), ps.sort_values(key=lambda x: x.str.lower()))
+
+    @pytest.mark.parametrize("ascending", [True, False])
+    def test_sort_index(self, ascending):
+        s = lt.Series(range(6), index=self.example_sort_index, name=example_name)
+        ps = pd.Series(range(6), index=self.example_sort_index, name=example_name)
+        assert_series_equal_pandas(s.sort_index(ascending=ascending), ps.sort_index(ascending=ascending))
+        assert_series_equal_pandas(
+            s.sort_index(ascending=ascending, ignore_index=True),
+            ps.sort_index(ascending=ascending, ignore_index=True),
+        )
+
+    @pytest.mark.parametrize("n", [0, 1, 3, 5])
+    def test_nlargest_nsmallest(self, n):
+        s = lt.Series(self.example_sort, index=self.example_sort_index)
+        ps = pd.Series(self.example_sort, index=self.example_sort_index)
+        assert_series_equal_pandas(s.nlargest(n), ps.nlargest(n).astype(int))
+        assert_series_equal_pandas(s.nsmallest(n), ps.nsmallest(n).astype(int))
+
+
 class TestSeriesStatistics:
     @pytest.mark.parametrize(
         "func",
@@ -633,6 +836,26 @@ class TestSeriesStatistics:
         ps = pd.Series(example_stats)
         assert getattr(s, func)() == getattr(ps, func)()
 
+    @pytest.mark.parametrize(
+        "values",
+        [
+            [Decimal("1.1"), Decimal("2.2"), Decimal("4.4")],
+            [Fraction(1, 3), Fraction(1, 2), Fraction(2, 3)],
+            [1e16, 1, -1e16, 3],
+            [1, 2, 3, 6],
+            [4, 8, 12],
+            [True, False, True],
+        ],
+    )
+    @pytest.mark.parametrize("func", ["mean", "var", "std"])
+    def test_statistics_exact(self, values, func):
+        # Same values and types as the statistics module
+        method = {"mean": statistics.mean, "var": statistics.variance, "std": statistics.stdev}[func]
+        result = getattr(lt.Series(values), func)()
+        expected = method(values)
+        assert type(result) is type(expected)
+        assert result == pytest.approx(expected, rel=1e-15)
+
     def test_statistics_mode(self):
         s = lt.Series(example_stats)
         ps = pd.Series(example_stats)
@@ -642,6 +865,26 @@ class TestSeriesStatistics:
         s = lt.Series(example_stats)
         assert s.quantiles() == statistics.quantiles(example_stats)
 
+    def test_describe(self):
+        s = lt.Series([*example_stats, None], name="x")
+        ps = pd.Series([*example_stats, None], name="x").describe()
+        described = s.describe()
+        assert described.name == ps.name
+        assert described.index.values == ps.index.to_list()
+        assert described.values == pytest.approx(ps.to_list())
+
+    def test_describe_large(self):
+        # Quartiles are exact whatever the number of values
+        values = [v / 7 for v in random.sample(range(150_000), 150_000)]
+        described = lt.Series(values).describe()
+        pdescribed = pd.Series(values).describe()
+        for label in ("25%", "50%", "75%"):
+            assert described[label] == pytest.approx(pdescribed[label], rel=1e-12)
+
+    def test_describe_errors(self):
+        with pytest.raises(TypeError):
+            lt.Series(["a", "b"]).describe()
+
 
 class TestSeriesExports:
     def test_to_collection(self):
@@ -852,6 +1095,20 @@ class TestSeriesOperators:
         df += 10
         assert len(df) == 0
 
+    def test_op_shuffled_indexes(self):
+        sa = lt.Series(example_dict_a)
+        sb = lt.Series(dict(reversed(example_dict_b.items())))
+        psa = pd.Series(example_dict_a)
+        psb = pd.Series(dict(reversed(example_dict_b.items())))
+        assert_series_equal_pandas(sa + sb, psa + psb)
+        assert_series_equal_pandas(sa * sb, psa * psb)
+
+    def test_op_shares_index(self):
+        sa = lt.Series(example_dict_a)
+        sb = lt.Series(example_dict_b)
+        assert (sa + sb).index is sa.index
+        assert (sa * example_scalar).index is sa.index
+
     def test_op_misaligned_indexes(self):
         sa = lt.Series(example_dict_a)
         sb = lt.Series(example_dict_b)